@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# benchmark: interpretador x programa compilado para Python (com cache)
+
+import sys
+import os
+import time
+import random
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import compilador
+from src.compilador import executar_arquivo_compilado, ler_programa
+from src.interpretador import executar_arvores
+
+def gerar_programa(n_linhas, semente=35):
+    """gera programa aleatório com MEM, RES, IF e WHILE"""
+    gerador = random.Random(semente)
+    modelos = [
+        "({n} A)", "(A {n} *)", "((1 RES) {n} +)", "((A 1 +) A)",
+        "(A {n} > (A 2 /) (A 3 *) IF)", "(0 I)", "(I 20 < ((I 1 +) I) WHILE)"
+    ]
+    linhas = ["(1 A)"] + [gerador.choice(modelos).format(n=gerador.randint(1, 9)) for _ in range(n_linhas - 1)]
+    return "\n".join(linhas) + "\n"
+
+def cronometrar(funcao):
+    """retorna (segundos, resultado) de uma chamada"""
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return time.perf_counter() - inicio, resultado
+
+def main():
+    """função principal"""
+    n_linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    texto = gerar_programa(n_linhas)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'programa.txt')
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+
+        tempo_interpretado, (esperado, _, _) = cronometrar(lambda: executar_arvores(ler_programa(texto)))
+        tempo_frio, (resultados, _, _) = cronometrar(lambda: executar_arquivo_compilado(caminho))
+        assert resultados == esperado
+
+        compilador._programas_carregados.clear()
+        tempo_cache, _ = cronometrar(lambda: executar_arquivo_compilado(caminho))
+        tempo_quente, _ = cronometrar(lambda: executar_arquivo_compilado(caminho))
+
+    print(f"Programa com {n_linhas} linhas")
+    print(f"  interpretado (léxico + parser + execução): {tempo_interpretado * 1000:8.1f} ms")
+    print(f"  compilado, primeira vez:                  {tempo_frio * 1000:8.1f} ms")
+    print(f"  compilado, cache em disco:                {tempo_cache * 1000:8.1f} ms")
+    print(f"  compilado, já carregado no processo:      {tempo_quente * 1000:8.1f} ms")
+
+if __name__ == '__main__':
+    main()
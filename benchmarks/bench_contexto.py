@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# microbenchmark: contexto em dict x ContextoExecucao em programas no estilo
+# de test1.txt repetidos. o ganho do ContextoExecucao é modesto (da ordem de
+# 1,1x a 1,3x): vem da avaliação sem recursão, não de empilhar/desempilhar,
+# que o laço de avaliação não usa (ele indexa a pilha diretamente)
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao
+from src.executor import (avaliar_rpn, avaliar_contexto, validar_expressao, formatar_resultado,
+                          executar_expressao, executar_expressoes)
+from src.contexto import ContextoExecucao
+from src.memoria import MemoriaSlots, resolver_slots
+from utils.util import ler_arquivo
+
+ARQUIVO_BASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test1.txt')
+
+def carregar_programa(repeticoes):
+    """tokens de test1.txt repetidos (cada cópia reaproveita as anteriores via RES)"""
+    linhas = [linha for linha in ler_arquivo(ARQUIVO_BASE) if not linha.startswith('#')]
+    return [parse_expressao(linha) for linha in linhas] * repeticoes
+
+def executar_com_dict(programa, memoria):
+    """laço de executar_programa com o contexto antigo em dict"""
+    contexto = {'historico_resultados': [], 'memoria': memoria, 'pilha': [], 'resultado_atual': None}
+    for tokens in programa:
+        validar_expressao(tokens)
+        resultado = formatar_resultado(avaliar_rpn(tokens, contexto))
+        contexto['resultado_atual'] = resultado
+        contexto['historico_resultados'].append(resultado)
+    return contexto['historico_resultados']
+
+def executar_com_contexto(programa, memoria):
+    """mesmo laço com ContextoExecucao"""
+    contexto = ContextoExecucao([], memoria)
+    for tokens in programa:
+        validar_expressao(tokens)
+        contexto.registrar_resultado(formatar_resultado(avaliar_contexto(tokens, contexto)))
+    return contexto.historico_resultados
+
+def medir(funcoes, programa, repeticoes=7):
+    """
+    melhor tempo de cada função em várias execuções, com memória nova a cada
+    uma; as funções são alternadas para que ruído da máquina afete todas
+
+    Returns:
+        list: (melhor_tempo, resultado) por função
+    """
+    medidas = [(float('inf'), None)] * len(funcoes)
+    for _ in range(repeticoes):
+        for indice, funcao in enumerate(funcoes):
+            memoria = MemoriaSlots()
+            resolver_slots(programa, memoria)
+            inicio = time.perf_counter()
+            resultado = funcao(programa, memoria)
+            duracao = time.perf_counter() - inicio
+            medidas[indice] = (min(medidas[indice][0], duracao), resultado)
+    return medidas
+
+def main():
+    """função principal"""
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    programa = carregar_programa(repeticoes)
+
+    (tempo_dict, esperado), (tempo_contexto, obtido) = medir([executar_com_dict, executar_com_contexto], programa)
+    assert obtido == esperado
+
+    print(f"test1.txt x {repeticoes} ({len(programa)} linhas)")
+    print(f"  contexto dict:     {len(programa) / tempo_dict:12,.0f} linhas/s")
+    print(f"  ContextoExecucao:  {len(programa) / tempo_contexto:12,.0f} linhas/s "
+          f"({tempo_dict / tempo_contexto:.2f}x)")
+
+    # API de uma expressão por chamada x lote; executar_expressao copia o
+    # histórico a cada chamada, então a comparação usa um trecho curto
+    trecho = carregar_programa(20)
+    inicio = time.perf_counter()
+    historico, memoria = [], {}
+    for tokens in trecho:
+        _, historico, memoria = executar_expressao(tokens, historico, memoria)
+    tempo_por_chamada = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    resultados, erros = executar_expressoes(trecho, ContextoExecucao())
+    tempo_lote = time.perf_counter() - inicio
+    assert list(resultados) == historico and not erros
+    print(f"  executar_expressao por linha: {len(trecho) / tempo_por_chamada:12,.0f} linhas/s")
+    print(f"  executar_expressoes em lote:  {len(trecho) / tempo_lote:12,.0f} linhas/s "
+          f"({tempo_por_chamada / tempo_lote:.2f}x)")
+
+    contexto = ContextoExecucao()
+    inicio = time.perf_counter()
+    for _ in range(1_000_000):
+        contexto.empilhar(1.0)
+        contexto.desempilhar()
+    print(f"  empilhar + desempilhar: {(time.perf_counter() - inicio) * 1000:.0f} ns por par")
+
+if __name__ == '__main__':
+    main()
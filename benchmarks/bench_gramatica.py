@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# microbenchmark: obter os artefatos LL(1) da gramática RPN
+#   cálculo:  FIRST, FOLLOW e tabela a partir das produções
+#   disco:    primeira chamada do processo, com o cache em disco válido
+#   processo: chamadas seguintes (memo do módulo)
+# mede também o processo inteiro de uma invocação curta do parser (importar e
+# construir a gramática), com e sem o arquivo de cache, e FIRST/FOLLOW em
+# gramáticas geradas com centenas de símbolos:
+#   definição: repete sobre todas as produções com sets até não mudar
+#   bits:      lista de trabalho com conjuntos em int (calcular_first_bits e
+#              calcular_follow_bits)
+# e a tabela LL(1) em dicts x compilada (compilar_tabela_ll1): consulta de
+# todas as entradas e ida e volta por pickle (o custo de mandar a tabela a
+# um processo trabalhador)
+
+import sys
+import os
+import time
+import pickle
+import random
+import tempfile
+import subprocess
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import grammar
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def medir(funcao, repeticoes):
+    """melhor tempo de repeticoes chamadas de funcao()"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def limpar_memo():
+    """esquece as gramáticas construídas neste processo"""
+    grammar._gramaticas_carregadas.clear()
+    grammar._gramatica_rpn.clear()
+
+def invocacao(diretorio_cache):
+    """tempo de um processo que só importa o parser e constrói a gramática"""
+    codigo = ("import sys; sys.path.insert(0, sys.argv[1]); "
+              "from src.grammar import construir_gramatica; construir_gramatica(sys.argv[2] or None)")
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, '-c', codigo, RAIZ, diretorio_cache], check=True,
+                   stdout=subprocess.DEVNULL)
+    return time.perf_counter() - inicio
+
+def gramatica_gerada(gerador, n_nao_terminais, n_terminais):
+    """gramática com recursão (inclusive à esquerda e mútua) e produções vazias"""
+    nao_terminais = [f"N{i}" for i in range(n_nao_terminais)]
+    simbolos = nao_terminais + [f"t{i}" for i in range(n_terminais)]
+    return {nt: [[gerador.choice(simbolos) for _ in range(gerador.randint(0, 3))]
+                 for _ in range(gerador.randint(1, 3))] for nt in nao_terminais}
+
+def first_follow_definicao(gramatica, inicial):
+    """FIRST e FOLLOW pela definição, com sets"""
+    first = {nt: set() for nt in gramatica}
+    follow = {nt: set() for nt in gramatica}
+    follow[inicial].add('$')
+
+    def first_sequencia(sequencia):
+        resultado = set()
+        for simbolo in sequencia:
+            if simbolo not in gramatica:
+                return resultado | {simbolo}
+            resultado |= first[simbolo] - {'ε'}
+            if 'ε' not in first[simbolo]:
+                return resultado
+        return resultado | {'ε'}
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for nt, producoes in gramatica.items():
+            for producao in producoes:
+                novo = first[nt] | first_sequencia(producao)
+                if novo != first[nt]:
+                    first[nt], mudou = novo, True
+                for i, simbolo in enumerate(producao):
+                    if simbolo in gramatica:
+                        resto = first_sequencia(producao[i + 1:])
+                        novo = follow[simbolo] | (resto - {'ε'}) | (follow[nt] if 'ε' in resto else set())
+                        if novo != follow[simbolo]:
+                            follow[simbolo], mudou = novo, True
+    return first, follow
+
+def first_follow_bits(gramatica):
+    """FIRST e FOLLOW pela lista de trabalho, ainda em bits"""
+    _, bits = grammar.numerar_terminais(gramatica)
+    first_bits = grammar.calcular_first_bits(gramatica, bits)
+    return first_bits, grammar.calcular_follow_bits(gramatica, first_bits, bits, 'N0')
+
+def tabela_gerada(gramatica):
+    """tabela LL(1) em dicts e compilada de uma gramática gerada"""
+    first = grammar.calcular_all_first(gramatica)
+    follow = grammar.calcular_all_follow(gramatica, first)
+    tabela = grammar.construir_tabela_ll1(gramatica, first, follow)
+    return tabela, grammar.compilar_tabela_ll1(gramatica, tabela)
+
+def medir_tabelas(nome, tabela, compilada):
+    """consulta de todas as entradas e pickle, dicts x compilada"""
+    pares = [(nt, terminal) for nt in compilada['nao_terminais'] for terminal in compilada['terminais']]
+    pares_ids = [(indice_nt, terminal) for indice_nt in range(len(compilada['nao_terminais']))
+                 for terminal in range(compilada['n_terminais'])]
+
+    def consultar_dicts():
+        for nt, terminal in pares:
+            grammar.obter_producao(tabela, nt, terminal)
+
+    def consultar_compilada():
+        for nt, terminal in pares_ids:
+            grammar.obter_producao_compilada(compilada, nt, terminal)
+
+    def consultar_array():
+        entradas = compilada['entradas']
+        n_terminais = compilada['n_terminais']
+        for nt, terminal in pares_ids:
+            entradas[nt * n_terminais + terminal]
+
+    repeticoes = max(3, 20_000 // len(pares))
+    tempo_dicts = medir(consultar_dicts, repeticoes) / len(pares)
+    tempo_compilada = medir(consultar_compilada, repeticoes) / len(pares)
+    tempo_array = medir(consultar_array, repeticoes) / len(pares)
+    bytes_dicts = pickle.dumps(tabela, protocol=pickle.HIGHEST_PROTOCOL)
+    bytes_compilada = pickle.dumps(compilada, protocol=pickle.HIGHEST_PROTOCOL)
+    tempo_pickle_dicts = medir(lambda: pickle.loads(pickle.dumps(tabela, protocol=pickle.HIGHEST_PROTOCOL)), 5)
+    tempo_pickle_compilada = medir(
+        lambda: pickle.loads(pickle.dumps(compilada, protocol=pickle.HIGHEST_PROTOCOL)), 5)
+
+    print(f"{nome}: {len(compilada['nao_terminais'])} x {compilada['n_terminais']} entradas")
+    print(f"  consulta: dicts {tempo_dicts * 1e9:6.0f} ns  compilada {tempo_compilada * 1e9:6.0f} ns "
+          f"({tempo_dicts / tempo_compilada:.2f}x)  índice direto {tempo_array * 1e9:6.0f} ns "
+          f"({tempo_dicts / tempo_array:.2f}x)")
+    print(f"  pickle:   dicts {len(bytes_dicts):8,} bytes {tempo_pickle_dicts * 1e6:9.1f} µs  "
+          f"compilada {len(bytes_compilada):8,} bytes {tempo_pickle_compilada * 1e6:9.1f} µs "
+          f"({tempo_pickle_dicts / tempo_pickle_compilada:.1f}x)")
+
+def main():
+    """função principal"""
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        producoes = grammar.definir_producoes()
+        tempo_calculo = medir(lambda: grammar.calcular_artefatos(producoes), repeticoes)
+
+        grammar.construir_gramatica(diretorio)
+        tempo_disco = medir(lambda: (limpar_memo(), grammar.construir_gramatica(diretorio)), repeticoes)
+        tempo_memo = medir(lambda: grammar.construir_gramatica(diretorio), repeticoes)
+
+        print(f"cálculo:  {tempo_calculo * 1e6:10.1f} µs")
+        print(f"disco:    {tempo_disco * 1e6:10.1f} µs ({tempo_calculo / tempo_disco:.2f}x)")
+        print(f"processo: {tempo_memo * 1e6:10.1f} µs ({tempo_calculo / tempo_memo:.0f}x)")
+
+        # processos curtos: cache vazio a cada vez x cache preenchido
+        sem_cache = min(invocacao(tempfile.mkdtemp(dir=diretorio)) for _ in range(5))
+        com_cache = min(invocacao(diretorio) for _ in range(5))
+        print(f"invocação sem cache: {sem_cache * 1000:8.1f} ms")
+        print(f"invocação com cache: {com_cache * 1000:8.1f} ms")
+
+    gerador = random.Random(49)
+    for n_nao_terminais in (100, 300, 1000):
+        gramatica = gramatica_gerada(gerador, n_nao_terminais, n_nao_terminais // 3)
+        first, follow = first_follow_definicao(gramatica, 'N0')
+        first_conjuntos = grammar.calcular_all_first(gramatica)
+        assert first_conjuntos == first
+        assert grammar.calcular_all_follow(gramatica, first_conjuntos) == follow
+
+        tempo_definicao = medir(lambda: first_follow_definicao(gramatica, 'N0'), 3)
+        tempo_bits = medir(lambda: first_follow_bits(gramatica), 3)
+        print(f"{n_nao_terminais:5} não-terminais: definição {tempo_definicao * 1000:8.2f} ms  "
+              f"bits {tempo_bits * 1000:7.2f} ms ({tempo_definicao / tempo_bits:.1f}x)")
+
+    gramatica_info = grammar.construir_gramatica()
+    medir_tabelas('gramática RPN', gramatica_info['tabela'], gramatica_info['tabela_compilada'])
+    medir_tabelas('gramática gerada', *tabela_gerada(gramatica_gerada(gerador, 300, 100)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# benchmark de vazão de laços WHILE no interpretador de árvore
+# inclui um laço com %, ^ e / comparando as instruções especializadas
+# (RESTO, DIVIDIR, POTENCIA_INT) com o caminho genérico (ARIT)
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao
+from src.interpretador import (gerar_arvores, compilar_arvore, executar_codigo, inferir_inteiros,
+                               OP_ARIT, OP_DIVIDIR, OP_RESTO, OP_POTENCIA_INT)
+from src.memoria import MemoriaSlots
+from src.limites import criar_limites, iniciar_limites
+
+def medir_laco(iteracoes, repeticoes=3, otimizar_lacos=False, com_limites=False):
+    """
+    mede iterações por segundo de um laço contador
+
+    Args:
+        iteracoes (int): número de iterações do laço
+        repeticoes (int): número de medições (usa a melhor)
+        otimizar_lacos (bool): compila com a otimização de laços
+        com_limites (bool): executa com orçamento de passos e prazo (que
+            nunca é atingido) para medir o custo das verificações
+
+    Returns:
+        float: iterações por segundo
+    """
+    linha = f"(I {iteracoes} < ((I 1 +) I) WHILE)"
+    arvore = gerar_arvores([parse_expressao(linha)])[0]
+
+    melhor = None
+    for _ in range(repeticoes):
+        memoria = MemoriaSlots()
+        codigo = compilar_arvore(arvore, memoria, otimizar_lacos)
+        contexto = {'historico_resultados': [], 'memoria': memoria}
+        if com_limites:
+            contexto['limites'] = criar_limites(max_passos=10 ** 12, prazo_segundos=3600.0)
+            iniciar_limites(contexto['limites'])
+
+        inicio = time.perf_counter()
+        executar_codigo(codigo, contexto)
+        duracao = time.perf_counter() - inicio
+
+        assert memoria['I'] == iteracoes
+        melhor = duracao if melhor is None else min(melhor, duracao)
+
+    return iteracoes / melhor
+
+# instrução especializada -> operador do caminho genérico
+GENERICAS = {OP_DIVIDIR: '/', OP_RESTO: '%', OP_POTENCIA_INT: '^'}
+
+def generalizar(codigo):
+    """troca as instruções especializadas por ARIT (código como antes delas)"""
+    return [(OP_ARIT, GENERICAS[op], None) if op in GENERICAS else (op, a, b) for op, a, b in codigo]
+
+def medir_inteiros(iteracoes, repeticoes=5, otimizar_lacos=False):
+    """
+    mede um laço com resto, potência e divisão com e sem as instruções
+    especializadas (alternadas a cada repetição)
+
+    Returns:
+        tuple: (iterações/s genérico, iterações/s especializado)
+    """
+    linhas = ["(0 I)", "(0 S)",
+              f"(I {iteracoes} < (((S (((I 7 %) (I 2 ^) +) (I 4 /) -) +) S) ((I 1 +) I) +) WHILE)"]
+    arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+    melhores = [None, None]
+    resultados = [None, None]
+    for _ in range(repeticoes):
+        for indice, especializado in enumerate((False, True)):
+            memoria = MemoriaSlots()
+            inteiros = inferir_inteiros(arvores, memoria)
+            programa = [compilar_arvore(arvore, memoria, otimizar_lacos, inteiros) for arvore in arvores]
+            if not especializado:
+                programa = [generalizar(codigo) for codigo in programa]
+            contexto = {'historico_resultados': [], 'memoria': memoria}
+
+            inicio = time.perf_counter()
+            for codigo in programa:
+                executar_codigo(codigo, contexto)
+            duracao = time.perf_counter() - inicio
+
+            resultados[indice] = memoria['S']
+            if melhores[indice] is None or duracao < melhores[indice]:
+                melhores[indice] = duracao
+
+    assert resultados[0] == resultados[1]
+    return iteracoes / melhores[0], iteracoes / melhores[1]
+
+def main():
+    """função principal"""
+    iteracoes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print(f"Laço contador com {iteracoes} iterações")
+    print(f"  {medir_laco(iteracoes):,.0f} iterações/s")
+    print(f"  {medir_laco(iteracoes, otimizar_lacos=True):,.0f} iterações/s (laços otimizados)")
+    print(f"  {medir_laco(iteracoes, com_limites=True):,.0f} iterações/s (com orçamento)")
+    print(f"  {medir_laco(iteracoes, otimizar_lacos=True, com_limites=True):,.0f} iterações/s "
+          f"(laços otimizados, com orçamento)")
+
+    iteracoes //= 10
+    print(f"Laço com %, ^ e / ({iteracoes} iterações)")
+    for otimizar_lacos in (False, True):
+        generico, especializado = medir_inteiros(iteracoes, otimizar_lacos=otimizar_lacos)
+        rotulo = " (laços otimizados)" if otimizar_lacos else ""
+        print(f"  ARIT genérico:        {generico:12,.0f} iterações/s{rotulo}")
+        print(f"  RESTO/POTENCIA_INT:   {especializado:12,.0f} iterações/s ({especializado / generico:.2f}x)")
+
+if __name__ == '__main__':
+    main()
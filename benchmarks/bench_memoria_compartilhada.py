@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# microbenchmark: entregar a memória (MEM) a processos trabalhadores
+#   dict:          a memória vai por pickle em cada tarefa
+#   compartilhada: cada trabalhador anexa o segmento uma vez; a tarefa copia
+#                  o segmento publicado (carregar) sem desserializar nada
+# mede também, no próprio processo, o custo de obter um instantâneo: pickle
+# de ida e volta do dict x carregar do segmento
+
+import sys
+import os
+import time
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.memoria_compartilhada import MemoriaCompartilhada
+
+def nomes_identificadores(quantidade):
+    """identificadores válidos (só letras maiúsculas): A, B, ..., AA, AB, ..."""
+    nomes = []
+    for indice in range(quantidade):
+        nome = ''
+        indice += 1
+        while indice:
+            indice, resto = divmod(indice - 1, 26)
+            nome = chr(ord('A') + resto) + nome
+        nomes.append(nome)
+    return nomes
+
+def tarefa_dict(memoria, nome):
+    """lê um identificador da memória recebida por pickle"""
+    return memoria[nome]
+
+# segmento anexado uma vez por processo trabalhador (o índice de nomes fica
+# em cache entre tarefas)
+_compartilhada = None
+
+def anexar_trabalhador(nome_segmento):
+    """initializer do pool: anexa o segmento neste processo"""
+    global _compartilhada
+    _compartilhada = MemoriaCompartilhada.anexar(nome_segmento)
+
+def tarefa_compartilhada(nome):
+    """lê um identificador do instantâneo do segmento"""
+    return _compartilhada.carregar()[nome]
+
+def medir(funcao, repeticoes):
+    """melhor tempo de repeticoes chamadas de funcao()"""
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def main():
+    """função principal"""
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    tarefas = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    nomes = nomes_identificadores(quantidade)
+    memoria = {nome: float(indice) for indice, nome in enumerate(nomes)}
+
+    with MemoriaCompartilhada.criar(capacidade=quantidade) as compartilhada:
+        inicio = time.perf_counter()
+        compartilhada.publicar(memoria)
+        print(f"{quantidade} identificadores; publicar inicial: "
+              f"{(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+        # instantâneo no próprio processo
+        tempo_pickle = medir(lambda: pickle.loads(pickle.dumps(memoria)), 20)
+        tempo_carregar = medir(compartilhada.carregar, 20)
+        print(f"  instantâneo por pickle: {tempo_pickle * 1e6:10.0f} µs")
+        print(f"  instantâneo carregar:   {tempo_carregar * 1e6:10.0f} µs "
+              f"({tempo_pickle / tempo_carregar:.2f}x)")
+
+        # republicar uma célula (o caso comum entre tarefas)
+        tempo_celula = medir(lambda: compartilhada.publicar(memoria, ['A']), 1000)
+        print(f"  publicar uma célula:    {tempo_celula * 1e6:10.1f} µs")
+
+        alvo = nomes[-1]
+        with ProcessPoolExecutor(max_workers=2, initializer=anexar_trabalhador,
+                                 initargs=(compartilhada.nome,)) as pool:
+            # aquece o pool antes de medir
+            list(pool.map(tarefa_compartilhada, [alvo] * 2))
+
+            inicio = time.perf_counter()
+            obtidos_dict = list(pool.map(tarefa_dict, [memoria] * tarefas, [alvo] * tarefas))
+            tempo_dict = time.perf_counter() - inicio
+
+            inicio = time.perf_counter()
+            obtidos = list(pool.map(tarefa_compartilhada, [alvo] * tarefas))
+            tempo_compartilhada = time.perf_counter() - inicio
+        assert obtidos == obtidos_dict
+
+        print(f"  {tarefas} tarefas, memória por pickle: {tarefas / tempo_dict:10,.0f} tarefas/s")
+        print(f"  {tarefas} tarefas, segmento anexado:   {tarefas / tempo_compartilhada:10,.0f} tarefas/s "
+              f"({tempo_dict / tempo_compartilhada:.2f}x)")
+
+if __name__ == '__main__':
+    main()
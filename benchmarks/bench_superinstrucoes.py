@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# microbenchmark: instruções executadas por resultado e tempo do interpretador
+# de árvore com e sem superinstruções (fundir_instrucoes) e com e sem o
+# aquecimento de ^ (POTENCIA_Q)
+#   base:        código de compilar_arvore, aquecimento desligado
+#   fundido:     fundir_instrucoes, aquecimento desligado
+#   aquecido:    fundir_instrucoes com aquecimento (como executar_arvores)
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao
+from src.interpretador import gerar_arvores, compilar_arvore, fundir_instrucoes, executar_codigo, OP_ARIT
+from src.executor import formatar_resultado
+from src.memoria import MemoriaSlots
+from utils.util import ler_arquivo
+
+ARQUIVO_BASE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'test1.txt')
+
+PROGRAMAS = {
+    'test1.txt': None,
+    'laço contador': ["(0 I)", "(I 20000 < ((I 1 +) I) WHILE)"],
+    'laço com ^ e RES': ["(0 I)", "(0 S)", "(2 1 +)",
+                         "(I 20000 < (((S ((1 RES) (I 3 %) ^) +) S) ((I 1 +) I) +) WHILE)"]
+}
+
+def sem_aquecimento(codigo):
+    """desliga o aquecimento de ^ (contador None)"""
+    return [(op, a, None) if op == OP_ARIT else (op, a, b) for op, a, b in codigo]
+
+VARIANTES = {
+    'base': lambda codigo: sem_aquecimento(codigo),
+    'fundido': lambda codigo: sem_aquecimento(fundir_instrucoes(codigo)),
+    'aquecido': fundir_instrucoes
+}
+
+def executar(arvores, variante, contar=False):
+    """
+    compila e executa o programa
+
+    Returns:
+        tuple: (resultados, instruções executadas ou None, segundos)
+    """
+    memoria = MemoriaSlots()
+    programa = [VARIANTES[variante](compilar_arvore(arvore, memoria)) for arvore in arvores]
+    contexto = {'historico_resultados': [], 'memoria': memoria}
+    instrucoes = 0 if contar else None
+
+    inicio = time.perf_counter()
+    for codigo in programa:
+        contagem = [0] * len(codigo) if contar else None
+        contexto['historico_resultados'].append(formatar_resultado(executar_codigo(codigo, contexto, contagem)))
+        if contar:
+            instrucoes += sum(contagem)
+    return contexto['historico_resultados'], instrucoes, time.perf_counter() - inicio
+
+def main():
+    """função principal"""
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    linhas_base = [linha for linha in ler_arquivo(ARQUIVO_BASE) if not linha.startswith('#')]
+
+    for nome, linhas in PROGRAMAS.items():
+        arvores = gerar_arvores([parse_expressao(linha) for linha in (linhas or linhas_base)])
+        print(f"{nome} ({len(arvores)} linhas)")
+
+        esperado = None
+        medidas = {}
+        for variante in VARIANTES:
+            resultados, instrucoes, _ = executar(arvores, variante, contar=True)
+            assert esperado is None or resultados == esperado
+            esperado = resultados
+            medidas[variante] = [instrucoes, float('inf')]
+        # variantes alternadas: ruído da máquina afeta todas
+        for _ in range(repeticoes):
+            for variante in VARIANTES:
+                medidas[variante][1] = min(medidas[variante][1], executar(arvores, variante)[2])
+
+        instrucoes_base, tempo_base = medidas['base']
+        for variante, (instrucoes, tempo) in medidas.items():
+            print(f"  {variante:9} {instrucoes / len(arvores):12,.1f} instruções/resultado "
+                  f"({instrucoes_base / instrucoes:.2f}x menos)  {tempo * 1000:9.2f} ms "
+                  f"({tempo_base / tempo:.2f}x)")
+
+if __name__ == '__main__':
+    main()
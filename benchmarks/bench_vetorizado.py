@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# benchmark: mesma fórmula RPN sobre muitas linhas de dados,
+# laço Python com executar_expressao versus modo vetorizado
+
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao
+from src.executor import executar_expressao
+from src.interpretador import gerar_arvores
+from src.vetorizado import executar_vetorizado, exigir_numpy, np
+
+FORMULA = "(((A B *) (C 2 ^) +) (B 1 +) /)"
+
+def medir_escalar(colunas, n_linhas):
+    """executa a fórmula uma vez por linha de dados"""
+    tokens = parse_expressao(FORMULA)
+    inicio = time.perf_counter()
+    for i in range(n_linhas):
+        memoria = {nome: float(valores[i]) for nome, valores in colunas.items()}
+        executar_expressao(tokens, memoria=memoria)
+    return time.perf_counter() - inicio
+
+def medir_vetorizado(colunas):
+    """executa a fórmula uma vez sobre todas as linhas"""
+    arvores = gerar_arvores([parse_expressao(FORMULA)])
+    inicio = time.perf_counter()
+    executar_vetorizado(arvores, colunas)
+    return time.perf_counter() - inicio
+
+def main():
+    """função principal"""
+    exigir_numpy()
+    n_linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+
+    gerador = np.random.default_rng(0)
+    colunas = {nome: gerador.uniform(0, 100, n_linhas) for nome in ('A', 'B', 'C')}
+
+    escalar = medir_escalar(colunas, n_linhas)
+    vetorizado = medir_vetorizado(colunas)
+
+    print(f"Fórmula {FORMULA} sobre {n_linhas} linhas")
+    print(f"  escalar:    {n_linhas / escalar:>14,.0f} linhas/s")
+    print(f"  vetorizado: {n_linhas / vetorizado:>14,.0f} linhas/s")
+    print(f"  ganho:      {escalar / vetorizado:>14,.1f}x")
+
+if __name__ == '__main__':
+    main()
@@ -7,7 +7,9 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.token_types import *
+from src.operadores import OPERADORES
 from src.lexer import parse_expressao
+from src.otimizador import otimizar_tokens
 from utils.util import ler_arquivo
 
 class AssemblyError(Exception):
@@ -455,8 +457,18 @@ def gerar_expressao_hardcoded(tokens, numero_expressao):
     expr_str = ''.join([t['valor'] for t in tokens])
     codigo = f"    ; === Expressão {numero_expressao}: {expr_str} ===\n"
     
+    # Constante: (N) - expressão reduzida pelo otimizador
+    if len(tokens) == 3 and tokens[1]['tipo'] == NUMERO:
+        valor = int(float(tokens[1]['valor'])) & 0xFF
+        codigo += f"""    ; Constante ({tokens[1]['valor']})
+    ldi r16, {valor}
+    call add_to_history          ; Adicionar ao histórico
+    call print_number
+
+"""
+    
     # Comando: (MEM) - recuperar valor  
-    if len(tokens) == 3 and tokens[1]['tipo'] == IDENTIFICADOR:
+    elif len(tokens) == 3 and tokens[1]['tipo'] == IDENTIFICADOR:
         var_name = tokens[1]['valor']
         codigo += f"""    ; Comando (MEM) - recuperar variável {var_name}
     ldi r16, '{var_name[0]}'     ; Primeiro caractere do identificador
@@ -508,26 +520,7 @@ def gerar_expressao_hardcoded(tokens, numero_expressao):
     ldi r21, {operando2}
 """
         
-        if operador == '+':
-            codigo += "    add r20, r21\n"
-        elif operador == '-':
-            codigo += "    sub r20, r21\n"
-        elif operador == '*':
-            codigo += "    call multiply_r20_r21\n"
-        elif operador == '/':
-            codigo += """    mov r16, r20
-    mov r17, r21
-    call div_r16_r17
-    mov r20, r18             ; Quociente em r20
-"""
-        elif operador == '%':
-            codigo += """    mov r16, r20
-    mov r17, r21
-    call div_r16_r17        ; Resto fica em r16
-    mov r20, r16
-"""
-        elif operador == '^':
-            codigo += "    call power_r20_r21\n"
+        codigo += OPERADORES[operador]['assembly']
         
         codigo += """    mov r16, r20
     call add_to_history          ; Adicionar ao histórico
@@ -556,26 +549,7 @@ def gerar_expressao_hardcoded(tokens, numero_expressao):
     mov r21, r16
 """
         
-        if operador == '+':
-            codigo += "    add r20, r21\n"
-        elif operador == '-':
-            codigo += "    sub r20, r21\n"
-        elif operador == '*':
-            codigo += "    call multiply_r20_r21\n"
-        elif operador == '/':
-            codigo += """    mov r16, r20
-    mov r17, r21
-    call div_r16_r17
-    mov r20, r18
-"""
-        elif operador == '%':
-            codigo += """    mov r16, r20
-    mov r17, r21
-    call div_r16_r17
-    mov r20, r16
-"""
-        elif operador == '^':
-            codigo += "    call power_r20_r21\n"
+        codigo += OPERADORES[operador]['assembly']
         
         codigo += """    mov r16, r20
     call add_to_history
@@ -587,12 +561,14 @@ def gerar_expressao_hardcoded(tokens, numero_expressao):
     
     return codigo
 
-def processar_arquivo_para_assembly_funcional(nome_arquivo_entrada):
+def processar_arquivo_para_assembly_funcional(nome_arquivo_entrada, otimizar=False):
     """
     Função principal - lê arquivo e gera assembly funcional
     
     Args:
         nome_arquivo_entrada (str): arquivo .txt com expressões RPN
+        otimizar (bool): dobra constantes antes de gerar (src.otimizador),
+            permitindo gerar expressões aninhadas só com literais
         
     Returns:
         bool: True se processamento foi bem-sucedido
@@ -615,6 +591,8 @@ def processar_arquivo_para_assembly_funcional(nome_arquivo_entrada):
                 
             try:
                 tokens = parse_expressao(linha)
+                if otimizar:
+                    tokens = otimizar_tokens(tokens)
                 tokens_por_expressao.append(tokens)
                 expressoes_validas += 1
                 print(f"✓ Linha {i}: {linha}")
@@ -0,0 +1,451 @@
+# compilação antecipada de um arquivo de programa RPN para Python
+# o programa inteiro vira uma função em código linear: cada célula de MEM é
+# uma variável local, cada linha grava numa posição fixa do histórico e RES
+# vira indexação com índice constante. o bytecode resultante fica em cache
+# no disco, indexado pelo hash do arquivo, e execuções seguintes do mesmo
+# programa não passam por analisador léxico, parser nem interpretador
+
+import sys
+import os
+import builtins
+import hashlib
+import marshal
+import importlib.util
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao, LexerError
+from src.executor import ExecutorError, executar_operacao, gerenciar_resultado
+from src.memoria import MemoriaSlots
+from src.interpretador import gerar_arvores
+from src.otimizador import otimizar_arvore
+from src.operadores import OPERADORES
+
+VERSAO_COMPILADOR = 2
+EXTENSAO_CACHE = '.rpnc'
+OPERADORES_RELACIONAIS = ('>', '<', '==', '!=', '>=', '<=')
+
+# programas já carregados neste processo, por hash do conteúdo
+_programas_carregados = {}
+
+class CompiladorError(Exception):
+    """exceção para programas que não podem ser compilados"""
+    def __init__(self, mensagem, linha=None):
+        self.mensagem = mensagem
+        self.linha = linha
+        super().__init__(f"Erro de compilação{' na linha ' + str(linha) if linha else ''}: {mensagem}")
+
+def operacao_em_ordem(operador, operando1, operando2):
+    """
+    executar_operacao com os operandos na ordem do código-fonte
+
+    o código gerado passa os argumentos da esquerda para a direita, então o
+    primeiro operando é avaliado (e falha) antes do segundo, como no
+    interpretador
+    """
+    return executar_operacao(operador, operando2, operando1)
+
+def criar_namespace():
+    """
+    namespace global do módulo gerado
+
+    Returns:
+        dict: builtins, ExecutorError e _operacao
+    """
+    return {
+        '__builtins__': builtins,
+        'ExecutorError': ExecutorError,
+        '_operacao': operacao_em_ordem
+    }
+
+def criar_estado_geracao():
+    """
+    cria estado da geração de código
+
+    Returns:
+        dict: instruções emitidas, slots de memória, contador de temporários
+    """
+    return {
+        'codigo': [],
+        'recuo': 2,
+        'slots': {},
+        'temporarios': 0,
+        'linha': 0
+    }
+
+def emitir(estado, texto):
+    """acrescenta uma instrução no recuo atual"""
+    estado['codigo'].append('    ' * estado['recuo'] + texto)
+
+def novo_temporario(estado):
+    """reserva nome de variável temporária"""
+    estado['temporarios'] += 1
+    return f"t{estado['temporarios']}"
+
+def variavel_memoria(estado, nome):
+    """retorna o índice da variável local de um identificador"""
+    slots = estado['slots']
+    if nome not in slots:
+        slots[nome] = len(slots)
+    return slots[nome]
+
+def eh_literal(expressao):
+    """expressões literais não dependem da ordem de avaliação"""
+    try:
+        float(expressao)
+        return True
+    except ValueError:
+        return False
+
+def gerar_operandos(operando1, operando2, estado):
+    """
+    gera dois operandos preservando a ordem de avaliação
+
+    se o segundo operando precisar emitir instruções (escrita em MEM, IF,
+    WHILE), o primeiro é guardado antes num temporário.
+
+    Returns:
+        tuple: (expressao1, expressao2)
+    """
+    expressao1 = gerar_no(operando1, estado)
+
+    codigo = estado['codigo']
+    estado['codigo'] = []
+    expressao2 = gerar_no(operando2, estado)
+    instrucoes2 = estado['codigo']
+    estado['codigo'] = codigo
+
+    if instrucoes2 and not eh_literal(expressao1):
+        temporario = novo_temporario(estado)
+        emitir(estado, f"{temporario} = {expressao1}")
+        expressao1 = temporario
+
+    codigo.extend(instrucoes2)
+    return expressao1, expressao2
+
+def gerar_condicao(condicao, estado):
+    """gera a comparação de um nó CONDICAO como expressão Python"""
+    if condicao['tipo'] != 'CONDICAO' or condicao['valor'] not in OPERADORES_RELACIONAIS:
+        raise CompiladorError(f"Condição inválida: {condicao['valor']}", estado['linha'])
+
+    expressao1, expressao2 = gerar_operandos(condicao['filhos'][0], condicao['filhos'][1], estado)
+    return f"{expressao1} {condicao['valor']} {expressao2}"
+
+def gerar_no(no, estado):
+    """
+    gera o código de um nó
+
+    instruções necessárias (escritas, IF, WHILE) são emitidas no estado; o
+    valor do nó é devolvido como expressão Python.
+
+    Args:
+        no (dict): nó da árvore
+        estado (dict): estado da geração
+
+    Returns:
+        str: expressão com o valor do nó
+    """
+    tipo = no['tipo']
+    filhos = no['filhos']
+
+    if tipo == 'EXPRESSAO':
+        if len(filhos) != 1:
+            raise CompiladorError("Expressão sem conteúdo", estado['linha'])
+        expressao = gerar_no(filhos[0], estado)
+
+    elif tipo == 'NUMERO':
+        expressao = repr(float(no['valor']))
+
+    elif tipo == 'IDENTIFICADOR':
+        expressao = f"m{variavel_memoria(estado, no['valor'])}"
+
+    elif tipo == 'COMANDO_RECUPERAR':
+        expressao = gerar_no(filhos[0], estado)
+
+    elif tipo == 'COMANDO_ARMAZENAR':
+        valor, identificador = filhos
+        expressao_valor = gerar_no(valor, estado)
+        indice = variavel_memoria(estado, identificador['valor'])
+        emitir(estado, f"m{indice} = {expressao_valor}")
+        emitir(estado, f"e{indice} = True")
+        expressao = f"m{indice}"
+
+    elif tipo == 'COMANDO_RES':
+        n = int(float(filhos[0]['valor']))
+        linha = estado['linha']
+        if 0 < n < linha:
+            expressao = f"h[{linha - 1 - n}]"
+        else:
+            # o histórico anterior ao programa é vazio: erro na execução da linha
+            try:
+                gerenciar_resultado(n, [0.0] * (linha - 1))
+            except ExecutorError as e:
+                emitir(estado, f"raise ExecutorError({e.mensagem!r})")
+            expressao = '0.0'
+
+    elif tipo == 'OPERACAO':
+        expressao1, expressao2 = gerar_operandos(filhos[0], filhos[1], estado)
+        operador = no['valor']
+        modelo = OPERADORES[operador]['python']
+        if modelo is not None:
+            expressao = modelo.format(expressao1, expressao2)
+        else:
+            expressao = f"_operacao({operador!r}, {expressao1}, {expressao2})"
+
+    elif tipo == 'DECISAO':
+        condicao, bloco_verdadeiro, bloco_falso = filhos
+        resultado = novo_temporario(estado)
+        emitir(estado, f"if {gerar_condicao(condicao, estado)}:")
+        estado['recuo'] += 1
+        emitir(estado, f"{resultado} = {gerar_no(bloco_verdadeiro, estado)}")
+        estado['recuo'] -= 1
+        emitir(estado, "else:")
+        estado['recuo'] += 1
+        emitir(estado, f"{resultado} = {gerar_no(bloco_falso, estado)}")
+        estado['recuo'] -= 1
+        expressao = resultado
+
+    elif tipo == 'LACO':
+        condicao, bloco = filhos
+        resultado = novo_temporario(estado)
+        emitir(estado, f"{resultado} = 0.0")
+
+        # condição gerada à parte: se emitir instruções, elas precisam rodar a cada iteração
+        codigo = estado['codigo']
+        estado['codigo'] = []
+        estado['recuo'] += 1
+        teste = gerar_condicao(condicao, estado)
+        instrucoes_condicao = estado['codigo']
+        estado['codigo'] = codigo
+
+        if instrucoes_condicao:
+            codigo.append('    ' * (estado['recuo'] - 1) + "while True:")
+            codigo.extend(instrucoes_condicao)
+            emitir(estado, f"if not ({teste}):")
+            emitir(estado, "    break")
+        else:
+            codigo.append('    ' * (estado['recuo'] - 1) + f"while {teste}:")
+
+        emitir(estado, f"{resultado} = {gerar_no(bloco, estado)}")
+        estado['recuo'] -= 1
+        expressao = resultado
+
+    elif tipo == 'TEMPORARIO':
+        expressao = f"c{estado['linha']}_{no['valor']}"
+
+    else:
+        raise CompiladorError(f"Nó não executável: {tipo}", estado['linha'])
+
+    if 'temporario' in no:
+        # primeira ocorrência de subexpressão comum (ver src.otimizador)
+        nome = f"c{estado['linha']}_{no['temporario']}"
+        emitir(estado, f"{nome} = {expressao}")
+        expressao = nome
+
+    return expressao
+
+def gerar_codigo_python(arvores):
+    """
+    gera o código-fonte Python de um programa
+
+    a função gerada, executar(memoria), devolve (historico, memoria_final):
+    o histórico é pré-alocado com uma posição por linha e a memória final
+    é a memória recebida atualizada com as células escritas pelo programa.
+
+    Args:
+        arvores (list): árvores sintáticas, uma por linha
+
+    Returns:
+        str: código-fonte do módulo
+    """
+    estado = criar_estado_geracao()
+
+    for numero_linha, arvore in enumerate(arvores, 1):
+        estado['linha'] = numero_linha
+        emitir(estado, f"linha = {numero_linha}")
+        expressao = gerar_no(arvore, estado)
+        emitir(estado, f"h[{numero_linha - 1}] = round({expressao}, 2)")
+
+    nomes = sorted(estado['slots'], key=estado['slots'].get)
+    cabecalho = [
+        f"# gerado por src/compilador.py (versão {VERSAO_COMPILADOR}); não editar",
+        "def executar(memoria):",
+        f"    h = [0.0] * {len(arvores)}"
+    ]
+    for nome in nomes:
+        indice = estado['slots'][nome]
+        cabecalho.append(f"    m{indice} = float(memoria.get({nome!r}, 0.0))")
+        cabecalho.append(f"    e{indice} = {nome!r} in memoria")
+    cabecalho += [
+        "    linha = 0",
+        "    try:"
+    ]
+
+    celulas = ', '.join(f"({nome!r}, m{estado['slots'][nome]}, e{estado['slots'][nome]})" for nome in nomes)
+    rodape = [
+        "        pass",
+        "    except ExecutorError as e:",
+        "        raise ExecutorError(e.mensagem, f'linha {linha}')",
+        "    except (OverflowError, ValueError, ZeroDivisionError) as e:",
+        "        raise ExecutorError(f'Erro numérico: {e}', f'linha {linha}')",
+        "    final = dict(memoria)",
+        f"    final.update((nome, valor) for nome, valor, escrito in ({celulas}{',' if len(nomes) == 1 else ''}) if escrito)",
+        "    return h, final"
+    ]
+
+    return '\n'.join(cabecalho + estado['codigo'] + rodape) + '\n'
+
+def ler_programa(conteudo, otimizar=False):
+    """
+    tokeniza e analisa o texto de um programa (linhas vazias são ignoradas)
+
+    Returns:
+        list: árvores sintáticas
+
+    Raises:
+        CompiladorError: para erros léxicos ou sintáticos, com a linha
+            contada como na execução (só linhas não vazias)
+    """
+    arvores = []
+    linhas = [linha.strip() for linha in conteudo.splitlines() if linha.strip()]
+    for numero_linha, linha in enumerate(linhas, 1):
+        try:
+            arvore = gerar_arvores([parse_expressao(linha)])[0]
+        except LexerError as e:
+            raise CompiladorError(e.mensagem, numero_linha)
+        except Exception as e:
+            raise CompiladorError(str(e), numero_linha)
+        if otimizar:
+            arvore = otimizar_arvore(arvore)[0]
+        arvores.append(arvore)
+    return arvores
+
+def compilar_programa(conteudo, otimizar=False, nome_arquivo='<rpn>'):
+    """
+    compila o texto de um programa para um objeto de código Python
+
+    Args:
+        conteudo (str): texto do programa, uma expressão por linha
+        otimizar (bool): aplica src.otimizador antes de gerar o código
+        nome_arquivo (str): nome usado em mensagens de erro do Python
+
+    Returns:
+        code: objeto de código do módulo gerado
+    """
+    fonte = gerar_codigo_python(ler_programa(conteudo, otimizar))
+    return compile(fonte, nome_arquivo, 'exec')
+
+def chave_programa(conteudo, otimizar=False):
+    """hash do conteúdo, da versão do compilador e das opções"""
+    resumo = hashlib.sha256()
+    resumo.update(f"{VERSAO_COMPILADOR}:{int(otimizar)}:".encode('utf-8'))
+    resumo.update(conteudo.encode('utf-8'))
+    return resumo.hexdigest()
+
+def caminho_cache(diretorio_cache, chave):
+    """arquivo de cache; a tag do interpretador separa versões do bytecode"""
+    return os.path.join(diretorio_cache, f"{chave}.{sys.implementation.cache_tag}{EXTENSAO_CACHE}")
+
+def ler_cache(caminho):
+    """lê objeto de código do cache, ou None se ausente/incompatível"""
+    try:
+        with open(caminho, 'rb') as arquivo:
+            dados = arquivo.read()
+    except OSError:
+        return None
+
+    magica = importlib.util.MAGIC_NUMBER
+    if not dados.startswith(magica):
+        return None
+    try:
+        return marshal.loads(dados[len(magica):])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+def gravar_cache(caminho, codigo):
+    """grava objeto de código no cache (arquivo temporário + renomeação)"""
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, 'wb') as arquivo:
+        arquivo.write(importlib.util.MAGIC_NUMBER)
+        arquivo.write(marshal.dumps(codigo))
+    os.replace(temporario, caminho)
+
+def carregar_programa(caminho, diretorio_cache=None, otimizar=False):
+    """
+    obtém a função compilada de um arquivo de programa
+
+    ordem de busca: programas já carregados no processo, cache em disco e,
+    por fim, compilação (que alimenta os dois caches).
+
+    Args:
+        caminho (str): arquivo do programa
+        diretorio_cache (str): diretório do cache; padrão __rpncache__ ao
+            lado do arquivo
+        otimizar (bool): aplica src.otimizador antes de gerar o código
+
+    Returns:
+        function: executar(memoria) -> (historico, memoria_final)
+    """
+    with open(caminho, encoding='utf-8') as arquivo:
+        conteudo = arquivo.read()
+
+    chave = chave_programa(conteudo, otimizar)
+    funcao = _programas_carregados.get(chave)
+    if funcao is not None:
+        return funcao
+
+    if diretorio_cache is None:
+        diretorio_cache = os.path.join(os.path.dirname(os.path.abspath(caminho)), '__rpncache__')
+    arquivo_cache = caminho_cache(diretorio_cache, chave)
+
+    codigo = ler_cache(arquivo_cache)
+    if codigo is None:
+        codigo = compilar_programa(conteudo, otimizar, caminho)
+        gravar_cache(arquivo_cache, codigo)
+
+    namespace = criar_namespace()
+    exec(codigo, namespace)
+    funcao = namespace['executar']
+    _programas_carregados[chave] = funcao
+    return funcao
+
+def executar_arquivo_compilado(caminho, memoria=None, diretorio_cache=None, otimizar=False):
+    """
+    executa um arquivo de programa pela versão compilada
+
+    Args:
+        caminho (str): arquivo do programa
+        memoria (dict ou MemoriaSlots): memória inicial
+        diretorio_cache (str): diretório do cache de bytecode
+        otimizar (bool): aplica src.otimizador antes de gerar o código
+
+    Returns:
+        tuple: (resultados, historico, memoria_final) como em
+            interpretador.executar_arvores
+
+    Raises:
+        ExecutorError: para erros durante a execução, indicando a linha
+    """
+    executar = carregar_programa(caminho, diretorio_cache, otimizar)
+    historico, memoria_final = executar(dict(memoria.items()) if memoria else {})
+    return historico, list(historico), MemoriaSlots.de_dict(memoria_final)
+
+if __name__ == '__main__':
+    import tempfile
+
+    programa = "(0 I)\n(I 10 < ((I 1 +) I) WHILE)\n(I 5 > (I 2 *) (I) IF)\n((1 RES) 3 ^)\n"
+
+    try:
+        print(gerar_codigo_python(ler_programa(programa)))
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'programa.txt')
+            with open(caminho, 'w', encoding='utf-8') as arquivo:
+                arquivo.write(programa)
+
+            resultados, _, memoria = executar_arquivo_compilado(caminho)
+            print(f"Resultados: {resultados}")
+            print(f"Memória: {memoria.para_dict()}")
+
+    except (CompiladorError, ExecutorError) as e:
+        print(f"Erro: {e}")
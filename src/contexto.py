@@ -0,0 +1,107 @@
+# contexto de execução com atributos fixos (__slots__) e pilha pré-alocada
+# substitui o dict {'historico_resultados', 'memoria', 'pilha',
+# 'resultado_atual'}; o acesso por chave continua disponível como adaptador
+# para o código que ainda trata o contexto como dict
+
+CAPACIDADE_PILHA = 64
+
+# chaves do contexto em dict e o atributo correspondente
+CHAVES_CONTEXTO = ('historico_resultados', 'memoria', 'pilha', 'resultado_atual', 'perfil')
+
+class ContextoExecucao:
+    """
+    estado compartilhado pelas linhas de um programa
+
+    a pilha é uma lista de tamanho fixo com índice de topo: empilhar e
+    desempilhar não alocam, e a lista só cresce se uma expressão passar da
+    capacidade. a pilha acessada por contexto['pilha'] é uma cópia dos
+    valores empilhados.
+    """
+
+    __slots__ = ('historico_resultados', 'memoria', 'armazenamento', 'topo', 'resultado_atual', 'perfil')
+
+    def __init__(self, historico_resultados=None, memoria=None, capacidade=CAPACIDADE_PILHA, perfil=None):
+        self.historico_resultados = historico_resultados if historico_resultados is not None else []
+        self.memoria = memoria if memoria is not None else {}
+        self.armazenamento = [0.0] * capacidade
+        self.topo = 0
+        self.resultado_atual = None
+        self.perfil = perfil
+
+    def empilhar(self, valor):
+        """empilha valor, dobrando o armazenamento se estiver cheio"""
+        if self.topo == len(self.armazenamento):
+            self.armazenamento.extend([0.0] * len(self.armazenamento))
+        self.armazenamento[self.topo] = valor
+        self.topo += 1
+
+    def desempilhar(self):
+        """
+        remove e retorna o topo da pilha
+
+        Raises:
+            IndexError: se a pilha está vazia
+        """
+        if self.topo == 0:
+            raise IndexError("pilha vazia")
+        self.topo -= 1
+        return self.armazenamento[self.topo]
+
+    def registrar_resultado(self, resultado):
+        """
+        conclui uma linha: guarda o resultado no histórico e esvazia a pilha
+
+        Args:
+            resultado (float): resultado já formatado
+        """
+        self.resultado_atual = resultado
+        self.historico_resultados.append(resultado)
+        self.topo = 0
+
+    # adaptador para o contexto em dict
+
+    def __getitem__(self, chave):
+        if chave == 'pilha':
+            return self.armazenamento[:self.topo]
+        if chave not in CHAVES_CONTEXTO:
+            raise KeyError(chave)
+        return getattr(self, chave)
+
+    def __setitem__(self, chave, valor):
+        if chave == 'pilha':
+            valores = list(valor)
+            self.armazenamento = valores + [0.0] * max(CAPACIDADE_PILHA, len(valores))
+            self.topo = len(valores)
+        elif chave in CHAVES_CONTEXTO:
+            setattr(self, chave, valor)
+        else:
+            raise KeyError(chave)
+
+    def __contains__(self, chave):
+        return chave in CHAVES_CONTEXTO
+
+    def get(self, chave, padrao=None):
+        """como dict.get"""
+        return self[chave] if chave in CHAVES_CONTEXTO else padrao
+
+    def para_dict(self):
+        """
+        contexto no formato dict antigo
+
+        Returns:
+            dict: mesmas chaves de criar_contexto_execucao (e 'perfil')
+        """
+        return {chave: self[chave] for chave in CHAVES_CONTEXTO}
+
+    @classmethod
+    def de_dict(cls, contexto):
+        """cria contexto a partir do formato dict (chaves ausentes usam o padrão)"""
+        novo = cls(contexto.get('historico_resultados'), contexto.get('memoria'), perfil=contexto.get('perfil'))
+        novo.resultado_atual = contexto.get('resultado_atual')
+        if contexto.get('pilha'):
+            novo['pilha'] = contexto['pilha']
+        return novo
+
+    def __repr__(self):
+        return (f"ContextoExecucao(historico={len(self.historico_resultados)} resultados, "
+                f"pilha={self.armazenamento[:self.topo]}, resultado_atual={self.resultado_atual})")
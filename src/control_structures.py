@@ -5,6 +5,27 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.token_types import *
+import operator
+
+# semântica dos operadores relacionais usados nas condições de IF e WHILE
+FUNCOES_RELACIONAIS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '<=': operator.le
+}
+
+# relação equivalente com os operandos trocados: (k < x) == (x > k)
+RELACOES_INVERTIDAS = {
+    '>': '<',
+    '<': '>',
+    '==': '==',
+    '!=': '!=',
+    '>=': '<=',
+    '<=': '>='
+}
 
 class ControlStructureError(Exception):
     """exceção para erros nas estruturas de controle"""
@@ -25,8 +46,8 @@ def definir_sintaxe_controle():
             'sintaxe': '(operando1 operando2 operador_rel (bloco_verdadeiro) (bloco_falso) IF)',
             'descricao': 'estrutura de decisão condicional',
             'exemplos': [
-                '((A B >) ((A) PRINT) ((B) PRINT) IF)',
-                '((X 0 ==) ((0)) ((X)) IF)'
+                '(A B > (A) (B) IF)',
+                '(X 0 == (X 1 +) (X) IF)'
             ]
         },
         'laco': {
@@ -34,8 +55,8 @@ def definir_sintaxe_controle():
             'sintaxe': '(operando1 operando2 operador_rel (bloco_repeticao) WHILE)',
             'descricao': 'laço de repetição condicional',
             'exemplos': [
-                '((CONT 10 <) ((CONT 1 +) CONT) WHILE)',
-                '((I 0 >) ((I 1 -) I) WHILE)'
+                '(CONT 10 < ((CONT 1 +) CONT) WHILE)',
+                '(I 0 > ((I 1 -) I) WHILE)'
             ]
         },
         'operadores_relacionais': {
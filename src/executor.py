@@ -3,9 +3,15 @@
 import sys
 import os
 import math
+import time
+from array import array
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.token_types import *
+from src.memoria import MemoriaSlots, resolver_slots
+from src.operadores import OPERADORES
+from src.contexto import ContextoExecucao
+from src.perfil import registrar_linha, texto_tokens
 
 class ExecutorError(Exception):
     """exceção para erros do executador de expressões"""
@@ -19,14 +25,10 @@ def criar_contexto_execucao():
     cria o contexto inicial para execução de expressões RPN
     
     Returns:
-        dict: contexto com histórico, memória e pilha
+        ContextoExecucao: contexto com histórico, memória e pilha (aceita
+            também acesso por chave, como o antigo dict)
     """
-    return {
-        'historico_resultados': [],
-        'memoria': {},
-        'pilha': [],
-        'resultado_atual': None
-    }
+    return ContextoExecucao()
 
 def formatar_resultado(valor):
     """
@@ -76,28 +78,20 @@ def executar_operacao(operador, operando2, operando1):
     Raises:
         ExecutorError: para operações inválidas ou divisão por zero
     """
+    definicao = OPERADORES.get(operador)
+    if definicao is None:
+        raise ExecutorError(f"Operador inválido: {operador}")
+
+    if operando2 == 0 and definicao['divisor_zero'] is not None:
+        raise ExecutorError(definicao['divisor_zero'])
+
     try:
-        if operador == '+':
-            return operando1 + operando2
-        elif operador == '-':
-            return operando1 - operando2
-        elif operador == '*':
-            return operando1 * operando2
-        elif operador == '/':
-            if operando2 == 0:
-                raise ExecutorError("Divisão por zero")
-            return operando1 / operando2
-        elif operador == '%':
-            if operando2 == 0:
-                raise ExecutorError("Divisão por zero no resto")
-            # para números reais, usar fmod
-            return operando1 % operando2
-        elif operador == '^':
-            return pow(operando1, operando2)
-        else:
-            raise ExecutorError(f"Operador inválido: {operador}")
-    except (OverflowError, ValueError) as e:
+        return definicao['avaliar'](operando1, operando2)
+    except OverflowError as e:
         raise ExecutorError(f"Erro numérico na operação {operador}: {str(e)}")
+    except ValueError as e:
+        # domínio inválido, ex.: base negativa com expoente fracionário
+        raise ExecutorError(str(e))
 
 def gerenciar_memoria(tokens, indice, memoria):
     """
@@ -169,6 +163,11 @@ def avaliar_rpn(tokens, contexto):
     Raises:
         ExecutorError: para expressões mal formadas
     """
+    if isinstance(contexto, ContextoExecucao):
+        return avaliar_contexto(tokens, contexto)
+
+    # perfil opcional (src.perfil), presente só quando o chamador pediu
+    perfil = contexto.get('perfil')
     pilha = []
     i = 1  # começa após o parêntese de abertura
     
@@ -188,6 +187,10 @@ def avaliar_rpn(tokens, contexto):
             operando2 = pilha.pop()
             operando1 = pilha.pop()
             
+            if perfil is not None:
+                operadores = perfil['operadores']
+                operadores[token['valor']] = operadores.get(token['valor'], 0) + 1
+            
             # executa operação e empilha resultado
             resultado = executar_operacao(token['valor'], operando2, operando1)
             pilha.append(resultado)
@@ -198,6 +201,8 @@ def avaliar_rpn(tokens, contexto):
                 raise ExecutorError("RES deve ser precedido por um número")
             
             n = int(float(tokens[i-1]['valor']))
+            if perfil is not None:
+                perfil['res'] += 1
             resultado = gerenciar_resultado(n, contexto['historico_resultados'])
             
             # remove o número N da pilha e empilha o resultado
@@ -206,16 +211,31 @@ def avaliar_rpn(tokens, contexto):
             
         elif token['tipo'] == IDENTIFICADOR:
             # pode ser comando MEM
+            memoria = contexto['memoria']
+            slot = token.get('slot')
+            if slot is not None:
+                # índice de outra tabela (ver resolver_slots): busca pelo nome
+                slot = slot[1] if isinstance(memoria, MemoriaSlots) and slot[0] is memoria.tabela else None
+            
             if i > 0 and tokens[i-1]['tipo'] == NUMERO:
                 # caso (V MEM) - armazenar
                 valor = pilha.pop()  # remove valor da pilha
-                nome_mem = token['valor']
-                contexto['memoria'][nome_mem] = valor
+                if perfil is not None:
+                    perfil['mem_escritas'] += 1
+                if slot is not None:
+                    memoria.valores[slot] = valor
+                    memoria.inicializados[slot] = 1
+                else:
+                    memoria[token['valor']] = valor
                 pilha.append(valor)  # reempilha para continuar processamento
             else:
-                # caso (MEM) - recuperar
-                nome_mem = token['valor']
-                valor = contexto['memoria'].get(nome_mem, 0.0)
+                # caso (MEM) - recuperar (slot não inicializado vale 0.0)
+                if perfil is not None:
+                    perfil['mem_leituras'] += 1
+                if slot is not None:
+                    valor = memoria.valores[slot]
+                else:
+                    valor = memoria.get(token['valor'], 0.0)
                 pilha.append(valor)
                 
         elif token['tipo'] == PARENTESE_ABRE:
@@ -234,6 +254,8 @@ def avaliar_rpn(tokens, contexto):
             
             # extrair subexpressão e avaliar
             subexpressao = tokens[inicio:i]
+            if perfil is not None:
+                perfil['aninhadas'] += 1
             resultado = avaliar_rpn(subexpressao, contexto)
             pilha.append(resultado)
             i -= 1  # ajustar porque será incrementado no final do loop
@@ -246,6 +268,108 @@ def avaliar_rpn(tokens, contexto):
     
     return pilha[0]
 
+def avaliar_contexto(tokens, contexto):
+    """
+    avalia expressão RPN sobre um ContextoExecucao
+
+    mesma semântica de avaliar_rpn, sem recursão nem cópia de subexpressões:
+    cada parêntese aberto guarda a base da pilha e o fechamento confere que o
+    grupo deixou um único valor. usa a pilha pré-alocada do contexto a partir
+    do topo atual, que é restaurado no fim.
+    
+    Args:
+        tokens (list): tokens da expressão RPN
+        contexto (ContextoExecucao): contexto de execução
+        
+    Returns:
+        float: resultado da avaliação
+        
+    Raises:
+        ExecutorError: para expressões mal formadas
+    """
+    perfil = contexto.perfil
+    memoria = contexto.memoria
+    tabela = memoria.tabela if isinstance(memoria, MemoriaSlots) else None
+    
+    # cada token empilha no máximo um valor: a capacidade é garantida antes
+    pilha = contexto.armazenamento
+    base = contexto.topo
+    if base + len(tokens) > len(pilha):
+        pilha.extend([0.0] * (base + len(tokens)))
+    topo = base
+    inicio = base  # base do grupo entre parênteses atual
+    bases = []
+    
+    fim = len(tokens) - 1
+    i = 1
+    while i < fim:
+        token = tokens[i]
+        tipo = token['tipo']
+        
+        if tipo == NUMERO:
+            pilha[topo] = float(token['valor'])
+            topo += 1
+            
+        elif tipo == OPERADOR:
+            if topo - inicio < 2:
+                raise ExecutorError(f"Operandos insuficientes para operador {token['valor']}")
+            if perfil is not None:
+                operadores = perfil['operadores']
+                operadores[token['valor']] = operadores.get(token['valor'], 0) + 1
+            topo -= 1
+            pilha[topo - 1] = executar_operacao(token['valor'], pilha[topo], pilha[topo - 1])
+            
+        elif tipo == IDENTIFICADOR:
+            slot = token.get('slot')
+            if slot is not None:
+                # índice de outra tabela (ver resolver_slots): busca pelo nome
+                slot = slot[1] if slot[0] is tabela else None
+            if tokens[i-1]['tipo'] == NUMERO:
+                # caso (V MEM) - armazenar; o valor continua na pilha
+                valor = pilha[topo - 1]
+                if perfil is not None:
+                    perfil['mem_escritas'] += 1
+                if slot is not None:
+                    memoria.valores[slot] = valor
+                    memoria.inicializados[slot] = 1
+                else:
+                    memoria[token['valor']] = valor
+            else:
+                # caso (MEM) - recuperar (slot não inicializado vale 0.0)
+                if perfil is not None:
+                    perfil['mem_leituras'] += 1
+                pilha[topo] = memoria.valores[slot] if slot is not None else memoria.get(token['valor'], 0.0)
+                topo += 1
+                
+        elif tipo == PALAVRA_RESERVADA and token['valor'] == 'RES':
+            if tokens[i-1]['tipo'] != NUMERO:
+                raise ExecutorError("RES deve ser precedido por um número")
+            if perfil is not None:
+                perfil['res'] += 1
+            # substitui o N empilhado pelo resultado
+            pilha[topo - 1] = gerenciar_resultado(int(float(tokens[i-1]['valor'])), contexto.historico_resultados)
+            
+        elif tipo == PARENTESE_ABRE:
+            if perfil is not None:
+                perfil['aninhadas'] += 1
+            bases.append(inicio)
+            inicio = topo
+            
+        elif tipo == PARENTESE_FECHA:
+            if topo - inicio != 1:
+                raise ExecutorError(f"Expressão mal formada: pilha final tem {topo - inicio} elementos")
+            inicio = bases.pop()
+            
+        i += 1
+    
+    if bases:
+        raise ExecutorError("Expressão mal formada: parênteses não balanceados")
+    if topo - inicio != 1:
+        raise ExecutorError(f"Expressão mal formada: pilha final tem {topo - inicio} elementos")
+    
+    contexto.topo = base
+    return pilha[topo - 1]
+
 def executar_expressao(tokens, historico_resultados=None, memoria=None):
     """
     função principal para executar uma expressão RPN
@@ -267,34 +391,150 @@ def executar_expressao(tokens, historico_resultados=None, memoria=None):
     if memoria is None:
         memoria = {}
         
-    contexto = {
-        'historico_resultados': historico_resultados.copy(),
-        'memoria': memoria.copy(),
-        'pilha': [],
-        'resultado_atual': None
-    }
+    contexto = ContextoExecucao(historico_resultados.copy(), memoria.copy())
     
     try:
         # validar estrutura básica
         validar_expressao(tokens)
         
-        # avaliar expressão RPN
-        resultado = avaliar_rpn(tokens, contexto)
-        
-        # formatar resultado final
-        resultado_formatado = formatar_resultado(resultado)
-        contexto['resultado_atual'] = resultado_formatado
-        
-        # adicionar ao histórico
-        contexto['historico_resultados'].append(resultado_formatado)
+        # avaliar expressão RPN e registrar o resultado formatado no histórico
+        resultado_formatado = formatar_resultado(avaliar_contexto(tokens, contexto))
+        contexto.registrar_resultado(resultado_formatado)
         
-        return resultado_formatado, contexto['historico_resultados'], contexto['memoria']
+        return resultado_formatado, contexto.historico_resultados, contexto.memoria
         
     except ExecutorError:
         raise
     except Exception as e:
         raise ExecutorError(f"Erro interno durante execução: {str(e)}")
 
+def executar_expressoes(lista_de_tokens, contexto=None):
+    """
+    executa muitas expressões sobre um único contexto, sem levantar erros
+    
+    a validação estrutural (validar_expressao) e a resolução de slots são
+    feitas uma vez, antes da execução. uma linha com erro não entra no
+    histórico, então (N RES) conta só as linhas bem-sucedidas; as demais
+    linhas seguem executando.
+    
+    Args:
+        lista_de_tokens (list): listas de tokens, uma por linha
+        contexto (ContextoExecucao ou dict): contexto compartilhado; atualizado
+            com histórico, memória e resultado_atual. None cria um novo
+        
+    Returns:
+        tuple: (resultados, erros) - resultados é um array('d') com um valor
+            por linha (NaN nas linhas com erro) e erros é uma lista de
+            (numero_linha, mensagem)
+    """
+    if contexto is None:
+        contexto = ContextoExecucao()
+    if isinstance(contexto, ContextoExecucao):
+        execucao = contexto
+    else:
+        execucao = ContextoExecucao.de_dict(contexto)
+    
+    invalidas = {}
+    for numero_linha, tokens in enumerate(lista_de_tokens, 1):
+        try:
+            validar_expressao(tokens)
+        except ExecutorError as e:
+            invalidas[numero_linha] = e.mensagem
+        except Exception as e:
+            invalidas[numero_linha] = f"Erro interno durante execução: {str(e)}"
+    
+    if isinstance(execucao.memoria, MemoriaSlots):
+        resolver_slots([tokens for numero_linha, tokens in enumerate(lista_de_tokens, 1)
+                        if numero_linha not in invalidas], execucao.memoria)
+    
+    resultados = array('d', bytes(8 * len(lista_de_tokens)))
+    erros = []
+    
+    for indice, tokens in enumerate(lista_de_tokens):
+        mensagem = invalidas.get(indice + 1) if invalidas else None
+        if mensagem is None:
+            try:
+                resultado = formatar_resultado(avaliar_contexto(tokens, execucao))
+            except ExecutorError as e:
+                mensagem = e.mensagem
+            except Exception as e:
+                mensagem = f"Erro interno durante execução: {str(e)}"
+            else:
+                execucao.registrar_resultado(resultado)
+                resultados[indice] = resultado
+                continue
+        
+        resultados[indice] = math.nan
+        erros.append((indice + 1, mensagem))
+    
+    if execucao is not contexto:
+        contexto['historico_resultados'] = execucao.historico_resultados
+        contexto['memoria'] = execucao.memoria
+        contexto['resultado_atual'] = execucao.resultado_atual
+    
+    return resultados, erros
+
+def executar_programa(expressoes_tokens, historico_resultados=None, memoria=None, otimizar=False, perfil=None):
+    """
+    executa um programa inteiro compartilhando histórico e memória entre linhas
+    
+    os identificadores são resolvidos em slots uma única vez para o programa
+    (ver src.memoria), e a memória de execução é uma MemoriaSlots.
+    
+    Args:
+        expressoes_tokens (list): lista de listas de tokens, uma por linha
+        historico_resultados (list): histórico de resultados anteriores
+        memoria (dict ou MemoriaSlots): memória inicial
+        otimizar (bool): dobra constantes antes de executar (src.otimizador)
+        perfil (dict): perfil de execução (src.perfil) a acumular; None
+            desativa a coleta
+        
+    Returns:
+        tuple: (resultados, historico_atualizado, memoria_atualizada)
+        
+    Raises:
+        ExecutorError: para erros durante a execução, indicando a linha
+    """
+    if memoria is None:
+        memoria = MemoriaSlots()
+    elif not isinstance(memoria, MemoriaSlots):
+        memoria = MemoriaSlots.de_dict(memoria)
+    
+    if otimizar:
+        # importado aqui: o otimizador depende deste módulo
+        from src.otimizador import otimizar_tokens
+        expressoes_tokens = [otimizar_tokens(tokens) for tokens in expressoes_tokens]
+    
+    resolver_slots(expressoes_tokens, memoria)
+    
+    contexto = ContextoExecucao(list(historico_resultados) if historico_resultados else [], memoria,
+                                perfil=perfil)
+    resultados = []
+    
+    for numero_linha, tokens in enumerate(expressoes_tokens, 1):
+        if perfil is not None:
+            inicio = time.perf_counter()
+        try:
+            validar_expressao(tokens)
+            resultado = formatar_resultado(avaliar_contexto(tokens, contexto))
+        except ExecutorError as e:
+            erro = ExecutorError(e.mensagem, f"linha {numero_linha}")
+        except Exception as e:
+            erro = ExecutorError(f"Erro interno durante execução: {str(e)}", f"linha {numero_linha}")
+        else:
+            erro = None
+        
+        if perfil is not None:
+            registrar_linha(perfil, numero_linha, texto_tokens(tokens), time.perf_counter() - inicio,
+                            erro.mensagem if erro is not None else None)
+        if erro is not None:
+            raise erro
+        
+        contexto.registrar_resultado(resultado)
+        resultados.append(resultado)
+    
+    return resultados, contexto.historico_resultados, contexto.memoria
+
 if __name__ == '__main__':
     # exemplo de uso
     from src.lexer import parse_expressao
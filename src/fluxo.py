@@ -0,0 +1,139 @@
+# execução em fluxo de arquivos de programa
+# cada linha é lida, tokenizada, executada e escrita no destino antes da
+# próxima: a memória usada não depende do tamanho do arquivo e o primeiro
+# resultado sai sem esperar o resto
+
+import sys
+import os
+from collections import deque
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao, LexerError
+from src.executor import ExecutorError, validar_expressao, avaliar_rpn, formatar_resultado
+from src.memoria import MemoriaSlots, resolver_slots
+
+def criar_destino(saida, intervalo_descarga=1000):
+    """
+    adapta o destino dos resultados a uma função de escrita
+
+    Args:
+        saida: caminho de arquivo (str), objeto com write() (ex.: sys.stdout)
+            ou função chamada como saida(numero_linha, resultado, erro)
+        intervalo_descarga (int): linhas entre flush() do arquivo; o primeiro
+            resultado é sempre descarregado na hora
+
+    Returns:
+        tuple: (escrever(numero_linha, resultado, erro), fechar())
+    """
+    if callable(saida) and not hasattr(saida, 'write'):
+        return saida, lambda: None
+
+    if isinstance(saida, str):
+        arquivo = open(saida, 'w', encoding='utf-8')
+        fechar = arquivo.close
+    else:
+        arquivo = saida
+        fechar = arquivo.flush
+
+    escritas = [0]
+
+    def escrever(numero_linha, resultado, erro):
+        if erro is None:
+            arquivo.write(f"{resultado}\n")
+        else:
+            arquivo.write(f"ERRO linha {numero_linha}: {erro}\n")
+        escritas[0] += 1
+        if escritas[0] == 1 or escritas[0] % intervalo_descarga == 0:
+            arquivo.flush()
+
+    return escrever, fechar
+
+def executar_fluxo(entrada, saida, profundidade_historico=1000, memoria=None,
+                   continuar_apos_erro=False, intervalo_descarga=1000):
+    """
+    executa um programa linha a linha, escrevendo cada resultado no destino
+
+    linhas vazias são ignoradas (não contam para RES). só os últimos
+    profundidade_historico resultados ficam disponíveis para (N RES).
+
+    Args:
+        entrada: caminho do arquivo de programa ou iterável de linhas
+        saida: destino dos resultados (ver criar_destino)
+        profundidade_historico (int): resultados guardados para RES
+        memoria (dict ou MemoriaSlots): memória inicial
+        continuar_apos_erro (bool): escreve o erro no destino e segue; a
+            linha com erro não entra no histórico. se False, o erro é
+            escrito e então levantado
+        intervalo_descarga (int): linhas entre flush() quando o destino é arquivo
+
+    Returns:
+        dict: 'linhas' executadas, 'resultados', 'erros' e a 'memoria' final
+
+    Raises:
+        ExecutorError: na primeira linha com erro, se continuar_apos_erro é False
+    """
+    if memoria is None:
+        memoria = MemoriaSlots()
+    elif not isinstance(memoria, MemoriaSlots):
+        memoria = MemoriaSlots.de_dict(memoria)
+
+    contexto = {
+        'historico_resultados': deque(maxlen=profundidade_historico),
+        'memoria': memoria,
+        'pilha': [],
+        'resultado_atual': None
+    }
+    estatisticas = {'linhas': 0, 'resultados': 0, 'erros': 0, 'memoria': memoria}
+
+    escrever, fechar = criar_destino(saida, intervalo_descarga)
+    linhas = open(entrada, encoding='utf-8') if isinstance(entrada, str) else entrada
+
+    try:
+        for numero_linha, linha in enumerate(linhas, 1):
+            linha = linha.strip()
+            if not linha:
+                continue
+            estatisticas['linhas'] += 1
+
+            try:
+                tokens = parse_expressao(linha)
+                validar_expressao(tokens)
+                resolver_slots([tokens], memoria)
+                resultado = formatar_resultado(avaliar_rpn(tokens, contexto))
+            except (LexerError, ExecutorError) as e:
+                erro = e.mensagem
+            except Exception as e:
+                erro = f"Erro interno durante execução: {str(e)}"
+            else:
+                erro = None
+
+            if erro is not None:
+                estatisticas['erros'] += 1
+                escrever(numero_linha, None, erro)
+                if not continuar_apos_erro:
+                    raise ExecutorError(erro, f"linha {numero_linha}")
+                continue
+
+            contexto['historico_resultados'].append(resultado)
+            estatisticas['resultados'] += 1
+            escrever(numero_linha, resultado, None)
+    finally:
+        fechar()
+        if linhas is not entrada:
+            linhas.close()
+
+    return estatisticas
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print("Uso: python src/fluxo.py <programa.txt> [resultados.txt]")
+        sys.exit(1)
+
+    destino = sys.argv[2] if len(sys.argv) > 2 else sys.stdout
+
+    try:
+        estatisticas = executar_fluxo(sys.argv[1], destino, continuar_apos_erro=True)
+        print(f"{estatisticas['linhas']} linhas, {estatisticas['erros']} com erro", file=sys.stderr)
+    except (OSError, ExecutorError) as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        sys.exit(2)
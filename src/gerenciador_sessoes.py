@@ -0,0 +1,195 @@
+# gerenciador de muitas sessões de execução com orçamento de memória
+# as sessões menos usadas recentemente são gravadas em disco no formato
+# compacto de src.sessao e restauradas no próximo acesso
+
+import sys
+import os
+import hashlib
+from array import array
+from collections import OrderedDict
+from itertools import islice
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.memoria import MemoriaSlots
+from src.sessao import salvar_sessao, carregar_estado_sessao, CABECALHO, COMPRIMENTO_NOME
+from src.servidor import avaliar_linha
+
+def criar_gerenciador(diretorio, orcamento_bytes=64 * 1024 * 1024):
+    """
+    cria gerenciador de sessões
+
+    Args:
+        diretorio (str): onde as sessões despejadas são gravadas
+        orcamento_bytes (int): tamanho máximo das sessões residentes (medido
+            pelo tamanho no formato compacto, ver tamanho_sessao)
+
+    Returns:
+        dict: sessões residentes em ordem LRU, tamanhos e estatísticas
+    """
+    os.makedirs(diretorio, exist_ok=True)
+    return {
+        'diretorio': diretorio,
+        'orcamento': orcamento_bytes,
+        'residentes': OrderedDict(),
+        'tamanhos': {},
+        'bytes': 0,
+        'acertos': 0,
+        'falhas': 0,
+        'restauradas': 0,
+        'despejos': 0
+    }
+
+def tamanho_sessao(sessao):
+    """
+    bytes ocupados pela sessão no formato compacto
+
+    Returns:
+        int: tamanho estimado
+    """
+    memoria = sessao['memoria']
+    return CABECALHO.size + 8 * len(sessao['historico']) + tamanho_nomes(memoria.tabela)
+
+def tamanho_nomes(nomes):
+    """bytes de um conjunto de slots: valor, bitmap e nome com comprimento"""
+    return sum(9 + COMPRIMENTO_NOME.size + len(nome.encode('utf-8')) for nome in nomes)
+
+def caminho_sessao(gerenciador, id_sessao):
+    """arquivo da sessão; o identificador vira hash para ser seguro como nome"""
+    resumo = hashlib.sha256(str(id_sessao).encode('utf-8')).hexdigest()
+    return os.path.join(gerenciador['diretorio'], f"{resumo}.sessao")
+
+def obter_sessao(gerenciador, id_sessao):
+    """
+    retorna a sessão, restaurando do disco ou criando se preciso
+
+    Args:
+        gerenciador (dict): gerenciador de sessões
+        id_sessao: identificador da sessão (convertido com str)
+
+    Returns:
+        dict: sessão com 'memoria', 'historico' e 'linhas'
+    """
+    residentes = gerenciador['residentes']
+    sessao = residentes.get(id_sessao)
+    if sessao is not None:
+        residentes.move_to_end(id_sessao)
+        gerenciador['acertos'] += 1
+        return sessao
+
+    gerenciador['falhas'] += 1
+    caminho = caminho_sessao(gerenciador, id_sessao)
+    if os.path.exists(caminho):
+        historico, memoria, linhas = carregar_estado_sessao(caminho)
+        gerenciador['restauradas'] += 1
+    else:
+        historico, memoria, linhas = array('d'), MemoriaSlots(), 0
+
+    sessao = {'memoria': memoria, 'historico': historico, 'linhas': linhas}
+    residentes[id_sessao] = sessao
+    atualizar_tamanho(gerenciador, id_sessao, tamanho_sessao(sessao))
+    return sessao
+
+def atualizar_tamanho(gerenciador, id_sessao, novo):
+    """
+    registra o tamanho da sessão e despeja outras se o orçamento estourar
+
+    a sessão informada nunca é despejada aqui, mesmo que sozinha exceda o
+    orçamento.
+
+    Args:
+        gerenciador (dict): gerenciador de sessões
+        id_sessao: sessão residente
+        novo (int): tamanho atual da sessão (ver tamanho_sessao)
+    """
+    gerenciador['bytes'] += novo - gerenciador['tamanhos'].get(id_sessao, 0)
+    gerenciador['tamanhos'][id_sessao] = novo
+
+    residentes = gerenciador['residentes']
+    while gerenciador['bytes'] > gerenciador['orcamento'] and len(residentes) > 1:
+        mais_antiga = next(iter(residentes))
+        if mais_antiga == id_sessao:
+            residentes.move_to_end(id_sessao)
+            continue
+        despejar_sessao(gerenciador, mais_antiga)
+
+def despejar_sessao(gerenciador, id_sessao):
+    """grava a sessão em disco e a remove da memória"""
+    sessao = gerenciador['residentes'].pop(id_sessao)
+    salvar_sessao(caminho_sessao(gerenciador, id_sessao), sessao['historico'], sessao['memoria'],
+                  sessao['linhas'])
+    gerenciador['bytes'] -= gerenciador['tamanhos'].pop(id_sessao)
+    gerenciador['despejos'] += 1
+
+def executar_na_sessao(gerenciador, id_sessao, linha):
+    """
+    avalia uma linha na sessão (mesma semântica e resposta de src.servidor)
+
+    o tamanho da sessão é atualizado pelo que a linha acrescentou (um
+    resultado no histórico e os slots novos, sempre no fim da tabela), sem
+    percorrer a memória inteira.
+
+    Returns:
+        dict: {'linha': n, 'resultado': valor} ou {'linha': n, 'erro': {...}}
+    """
+    sessao = obter_sessao(gerenciador, id_sessao)
+    tabela = sessao['memoria'].tabela
+    historico_antes = len(sessao['historico'])
+    slots_antes = len(tabela)
+
+    resposta = avaliar_linha(sessao, linha)
+
+    novos = islice(reversed(tabela), len(tabela) - slots_antes)
+    crescimento = 8 * (len(sessao['historico']) - historico_antes) + tamanho_nomes(novos)
+    atualizar_tamanho(gerenciador, id_sessao, gerenciador['tamanhos'][id_sessao] + crescimento)
+    return resposta
+
+def descartar_sessao(gerenciador, id_sessao):
+    """remove a sessão da memória e do disco"""
+    if id_sessao in gerenciador['residentes']:
+        del gerenciador['residentes'][id_sessao]
+        gerenciador['bytes'] -= gerenciador['tamanhos'].pop(id_sessao)
+
+    caminho = caminho_sessao(gerenciador, id_sessao)
+    if os.path.exists(caminho):
+        os.unlink(caminho)
+
+def despejar_todas(gerenciador):
+    """grava todas as sessões residentes (ex.: antes de encerrar o processo)"""
+    for id_sessao in list(gerenciador['residentes']):
+        despejar_sessao(gerenciador, id_sessao)
+
+def estatisticas_gerenciador(gerenciador):
+    """
+    resume o estado do gerenciador
+
+    Returns:
+        dict: residentes, bytes residentes, orçamento, acertos, falhas,
+            taxa de acerto, restaurações e despejos
+    """
+    acessos = gerenciador['acertos'] + gerenciador['falhas']
+    return {
+        'residentes': len(gerenciador['residentes']),
+        'bytes': gerenciador['bytes'],
+        'orcamento': gerenciador['orcamento'],
+        'acertos': gerenciador['acertos'],
+        'falhas': gerenciador['falhas'],
+        'taxa_acerto': gerenciador['acertos'] / acessos if acessos else 0.0,
+        'restauradas': gerenciador['restauradas'],
+        'despejos': gerenciador['despejos']
+    }
+
+if __name__ == '__main__':
+    import random
+    import tempfile
+
+    gerador = random.Random(38)
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        gerenciador = criar_gerenciador(diretorio, orcamento_bytes=2048)
+
+        for _ in range(20000):
+            # poucos clientes concentram a maior parte dos acessos
+            cliente = f"cliente{min(int(gerador.paretovariate(1.2)), 2000)}"
+            executar_na_sessao(gerenciador, cliente, "((X 1 +) X)")
+
+        print(estatisticas_gerenciador(gerenciador))
@@ -2,9 +2,15 @@
 
 import sys
 import os
+import json
+import hashlib
+import marshal
+from array import array
+from collections import deque
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.token_types import *
+from src.operadores import OPERADORES
 
 class GramaticaError(Exception):
     """exceção para erros na gramática"""
@@ -12,14 +18,28 @@ class GramaticaError(Exception):
         self.mensagem = mensagem
         super().__init__(f"Erro na gramática: {mensagem}")
 
-def construir_gramatica():
+# muda quando o formato dos artefatos (first, follow, tabela) muda
+VERSAO_GRAMATICA = 2
+MAGICA_CACHE = b'RPNG'
+DIRETORIO_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__rpncache__')
+
+# entradas vazias da tabela compilada; 'h' limita a 32767 produções
+SEM_PRODUCAO = -1
+MAXIMO_PRODUCOES = 32767
+
+# gramáticas já construídas neste processo, por chave das produções
+_gramaticas_carregadas = {}
+# gramática RPN já construída, por operadores registrados (evita até o hash)
+_gramatica_rpn = {}
+
+def definir_producoes():
     """
     define regras de produção da gramática RPN
     
     Returns:
-        dict: estrutura com produções, first, follow e tabela LL(1)
+        dict: não_terminal -> lista de produções
     """
-    gramatica = {
+    return {
         'PROGRAMA': [
             ['EXPRESSAO']
         ],
@@ -64,14 +84,7 @@ def construir_gramatica():
             ['identificador'],
             ['EXPRESSAO']
         ],
-        'OPERADOR_ARIT': [
-            ['+'],
-            ['-'],
-            ['*'],
-            ['/'],
-            ['%'],
-            ['^']
-        ],
+        'OPERADOR_ARIT': [[simbolo] for simbolo in OPERADORES],
         'OPERADOR_REL': [
             ['>'],
             ['<'],
@@ -81,10 +94,23 @@ def construir_gramatica():
             ['<=']
         ]
     }
+
+def calcular_artefatos(gramatica):
+    """
+    calcula FIRST, FOLLOW e tabela LL(1) das produções
     
-    # calcular conjuntos FIRST e FOLLOW
-    first = calcular_all_first(gramatica)
-    follow = calcular_all_follow(gramatica, first)
+    Args:
+        gramatica (dict): produções da gramática
+        
+    Returns:
+        dict: estrutura com produções, first, follow e tabela LL(1)
+    """
+    # calcular conjuntos FIRST e FOLLOW (em bits, decodificados no fim)
+    simbolos, bits = numerar_terminais(gramatica)
+    first_bits = calcular_first_bits(gramatica, bits)
+    follow_bits = calcular_follow_bits(gramatica, first_bits, bits)
+    first = {nao_terminal: bits_para_conjunto(valor, simbolos) for nao_terminal, valor in first_bits.items()}
+    follow = {nao_terminal: bits_para_conjunto(valor, simbolos) for nao_terminal, valor in follow_bits.items()}
     
     # construir tabela LL(1)
     tabela = construir_tabela_ll1(gramatica, first, follow)
@@ -101,18 +127,270 @@ def construir_gramatica():
         'tabela': tabela
     }
 
+def chave_gramatica(gramatica):
+    """hash das produções (na ordem: a primeira produção vence conflitos) e da versão"""
+    resumo = hashlib.sha256()
+    resumo.update(f"{VERSAO_GRAMATICA}:".encode('utf-8'))
+    resumo.update(json.dumps(list(gramatica.items()), ensure_ascii=False).encode('utf-8'))
+    return resumo.hexdigest()
+
+def caminho_cache_gramatica(diretorio_cache, chave):
+    """arquivo de cache dos artefatos da gramática"""
+    return os.path.join(diretorio_cache, f"gramatica-{chave}.bin")
+
+def ler_cache_gramatica(caminho):
+    """lê artefatos do cache, ou None se ausente/incompatível"""
+    try:
+        with open(caminho, 'rb') as arquivo:
+            dados = arquivo.read()
+    except OSError:
+        return None
+
+    if not dados.startswith(MAGICA_CACHE):
+        return None
+    try:
+        artefatos = marshal.loads(dados[len(MAGICA_CACHE):])
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(artefatos, dict) or set(artefatos) != {'producoes', 'first', 'follow', 'tabela'}:
+        return None
+    return artefatos
+
+def gravar_cache_gramatica(caminho, artefatos):
+    """
+    grava artefatos no cache (arquivo temporário + renomeação)
+    
+    falhas de escrita (diretório sem permissão, disco cheio) são ignoradas:
+    o cache só evita recálculo
+    """
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(temporario, 'wb') as arquivo:
+            arquivo.write(MAGICA_CACHE)
+            arquivo.write(marshal.dumps(artefatos))
+        os.replace(temporario, caminho)
+    except OSError:
+        try:
+            os.remove(temporario)
+        except OSError:
+            pass
+
+def carregar_gramatica(gramatica, diretorio_cache=None):
+    """
+    obtém os artefatos LL(1) de um conjunto de produções
+    
+    ordem de busca: gramáticas já construídas no processo, cache em disco e,
+    por fim, cálculo (que alimenta os dois caches). conflitos só são
+    reportados no cálculo.
+    
+    Args:
+        gramatica (dict): produções da gramática
+        diretorio_cache (str): diretório do cache; padrão src/__rpncache__
+        
+    Returns:
+        dict: estrutura com produções, first, follow, tabela LL(1) e
+            tabela_compilada (compilar_tabela_ll1), compartilhada entre
+            chamadas (não modificar)
+    """
+    chave = chave_gramatica(gramatica)
+    artefatos = _gramaticas_carregadas.get(chave)
+    if artefatos is not None:
+        return artefatos
+    
+    if diretorio_cache is None:
+        diretorio_cache = DIRETORIO_CACHE
+    arquivo_cache = caminho_cache_gramatica(diretorio_cache, chave)
+    
+    artefatos = ler_cache_gramatica(arquivo_cache)
+    if artefatos is None:
+        artefatos = calcular_artefatos(gramatica)
+        gravar_cache_gramatica(arquivo_cache, artefatos)
+    # array não passa por marshal; compilar a partir da tabela é barato
+    artefatos['tabela_compilada'] = compilar_tabela_ll1(artefatos['producoes'], artefatos['tabela'])
+    
+    _gramaticas_carregadas[chave] = artefatos
+    return artefatos
+
+def construir_gramatica(diretorio_cache=None):
+    """
+    gramática RPN com FIRST, FOLLOW e tabela LL(1)
+    
+    Args:
+        diretorio_cache (str): diretório do cache em disco (ver
+            carregar_gramatica)
+        
+    Returns:
+        dict: estrutura com produções, first, follow e tabela LL(1)
+    """
+    # as produções só variam com o registro de operadores
+    chave = (tuple(OPERADORES), diretorio_cache)
+    artefatos = _gramatica_rpn.get(chave)
+    if artefatos is None:
+        artefatos = carregar_gramatica(definir_producoes(), diretorio_cache)
+        _gramatica_rpn[chave] = artefatos
+    return artefatos
+
 def eh_terminal(simbolo):
     """verifica se símbolo é terminal (minúscula ou símbolo especial)"""
     if not simbolo:
         return False
-    return simbolo[0].islower() or simbolo in ['+', '-', '*', '/', '%', '^', 
-                                                 '(', ')', '>', '<', '==', '!=', 
-                                                 '>=', '<=', 'RES', 'IF', 'WHILE']
+    return simbolo[0].islower() or simbolo in OPERADORES or simbolo in ['(', ')', '>', '<', '==', '!=',
+                                                                       '>=', '<=', 'RES', 'IF', 'WHILE']
 
 def eh_nao_terminal(simbolo):
     """verifica se símbolo é não-terminal (maiúscula)"""
     return simbolo and simbolo[0].isupper() and simbolo not in ['RES', 'IF', 'WHILE']
 
+EPSILON = 'ε'
+FIM = '$'
+
+def numerar_terminais(gramatica):
+    """
+    atribui uma posição de bit a cada terminal das produções
+    
+    ε fica no bit 0 e $ no bit 1; os demais seguem a ordem de aparição.
+    
+    Args:
+        gramatica (dict): produções da gramática
+        
+    Returns:
+        tuple: (símbolos por bit, dict símbolo -> bit)
+    """
+    simbolos = [EPSILON, FIM]
+    bits = {EPSILON: 0, FIM: 1}
+    for producoes in gramatica.values():
+        for producao in producoes:
+            for simbolo in producao:
+                if simbolo not in bits and simbolo not in gramatica and eh_terminal(simbolo):
+                    bits[simbolo] = len(simbolos)
+                    simbolos.append(simbolo)
+    return simbolos, bits
+
+def bits_para_conjunto(valor, simbolos):
+    """decodifica um conjunto de terminais representado como int"""
+    conjunto = set()
+    while valor:
+        menor = valor & -valor
+        conjunto.add(simbolos[menor.bit_length() - 1])
+        valor ^= menor
+    return conjunto
+
+def first_sequencia_bits(sequencia, first_bits, bits):
+    """
+    FIRST de uma sequência de símbolos (bit de ε se todos derivam ε)
+    
+    não-terminais sem produções têm FIRST vazio e interrompem a sequência
+    """
+    resultado = 0
+    for simbolo in sequencia:
+        if simbolo in first_bits:
+            first_simbolo = first_bits[simbolo]
+            resultado |= first_simbolo & ~1
+            if not first_simbolo & 1:
+                return resultado
+        elif simbolo in bits:
+            return resultado | (1 << bits[simbolo])
+        else:
+            return resultado
+    return resultado | 1
+
+def calcular_first_bits(gramatica, bits):
+    """
+    FIRST de todos os não-terminais por ponto fixo com lista de trabalho
+    
+    cada não-terminal é recalculado quando o FIRST de um não-terminal usado
+    nas suas produções cresce; os conjuntos só crescem, então termina mesmo
+    com recursão (direta, mútua ou à esquerda).
+    
+    Args:
+        gramatica (dict): produções da gramática
+        bits (dict): símbolo terminal -> bit (numerar_terminais)
+        
+    Returns:
+        dict: não_terminal -> int com os bits do FIRST
+    """
+    first_bits = dict.fromkeys(gramatica, 0)
+    dependentes = {nao_terminal: set() for nao_terminal in gramatica}
+    for nao_terminal, producoes in gramatica.items():
+        for producao in producoes:
+            for simbolo in producao:
+                if simbolo in dependentes:
+                    dependentes[simbolo].add(nao_terminal)
+    
+    # fila (FIFO): um não-terminal espera os outros pendentes antes de ser
+    # recalculado, o que evita boa parte das reavaliações
+    pendentes = deque(gramatica)
+    na_lista = set(pendentes)
+    while pendentes:
+        nao_terminal = pendentes.popleft()
+        na_lista.discard(nao_terminal)
+        novo = 0
+        for producao in gramatica[nao_terminal]:
+            novo |= first_sequencia_bits(producao, first_bits, bits)
+        if novo != first_bits[nao_terminal]:
+            first_bits[nao_terminal] = novo
+            for dependente in dependentes[nao_terminal]:
+                if dependente not in na_lista:
+                    na_lista.add(dependente)
+                    pendentes.append(dependente)
+    
+    return first_bits
+
+def calcular_follow_bits(gramatica, first_bits, bits, inicial=None):
+    """
+    FOLLOW de todos os não-terminais por ponto fixo com lista de trabalho
+    
+    a parte que vem dos símbolos seguintes (FIRST do sufixo) é calculada uma
+    vez; depois FOLLOW(A) é propagado para cada não-terminal que termina uma
+    produção de A (ou é seguido só de símbolos que derivam ε).
+    
+    Args:
+        gramatica (dict): produções da gramática
+        first_bits (dict): FIRST em bits (calcular_first_bits)
+        bits (dict): símbolo terminal -> bit (numerar_terminais)
+        inicial (str): símbolo inicial, que recebe $; padrão PROGRAMA ou,
+            se não existir, o primeiro não-terminal
+        
+    Returns:
+        dict: não_terminal -> int com os bits do FOLLOW
+    """
+    follow_bits = dict.fromkeys(gramatica, 0)
+    if inicial is None:
+        inicial = 'PROGRAMA' if 'PROGRAMA' in gramatica else next(iter(gramatica), None)
+    if inicial in follow_bits:
+        follow_bits[inicial] = 1 << bits[FIM]
+    # arestas A -> X: FOLLOW(X) contém FOLLOW(A)
+    sucessores = {nao_terminal: set() for nao_terminal in gramatica}
+    
+    for nao_terminal, producoes in gramatica.items():
+        for producao in producoes:
+            # percorre da direita: resto é o FIRST do sufixo após o símbolo
+            resto = 1
+            for simbolo in reversed(producao):
+                if simbolo in follow_bits:
+                    follow_bits[simbolo] |= resto & ~1
+                    if resto & 1 and simbolo != nao_terminal:
+                        sucessores[nao_terminal].add(simbolo)
+                first_simbolo = first_sequencia_bits((simbolo,), first_bits, bits)
+                resto = (first_simbolo & ~1) | resto if first_simbolo & 1 else first_simbolo
+    
+    pendentes = deque(gramatica)
+    na_lista = set(pendentes)
+    while pendentes:
+        nao_terminal = pendentes.popleft()
+        na_lista.discard(nao_terminal)
+        follow_nao_terminal = follow_bits[nao_terminal]
+        for sucessor in sucessores[nao_terminal]:
+            novo = follow_bits[sucessor] | follow_nao_terminal
+            if novo != follow_bits[sucessor]:
+                follow_bits[sucessor] = novo
+                if sucessor not in na_lista:
+                    na_lista.add(sucessor)
+                    pendentes.append(sucessor)
+    
+    return follow_bits
+
 def calcular_first(simbolo, gramatica, memo=None):
     """
     calcula conjunto FIRST para um símbolo
@@ -120,63 +398,23 @@ def calcular_first(simbolo, gramatica, memo=None):
     Args:
         simbolo (str): símbolo da gramática
         gramatica (dict): produções da gramática
-        memo (dict): memoização para evitar recálculo
+        memo (dict): FIRST já calculados, preenchido com todos os
+            não-terminais na primeira chamada
         
     Returns:
         set: conjunto FIRST do símbolo
     """
-    if memo is None:
-        memo = {}
-    
-    if simbolo in memo:
+    if memo is not None and simbolo in memo:
         return memo[simbolo]
     
-    first = set()
-    
     # terminal: FIRST é o próprio símbolo
-    if eh_terminal(simbolo):
-        first.add(simbolo)
-        memo[simbolo] = first
-        return first
-    
-    # não-terminal: analisar produções
-    if simbolo not in gramatica:
-        memo[simbolo] = first
-        return first
-    
-    for producao in gramatica[simbolo]:
-        if not producao:  # produção vazia (epsilon)
-            first.add('ε')
-            continue
-        
-        # analisar primeiro símbolo da produção
-        primeiro = producao[0]
-        
-        if eh_terminal(primeiro):
-            first.add(primeiro)
-        else:
-            # recursivamente adicionar FIRST do não-terminal
-            first_primeiro = calcular_first(primeiro, gramatica, memo)
-            first.update(first_primeiro - {'ε'})
-            
-            # se primeiro pode derivar epsilon, analisar próximos símbolos
-            if 'ε' in first_primeiro:
-                for i in range(1, len(producao)):
-                    simbolo_atual = producao[i]
-                    if eh_terminal(simbolo_atual):
-                        first.add(simbolo_atual)
-                        break
-                    else:
-                        first_atual = calcular_first(simbolo_atual, gramatica, memo)
-                        first.update(first_atual - {'ε'})
-                        if 'ε' not in first_atual:
-                            break
-                else:
-                    # todos derivam epsilon
-                    first.add('ε')
+    if simbolo not in gramatica and eh_terminal(simbolo):
+        return {simbolo}
     
-    memo[simbolo] = first
-    return first
+    first = calcular_all_first(gramatica)
+    if memo is not None:
+        memo.update(first)
+    return first.get(simbolo, set())
 
 def calcular_all_first(gramatica):
     """
@@ -188,13 +426,14 @@ def calcular_all_first(gramatica):
     Returns:
         dict: mapeamento não_terminal -> conjunto FIRST
     """
-    first = {}
-    memo = {}
-    
-    for nao_terminal in gramatica:
-        first[nao_terminal] = calcular_first(nao_terminal, gramatica, memo)
-    
-    return first
+    simbolos, bits = numerar_terminais(gramatica)
+    first_bits = calcular_first_bits(gramatica, bits)
+    return {nao_terminal: bits_para_conjunto(valor, simbolos) for nao_terminal, valor in first_bits.items()}
+
+def first_para_bits(first, bits):
+    """codifica conjuntos FIRST (dict de sets) em ints"""
+    return {nao_terminal: sum(1 << bits[simbolo] for simbolo in conjunto if simbolo in bits)
+            for nao_terminal, conjunto in first.items()}
 
 def calcular_follow(nao_terminal, gramatica, first, memo=None):
     """
@@ -204,68 +443,19 @@ def calcular_follow(nao_terminal, gramatica, first, memo=None):
         nao_terminal (str): não-terminal alvo
         gramatica (dict): produções da gramática
         first (dict): conjuntos FIRST
-        memo (dict): memoização
+        memo (dict): FOLLOW já calculados, preenchido com todos os
+            não-terminais na primeira chamada
         
     Returns:
         set: conjunto FOLLOW do não-terminal
     """
-    if memo is None:
-        memo = {}
-    
-    if nao_terminal in memo:
+    if memo is not None and nao_terminal in memo:
         return memo[nao_terminal]
     
-    follow = set()
-    
-    # símbolo inicial tem $ no FOLLOW
-    if nao_terminal == 'PROGRAMA':
-        follow.add('$')
-    
-    # analisar todas as produções
-    for nt, producoes in gramatica.items():
-        for producao in producoes:
-            for i, simbolo in enumerate(producao):
-                if simbolo == nao_terminal:
-                    # encontrou o não-terminal na produção
-                    
-                    # se há símbolo após, adicionar FIRST dele
-                    if i + 1 < len(producao):
-                        proximo = producao[i + 1]
-                        
-                        if eh_terminal(proximo):
-                            follow.add(proximo)
-                        else:
-                            # adicionar FIRST do próximo (sem epsilon)
-                            follow.update(first.get(proximo, set()) - {'ε'})
-                            
-                            # se próximo deriva epsilon, continuar
-                            if 'ε' in first.get(proximo, set()):
-                                # verificar símbolos seguintes
-                                j = i + 2
-                                while j < len(producao):
-                                    simbolo_seguinte = producao[j]
-                                    if eh_terminal(simbolo_seguinte):
-                                        follow.add(simbolo_seguinte)
-                                        break
-                                    else:
-                                        follow.update(first.get(simbolo_seguinte, set()) - {'ε'})
-                                        if 'ε' not in first.get(simbolo_seguinte, set()):
-                                            break
-                                    j += 1
-                                else:
-                                    # chegou ao fim da produção
-                                    if nt != nao_terminal:
-                                        # adicionar FOLLOW do lado esquerdo
-                                        follow_nt = calcular_follow(nt, gramatica, first, memo)
-                                        follow.update(follow_nt)
-                    else:
-                        # está no final da produção
-                        if nt != nao_terminal:
-                            follow_nt = calcular_follow(nt, gramatica, first, memo)
-                            follow.update(follow_nt)
-    
-    memo[nao_terminal] = follow
-    return follow
+    follow = calcular_all_follow(gramatica, first)
+    if memo is not None:
+        memo.update(follow)
+    return follow.get(nao_terminal, set())
 
 def calcular_all_follow(gramatica, first):
     """
@@ -278,13 +468,9 @@ def calcular_all_follow(gramatica, first):
     Returns:
         dict: mapeamento não_terminal -> conjunto FOLLOW
     """
-    follow = {}
-    memo = {}
-    
-    for nao_terminal in gramatica:
-        follow[nao_terminal] = calcular_follow(nao_terminal, gramatica, first, memo)
-    
-    return follow
+    simbolos, bits = numerar_terminais(gramatica)
+    follow_bits = calcular_follow_bits(gramatica, first_para_bits(first, bits), bits)
+    return {nao_terminal: bits_para_conjunto(valor, simbolos) for nao_terminal, valor in follow_bits.items()}
 
 def construir_tabela_ll1(gramatica, first, follow):
     """
@@ -383,6 +569,87 @@ def obter_producao(tabela, nao_terminal, terminal):
     return producoes[0] if producoes else None
 
 
+def compilar_tabela_ll1(gramatica, tabela):
+    """
+    converte a tabela LL(1) para a forma densa, indexada por inteiros
+    
+    terminais recebem ids 0..n_terminais-1 ($ é o 0) e não-terminais os ids
+    seguintes, na ordem das produções. as produções viram tuplas de ids e a
+    tabela um array('h') com o índice da produção (ou SEM_PRODUCAO) em
+    nao_terminal * n_terminais + terminal, onde nao_terminal conta a partir
+    de 0. em conflitos vale a primeira produção, como em obter_producao.
+    a estrutura só tem tuplas, dicts e um array: vai por pickle em poucos
+    bytes para processos trabalhadores.
+    
+    Args:
+        gramatica (dict): produções da gramática
+        tabela (dict): tabela LL(1) (construir_tabela_ll1)
+        
+    Returns:
+        dict: terminais, nao_terminais, n_terminais, producoes (tuplas de
+            ids), lados (id do não-terminal de cada produção) e entradas
+            (array('h')); o id de um símbolo é sua posição em
+            terminais + nao_terminais (indexar_simbolos)
+        
+    Raises:
+        GramaticaError: símbolo sem produções ou mais produções do que
+            cabem em 'h'
+    """
+    simbolos, _ = numerar_terminais(gramatica)
+    terminais = tuple(simbolos[1:])  # sem ε
+    nao_terminais = tuple(gramatica)
+    n_terminais = len(terminais)
+    ids = {simbolo: id_simbolo for id_simbolo, simbolo in enumerate(terminais + nao_terminais)}
+    
+    producoes = []
+    lados = []
+    primeira_producao = {}
+    for indice_nt, nao_terminal in enumerate(nao_terminais):
+        primeira_producao[nao_terminal] = len(producoes)
+        for producao in gramatica[nao_terminal]:
+            for simbolo in producao:
+                if simbolo not in ids:
+                    raise GramaticaError(f"Não-terminal sem produções: {simbolo}")
+            producoes.append(tuple(ids[simbolo] for simbolo in producao))
+            lados.append(n_terminais + indice_nt)
+    if len(producoes) > MAXIMO_PRODUCOES:
+        raise GramaticaError(f"Gramática com {len(producoes)} produções; a tabela compilada aceita "
+                             f"até {MAXIMO_PRODUCOES}")
+    
+    entradas = array('h', [SEM_PRODUCAO]) * (len(nao_terminais) * n_terminais)
+    for indice_nt, nao_terminal in enumerate(nao_terminais):
+        for terminal, candidatas in tabela.get(nao_terminal, {}).items():
+            if candidatas and terminal in ids:
+                indice = primeira_producao[nao_terminal] + gramatica[nao_terminal].index(candidatas[0])
+                entradas[indice_nt * n_terminais + ids[terminal]] = indice
+    
+    return {
+        'terminais': terminais,
+        'nao_terminais': nao_terminais,
+        'n_terminais': n_terminais,
+        'producoes': tuple(producoes),
+        'lados': tuple(lados),
+        'entradas': entradas
+    }
+
+def indexar_simbolos(compilada):
+    """dict símbolo -> id da tabela compilada (não vai junto no pickle)"""
+    return {simbolo: id_simbolo
+            for id_simbolo, simbolo in enumerate(compilada['terminais'] + compilada['nao_terminais'])}
+
+def obter_producao_compilada(compilada, nao_terminal, terminal):
+    """
+    obtém produção da tabela compilada: um único acesso ao array
+    
+    Args:
+        compilada (dict): tabela compilada (compilar_tabela_ll1)
+        nao_terminal (int): índice do não-terminal (id - n_terminais)
+        terminal (int): id do terminal (lookahead)
+        
+    Returns:
+        int: índice em compilada['producoes'] ou SEM_PRODUCAO
+    """
+    return compilada['entradas'][nao_terminal * compilada['n_terminais'] + terminal]
 
 if __name__ == '__main__':
     # teste da gramática
@@ -409,6 +676,11 @@ if __name__ == '__main__':
             for terminal, prod in resultado['tabela'][nt].items():
                 print(f"  [{nt}, {terminal}] -> {' '.join(prod[0]) if prod[0] else 'ε'}")
         
+        compilada = resultado['tabela_compilada']
+        print(f"\nTABELA COMPILADA: {len(compilada['nao_terminais'])} não-terminais x "
+              f"{compilada['n_terminais']} terminais, {len(compilada['producoes'])} produções, "
+              f"{compilada['entradas'].itemsize * len(compilada['entradas'])} bytes")
+        
         print("\n✓ Gramática LL(1) válida!")
         
     except GramaticaError as e:
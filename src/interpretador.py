@@ -0,0 +1,1048 @@
+# interpretador da árvore sintática com suporte a IF e WHILE
+# a árvore é compilada uma única vez em código linear (instruções e saltos),
+# executado por um laço sem recursão nem revalidação a cada iteração.
+# sequências frequentes viram superinstruções (fundir_instrucoes) e ^
+# genérico é acelerado durante a execução depois de observar expoentes
+# inteiros (aquecimento)
+
+import sys
+import os
+import math
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.executor import ExecutorError, executar_operacao, gerenciar_resultado, formatar_resultado
+from src.operadores import OPERADORES
+from src.memoria import MemoriaSlots
+from src.parser import parsear
+from src.syntax_tree import gerar_arvore
+from src.control_structures import FUNCOES_RELACIONAIS, RELACOES_INVERTIDAS
+from src.otimizador import (otimizar_arvore, arvore_para_tokens, subexpressoes_invariantes,
+                            identificadores_escritos, valor_constante)
+from src.perfil import registrar_linha, texto_tokens
+from src.memoizacao import (iniciar_execucao, analisar_linha, montar_chave,
+                            consultar_cache, registrar_no_cache, invalidar_escritas)
+from src.limites import (criar_limites, iniciar_limites, verificar_limites, verificar_expoente,
+                         verificar_profundidade)
+
+# códigos de operação; cada instrução é uma tupla (op, a, b)
+OP_CONST = 0            # empilha a
+OP_CARREGAR = 1         # empilha valor do slot a
+OP_ARMAZENAR = 2        # grava topo no slot a (mantém na pilha)
+OP_SOMAR = 3
+OP_SUBTRAIR = 4
+OP_MULTIPLICAR = 5
+OP_ARIT = 6             # operador a via executar_operacao; em ^, b conta expoentes inteiros seguidos
+OP_RES = 7              # empilha resultado a linhas atrás
+OP_TESTAR = 8           # desempilha dois valores; salta para b se a(x, y) é falso
+OP_SALTAR = 9           # salta para a
+OP_DESCARTAR = 10       # remove topo da pilha
+OP_GUARDAR = 11         # copia topo para o temporário a (subexpressão comum)
+OP_TEMPORARIO = 12      # empilha o temporário a
+# instruções geradas só com otimização de laços
+OP_TESTAR_K = 13        # desempilha x; salta para b se a[0](x, a[1]) é falso (a[1] constante)
+OP_ENTRAR = 14          # copia os slots a da memória para registradores
+OP_SAIR = 15            # devolve os registradores dos slots a para a memória
+OP_CARREGAR_REG = 16    # empilha registrador do slot a
+OP_ARMAZENAR_REG = 17   # grava topo no registrador do slot a (mantém na pilha)
+# operações sem executar_operacao; a é a mensagem de erro para divisor zero
+OP_DIVIDIR = 18
+OP_RESTO = 19
+OP_POTENCIA_INT = 20    # ^ com expoente inteiro: o resultado nunca é complexo
+# instrução instalada durante a execução (aquecimento de OP_ARIT ^)
+OP_POTENCIA_Q = 21      # POTENCIA_INT com guarda: expoente fracionário volta a ARIT
+# superinstruções (fundir_instrucoes); b = (funcao, k, simbolo) com k constante
+OP_CONST_OP = 22        # topo = funcao(topo, a); b = (funcao, simbolo)
+OP_CARREGAR_OP = 23     # empilha funcao(slot a, k)
+OP_REG_OP = 24          # empilha funcao(registrador a, k)
+OP_RES_OP = 25          # empilha funcao(resultado a linhas atrás, k)
+
+NOMES_OPERACOES = {
+    OP_CONST: 'CONST',
+    OP_CARREGAR: 'CARREGAR',
+    OP_ARMAZENAR: 'ARMAZENAR',
+    OP_SOMAR: 'SOMAR',
+    OP_SUBTRAIR: 'SUBTRAIR',
+    OP_MULTIPLICAR: 'MULTIPLICAR',
+    OP_ARIT: 'ARIT',
+    OP_RES: 'RES',
+    OP_TESTAR: 'TESTAR',
+    OP_SALTAR: 'SALTAR',
+    OP_DESCARTAR: 'DESCARTAR',
+    OP_GUARDAR: 'GUARDAR',
+    OP_TEMPORARIO: 'TEMPORARIO',
+    OP_TESTAR_K: 'TESTAR_K',
+    OP_ENTRAR: 'ENTRAR',
+    OP_SAIR: 'SAIR',
+    OP_CARREGAR_REG: 'CARREGAR_REG',
+    OP_ARMAZENAR_REG: 'ARMAZENAR_REG',
+    OP_DIVIDIR: 'DIVIDIR',
+    OP_RESTO: 'RESTO',
+    OP_POTENCIA_INT: 'POTENCIA_INT',
+    OP_POTENCIA_Q: 'POTENCIA_Q',
+    OP_CONST_OP: 'CONST_OP',
+    OP_CARREGAR_OP: 'CARREGAR_OP',
+    OP_REG_OP: 'REG_OP',
+    OP_RES_OP: 'RES_OP'
+}
+
+OPERACOES_DIRETAS = {
+    '+': OP_SOMAR,
+    '-': OP_SUBTRAIR,
+    '*': OP_MULTIPLICAR,
+    '/': OP_DIVIDIR,
+    '%': OP_RESTO
+}
+
+# operadores que preservam valores inteiros (^ só com expoente literal não negativo)
+OPERACOES_INTEIRAS = ('+', '-', '*', '%')
+
+# contador do perfil (src.perfil) correspondente a cada instrução
+CONTADORES_PERFIL = {
+    OP_CARREGAR: 'mem_leituras',
+    OP_ARMAZENAR: 'mem_escritas',
+    OP_CARREGAR_REG: 'mem_leituras',
+    OP_ARMAZENAR_REG: 'mem_escritas',
+    OP_RES: 'res',
+    OP_CARREGAR_OP: 'mem_leituras',
+    OP_REG_OP: 'mem_leituras',
+    OP_RES_OP: 'res'
+}
+
+# instrução que empilha o primeiro operando -> superinstrução com "k op"
+FUSOES_OPERANDO = {
+    OP_CARREGAR: OP_CARREGAR_OP,
+    OP_CARREGAR_REG: OP_REG_OP,
+    OP_RES: OP_RES_OP
+}
+
+# execuções de ^ com expoente inteiro antes de instalar POTENCIA_Q
+LIMIAR_AQUECIMENTO = 8
+
+def gerar_arvores(expressoes_tokens):
+    """
+    gera as árvores sintáticas de uma lista de expressões tokenizadas
+
+    Args:
+        expressoes_tokens (list): lista de listas de tokens
+
+    Returns:
+        list: árvores sintáticas, uma por expressão
+    """
+    # o parser descendente não consulta a tabela LL(1)
+    return [gerar_arvore(parsear(tokens, None)['derivacao']) for tokens in expressoes_tokens]
+
+def compilar_arvore(arvore, memoria, otimizar_lacos=False, inteiros=None):
+    """
+    compila uma árvore sintática em código linear
+
+    Args:
+        arvore (dict): raiz da árvore (gerada por syntax_tree.gerar_arvore)
+        memoria (MemoriaSlots): memória onde os identificadores recebem slots
+        otimizar_lacos (bool): em cada WHILE, calcula as subexpressões
+            invariantes antes do laço, especializa testes contra constante
+            e mantém as células escritas no laço em registradores
+        inteiros (set): slots que só guardam valores inteiros durante a
+            execução (ver inferir_inteiros); None trata toda célula como real
+
+    Returns:
+        list: instruções (op, a, b)
+
+    Raises:
+        ExecutorError: para nós desconhecidos ou mal formados
+    """
+    codigo = []
+    lacos = criar_estado_lacos() if otimizar_lacos else None
+    compilar_no(arvore, codigo, memoria, lacos, criar_estado_tipos(inteiros))
+    return codigo
+
+def criar_estado_lacos():
+    """
+    cria estado da otimização de laços
+
+    Returns:
+        dict: slots em registradores, nós calculados antes do laço (id do nó
+            -> temporário) e contador de temporários
+    """
+    return {
+        'residentes': set(),
+        'invariantes': {},
+        'contador': 0
+    }
+
+def criar_estado_tipos(inteiros=None):
+    """
+    cria estado da inferência de valores inteiros
+
+    inteiro aqui é o valor (sem parte fracionária, ou inf/nan), não o tipo
+    do Python: a pilha continua em float e o resultado formatado não muda.
+
+    Returns:
+        dict: slots inteiros e, por temporário, se o valor é inteiro
+    """
+    return {
+        'slots': inteiros if inteiros is not None else set(),
+        'temporarios': {}
+    }
+
+def literal_inteiro(no, minimo=None):
+    """o nó é um literal sem parte fracionária (e >= minimo, se informado)?"""
+    valor = valor_constante(no)
+    return valor is not None and valor.is_integer() and (minimo is None or valor >= minimo)
+
+def operacao_inteira(operador, inteiro1, inteiro2, operando2):
+    """
+    a operação com esses operandos dá valor inteiro?
+
+    soma, diferença, produto e resto de inteiros são inteiros (ou inf/nan);
+    potência só com expoente literal não negativo
+    """
+    if operador in OPERACOES_INTEIRAS:
+        return inteiro1 and inteiro2
+    if operador == '^':
+        return inteiro1 and literal_inteiro(operando2, 0)
+    return False
+
+def no_inteiro(no, inteiros):
+    """
+    o valor do nó é sempre inteiro, se os slots em inteiros guardam inteiros?
+
+    conservadora: RES e temporários de subexpressões comuns contam como reais
+    """
+    tipo = no['tipo']
+    filhos = no['filhos']
+    if tipo == 'NUMERO':
+        return literal_inteiro(no)
+    if tipo == 'IDENTIFICADOR':
+        return no['valor'] in inteiros
+    if tipo in ('EXPRESSAO', 'COMANDO_RECUPERAR') and filhos:
+        return no_inteiro(filhos[0], inteiros)
+    if tipo == 'COMANDO_ARMAZENAR':
+        return no_inteiro(filhos[0], inteiros)
+    if tipo == 'OPERACAO':
+        return operacao_inteira(no['valor'], no_inteiro(filhos[0], inteiros), no_inteiro(filhos[1], inteiros),
+                                filhos[1])
+    if tipo == 'DECISAO':
+        return no_inteiro(filhos[1], inteiros) and no_inteiro(filhos[2], inteiros)
+    if tipo == 'LACO':
+        return no_inteiro(filhos[1], inteiros)
+    return False
+
+def inferir_inteiros(arvores, memoria):
+    """
+    slots que guardam só valores inteiros durante todo o programa
+
+    ponto fixo: começa com todas as células cujo valor atual é inteiro e
+    remove as que recebem, em alguma linha, um valor que pode ser
+    fracionário, até nada mudar
+
+    Args:
+        arvores (list): árvores do programa inteiro
+        memoria (MemoriaSlots): memória inicial
+
+    Returns:
+        set: slots inteiros
+    """
+    armazenamentos = []
+    nomes = set(memoria.tabela)
+    pendentes = list(arvores)
+    while pendentes:
+        no = pendentes.pop()
+        if no['tipo'] == 'IDENTIFICADOR':
+            nomes.add(no['valor'])
+        elif no['tipo'] == 'COMANDO_ARMAZENAR':
+            armazenamentos.append((no['filhos'][1]['valor'], no['filhos'][0]))
+        pendentes.extend(no.get('filhos', []))
+
+    # célula não inicializada vale 0.0
+    inteiros = {nome for nome in nomes if not math.isfinite(memoria.get(nome)) or memoria.get(nome).is_integer()}
+    mudou = True
+    while mudou:
+        mudou = False
+        for nome, valor in armazenamentos:
+            if nome in inteiros and not no_inteiro(valor, inteiros):
+                inteiros.discard(nome)
+                mudou = True
+
+    return {memoria.obter_slot(nome) for nome in inteiros}
+
+def compilar_no(no, codigo, memoria, lacos=None, tipos=None):
+    """
+    emite as instruções de um nó; ao final o valor do nó fica no topo da pilha
+
+    Args:
+        no (dict): nó da árvore
+        codigo (list): lista de instruções em construção
+        memoria (MemoriaSlots): memória para resolução de slots
+        lacos (dict): estado da otimização de laços (None desativa)
+        tipos (dict): estado da inferência de inteiros (criar_estado_tipos)
+
+    Returns:
+        bool: True se o valor do nó é sempre inteiro
+    """
+    if tipos is None:
+        tipos = criar_estado_tipos()
+    tipo = no['tipo']
+    filhos = no['filhos']
+
+    if lacos is not None and id(no) in lacos['invariantes']:
+        # calculado antes do laço
+        temporario = lacos['invariantes'][id(no)]
+        codigo.append((OP_TEMPORARIO, temporario, None))
+        return tipos['temporarios'][temporario]
+
+    if tipo == 'EXPRESSAO':
+        if len(filhos) != 1:
+            raise ExecutorError("Expressão sem conteúdo")
+        inteiro = compilar_no(filhos[0], codigo, memoria, lacos, tipos)
+
+    elif tipo == 'NUMERO':
+        codigo.append((OP_CONST, float(no['valor']), None))
+        inteiro = literal_inteiro(no)
+
+    elif tipo == 'IDENTIFICADOR':
+        slot = memoria.obter_slot(no['valor'])
+        if lacos is not None and slot in lacos['residentes']:
+            codigo.append((OP_CARREGAR_REG, slot, None))
+        else:
+            codigo.append((OP_CARREGAR, slot, None))
+        inteiro = slot in tipos['slots']
+
+    elif tipo == 'COMANDO_RECUPERAR':
+        inteiro = compilar_no(filhos[0], codigo, memoria, lacos, tipos)
+
+    elif tipo == 'COMANDO_ARMAZENAR':
+        valor, identificador = filhos
+        inteiro = compilar_no(valor, codigo, memoria, lacos, tipos)
+        slot = memoria.obter_slot(identificador['valor'])
+        if lacos is not None and slot in lacos['residentes']:
+            codigo.append((OP_ARMAZENAR_REG, slot, None))
+        else:
+            codigo.append((OP_ARMAZENAR, slot, None))
+
+    elif tipo == 'COMANDO_RES':
+        n = int(float(filhos[0]['valor']))
+        codigo.append((OP_RES, n, None))
+        inteiro = False
+
+    elif tipo == 'OPERACAO':
+        inteiro1 = compilar_no(filhos[0], codigo, memoria, lacos, tipos)
+        inteiro2 = compilar_no(filhos[1], codigo, memoria, lacos, tipos)
+        operador = no['valor']
+        if operador in OPERACOES_DIRETAS:
+            codigo.append((OPERACOES_DIRETAS[operador], OPERADORES[operador]['divisor_zero'], None))
+        elif operador == '^' and inteiro2:
+            codigo.append((OP_POTENCIA_INT, None, None))
+        else:
+            # ^ começa a contar expoentes inteiros (aquecimento)
+            codigo.append((OP_ARIT, operador, 0 if operador == '^' else None))
+        inteiro = operacao_inteira(operador, inteiro1, inteiro2, filhos[1])
+
+    elif tipo == 'DECISAO':
+        condicao, bloco_verdadeiro, bloco_falso = filhos
+        teste = compilar_condicao(condicao, codigo, memoria, lacos, tipos)
+        inteiro = compilar_no(bloco_verdadeiro, codigo, memoria, lacos, tipos)
+        salto_fim = len(codigo)
+        codigo.append(None)
+        # condição falsa salta para o bloco falso
+        codigo[teste] = codigo[teste][:2] + (len(codigo),)
+        inteiro = compilar_no(bloco_falso, codigo, memoria, lacos, tipos) and inteiro
+        codigo[salto_fim] = (OP_SALTAR, len(codigo), None)
+
+    elif tipo == 'LACO':
+        condicao, bloco = filhos
+        entrada = ()
+        if lacos is not None:
+            entrada = preparar_laco(no, codigo, memoria, lacos, tipos)
+
+        # valor do laço: resultado da última iteração (0.0 se nenhuma)
+        codigo.append((OP_CONST, 0.0, None))
+        inicio = len(codigo)
+        teste = compilar_condicao(condicao, codigo, memoria, lacos, tipos)
+        codigo.append((OP_DESCARTAR, None, None))
+        inteiro = compilar_no(bloco, codigo, memoria, lacos, tipos)
+        codigo.append((OP_SALTAR, inicio, None))
+        codigo[teste] = codigo[teste][:2] + (len(codigo),)
+
+        if entrada:
+            codigo.append((OP_SAIR, entrada, None))
+            lacos['residentes'].difference_update(entrada)
+
+    elif tipo == 'TEMPORARIO':
+        codigo.append((OP_TEMPORARIO, no['valor'], None))
+        inteiro = tipos['temporarios'].get(no['valor'], False)
+
+    else:
+        raise ExecutorError(f"Nó não executável: {tipo}")
+
+    if 'temporario' in no:
+        # primeira ocorrência de subexpressão comum (ver src.otimizador)
+        codigo.append((OP_GUARDAR, no['temporario'], None))
+        tipos['temporarios'][no['temporario']] = inteiro
+
+    return inteiro
+
+def preparar_laco(laco, codigo, memoria, lacos, tipos=None):
+    """
+    emite a entrada de um laço otimizado: carrega em registradores as
+    células escritas no laço (ainda não residentes) e calcula as
+    subexpressões invariantes, guardadas em temporários
+
+    Returns:
+        tuple: slots carregados, a devolver com OP_SAIR no fim do laço
+    """
+    if tipos is None:
+        tipos = criar_estado_tipos()
+    escritos = {memoria.obter_slot(nome) for nome in identificadores_escritos(laco)}
+    entrada = tuple(sorted(escritos - lacos['residentes']))
+    if entrada:
+        codigo.append((OP_ENTRAR, entrada, None))
+        lacos['residentes'].update(entrada)
+
+    for invariante in subexpressoes_invariantes(laco):
+        if id(invariante) in lacos['invariantes']:
+            continue  # já calculada antes de um laço externo
+        inteiro = compilar_no(invariante, codigo, memoria, lacos, tipos)
+        temporario = f"inv{lacos['contador']}"
+        lacos['contador'] += 1
+        codigo.append((OP_GUARDAR, temporario, None))
+        codigo.append((OP_DESCARTAR, None, None))
+        lacos['invariantes'][id(invariante)] = temporario
+        tipos['temporarios'][temporario] = inteiro
+
+    return entrada
+
+def compilar_condicao(condicao, codigo, memoria, lacos=None, tipos=None):
+    """
+    emite os operandos da condição e um TESTAR com destino pendente
+
+    com otimização de laços, comparação contra literal vira TESTAR_K
+    (um só operando na pilha, constante embutida na instrução).
+
+    Returns:
+        int: índice da instrução TESTAR, a ser corrigida pelo chamador
+    """
+    if condicao['tipo'] != 'CONDICAO' or condicao['valor'] not in FUNCOES_RELACIONAIS:
+        raise ExecutorError(f"Condição inválida: {condicao['valor']}")
+
+    operando1, operando2 = condicao['filhos']
+    relacao = condicao['valor']
+
+    if lacos is not None:
+        constante = valor_constante(operando2)
+        if constante is None and valor_constante(operando1) is not None:
+            operando1, operando2 = operando2, operando1
+            relacao = RELACOES_INVERTIDAS[relacao]
+            constante = valor_constante(operando2)
+        if constante is not None:
+            compilar_no(operando1, codigo, memoria, lacos, tipos)
+            codigo.append((OP_TESTAR_K, (FUNCOES_RELACIONAIS[relacao], constante), None))
+            return len(codigo) - 1
+
+    compilar_no(operando1, codigo, memoria, lacos, tipos)
+    compilar_no(operando2, codigo, memoria, lacos, tipos)
+    codigo.append((OP_TESTAR, FUNCOES_RELACIONAIS[relacao], None))
+    return len(codigo) - 1
+
+def alvos_de_salto(codigo):
+    """índices de destino de SALTAR, TESTAR e TESTAR_K"""
+    alvos = set()
+    for op, a, b in codigo:
+        if op == OP_SALTAR:
+            alvos.add(a)
+        elif op in (OP_TESTAR, OP_TESTAR_K):
+            alvos.add(b)
+    return alvos
+
+def operacao_fundivel(instrucao, k):
+    """
+    (funcao, simbolo) da operação direta que pode ser fundida com a
+    constante k como segundo operando, ou None (divisor zero fica na
+    instrução original, que levanta o erro)
+    """
+    simbolo = next((simbolo for simbolo, op in OPERACOES_DIRETAS.items() if op == instrucao[0]), None)
+    if simbolo is None or (k == 0 and OPERADORES[simbolo]['divisor_zero'] is not None):
+        return None
+    return OPERADORES[simbolo]['avaliar'], simbolo
+
+def fundir_final(saida, origens, alvos):
+    """
+    funde as últimas instruções emitidas se formarem um padrão
+
+    instruções que são destino de salto só podem começar uma superinstrução.
+
+    Returns:
+        bool: True se houve fusão (o novo final pode formar outro padrão)
+    """
+    if len(saida) < 2 or origens[-1] in alvos:
+        return False
+    anterior, ultima = saida[-2], saida[-1]
+    if anterior[0] != OP_CONST:
+        return False
+    k = anterior[1]
+
+    if ultima[0] == OP_TESTAR and anterior[2] is None:
+        fundida = (OP_TESTAR_K, (ultima[1], k), ultima[2])
+    else:
+        operacao = operacao_fundivel(ultima, k)
+        if operacao is None:
+            return False
+        funcao, simbolo = operacao
+        primeira = saida[-3] if len(saida) >= 3 and origens[-2] not in alvos else None
+
+        if primeira is not None and primeira[0] == OP_CONST:
+            # dois literais: dobra, guardando os operadores para o perfil
+            dobradas = (primeira[2] or ()) + (anterior[2] or ()) + (simbolo,)
+            fundida = (OP_CONST, funcao(primeira[1], k), dobradas)
+        elif anterior[2] is not None:
+            return False
+        elif primeira is not None and primeira[0] in FUSOES_OPERANDO:
+            fundida = (FUSOES_OPERANDO[primeira[0]], primeira[1], (funcao, k, simbolo))
+        else:
+            fundida = None
+        if fundida is not None:
+            del saida[-2:], origens[-2:]
+            saida[-1] = fundida
+            return True
+        fundida = (OP_CONST_OP, k, (funcao, simbolo))
+
+    del saida[-1], origens[-1]
+    saida[-1] = fundida
+    return True
+
+def fundir_instrucoes(codigo):
+    """
+    troca sequências frequentes por superinstruções
+
+    padrões (k literal, op em + - * / %; / e % só com k diferente de zero):
+        CONST x, CONST k, op       -> CONST (x op k)
+        CARREGAR s, CONST k, op    -> CARREGAR_OP
+        CARREGAR_REG s, CONST k, op -> REG_OP
+        RES n, CONST k, op         -> RES_OP
+        CONST k, op                -> CONST_OP
+        CONST k, TESTAR r          -> TESTAR_K
+    o valor e os erros são os mesmos; os passos de src.limites contam
+    instruções executadas, então um laço fundido gasta menos passos.
+
+    Args:
+        codigo (list): instruções de compilar_arvore
+
+    Returns:
+        list: código novo, com os destinos de salto corrigidos
+    """
+    alvos = alvos_de_salto(codigo)
+    saida = []
+    origens = []    # índice original da primeira instrução de cada saída
+    novo_indice = {}
+    for pc, instrucao in enumerate(codigo):
+        novo_indice[pc] = len(saida)
+        saida.append(instrucao)
+        origens.append(pc)
+        while fundir_final(saida, origens, alvos):
+            pass
+    novo_indice[len(codigo)] = len(saida)
+
+    for pc, (op, a, b) in enumerate(saida):
+        if op == OP_SALTAR:
+            saida[pc] = (op, novo_indice[a], b)
+        elif op in (OP_TESTAR, OP_TESTAR_K):
+            saida[pc] = (op, a, novo_indice[b])
+    return saida
+
+def executar_codigo(codigo, contexto, contagem=None, retomada=None):
+    """
+    executa código linear compilado por compilar_arvore
+
+    Args:
+        codigo (list): instruções (op, a, b)
+        contexto (dict): contexto com 'memoria' (MemoriaSlots) e 'historico_resultados';
+            'limites' (src.limites) opcional. com limites, 'proxima_pausa'
+            (total de passos) pede uma pausa no primeiro salto depois dele
+        contagem (list): se informada, contagem[pc] recebe quantas vezes
+            cada instrução executou (usado pelo perfil)
+        retomada (tuple): estado salvo em contexto['retomada'] por uma
+            pausa; a execução continua de onde parou
+
+    Returns:
+        float: valor da expressão (sem formatação), ou None se a execução
+            pausou (só acontece com 'proxima_pausa' no contexto)
+
+    Raises:
+        ExecutorError: para erros de execução
+        LimiteError: se o orçamento de passos, prazo ou expoente é excedido
+    """
+    memoria = contexto['memoria']
+    valores = memoria.valores
+    inicializados = memoria.inicializados
+    historico = contexto['historico_resultados']
+
+    # registradores de laços otimizados (OP_ENTRAR/OP_SAIR); criados sob demanda
+    if retomada is None:
+        pc = 0
+        pilha = []
+        temporarios = {}
+        registradores = None
+        ativos = []
+    else:
+        pc, pilha, temporarios, registradores, ativos = retomada
+    empilhar = pilha.append
+    desempilhar = pilha.pop
+    fim = len(codigo)
+
+    # orçamento: passos são somados por trecho sem salto (de segmento até o
+    # salto) em variáveis locais, devolvidas a limites nas verificações
+    limites = contexto.get('limites')
+    segmento = pc
+    if limites is not None:
+        passos = limites['passos']
+        pausa = contexto.get('proxima_pausa')
+        proxima = limites['proxima_verificacao'] if pausa is None else min(limites['proxima_verificacao'], pausa)
+
+    try:
+        while pc < fim:
+            op, a, b = codigo[pc]
+            if contagem is not None:
+                contagem[pc] += 1
+            pc += 1
+
+            if op == OP_CONST:
+                empilhar(a)
+            elif op == OP_CARREGAR:
+                empilhar(valores[a])
+            elif op == OP_CARREGAR_REG:
+                empilhar(registradores[a])
+            elif op == OP_CARREGAR_OP:
+                funcao, k, _ = b
+                empilhar(funcao(valores[a], k))
+            elif op == OP_REG_OP:
+                funcao, k, _ = b
+                empilhar(funcao(registradores[a], k))
+            elif op == OP_CONST_OP:
+                pilha[-1] = b[0](pilha[-1], a)
+            elif op == OP_TESTAR_K:
+                if not a[0](desempilhar(), a[1]):
+                    if limites is not None:
+                        passos += pc - segmento
+                        segmento = b
+                    pc = b
+            elif op == OP_TESTAR:
+                y = desempilhar()
+                if not a(desempilhar(), y):
+                    if limites is not None:
+                        passos += pc - segmento
+                        segmento = b
+                    pc = b
+            elif op == OP_SOMAR:
+                y = desempilhar()
+                pilha[-1] += y
+            elif op == OP_ARMAZENAR_REG:
+                registradores[a] = pilha[-1]
+                inicializados[a] = 1
+            elif op == OP_ARMAZENAR:
+                valores[a] = pilha[-1]
+                inicializados[a] = 1
+            elif op == OP_SALTAR:
+                if limites is not None:
+                    passos += pc - segmento
+                    segmento = a
+                    if passos >= proxima:
+                        limites['passos'] = passos
+                        if passos >= limites['proxima_verificacao']:
+                            verificar_limites(limites)
+                        if pausa is not None and passos >= pausa:
+                            # fim da fatia: a memória recebe os registradores,
+                            # que continuam valendo na retomada
+                            for slots in ativos:
+                                for slot in slots:
+                                    valores[slot] = registradores[slot]
+                            contexto['retomada'] = (a, pilha, temporarios, registradores, ativos)
+                            return None
+                        proxima = limites['proxima_verificacao']
+                        if pausa is not None:
+                            proxima = min(proxima, pausa)
+                pc = a
+            elif op == OP_DESCARTAR:
+                desempilhar()
+            elif op == OP_SUBTRAIR:
+                y = desempilhar()
+                pilha[-1] -= y
+            elif op == OP_MULTIPLICAR:
+                y = desempilhar()
+                pilha[-1] *= y
+            elif op == OP_RESTO:
+                y = desempilhar()
+                if y == 0:
+                    raise ExecutorError(a)
+                pilha[-1] %= y
+            elif op == OP_DIVIDIR:
+                y = desempilhar()
+                if y == 0:
+                    raise ExecutorError(a)
+                pilha[-1] /= y
+            elif op == OP_POTENCIA_INT:
+                y = desempilhar()
+                if limites is not None:
+                    limites['passos'] = passos
+                    verificar_expoente(limites, y)
+                try:
+                    pilha[-1] **= y
+                except OverflowError:
+                    # o caminho genérico monta a mensagem de erro
+                    pilha[-1] = executar_operacao('^', y, pilha[-1])
+            elif op == OP_ARIT:
+                y = desempilhar()
+                if limites is not None and a == '^':
+                    limites['passos'] = passos
+                    verificar_expoente(limites, y)
+                pilha[-1] = executar_operacao(a, y, pilha[-1])
+                if b is not None:
+                    # aquecimento: depois de LIMIAR_AQUECIMENTO expoentes
+                    # inteiros seguidos, a instrução vira POTENCIA_Q
+                    if y % 1 == 0:
+                        codigo[pc - 1] = (OP_POTENCIA_Q, a, None) if b + 1 >= LIMIAR_AQUECIMENTO else (op, a, b + 1)
+                    else:
+                        codigo[pc - 1] = (op, a, None)
+            elif op == OP_POTENCIA_Q:
+                y = desempilhar()
+                if limites is not None:
+                    limites['passos'] = passos
+                    verificar_expoente(limites, y)
+                if y % 1 == 0:
+                    try:
+                        pilha[-1] **= y
+                    except OverflowError:
+                        pilha[-1] = executar_operacao(a, y, pilha[-1])
+                else:
+                    # expoente fracionário: volta de vez ao caminho genérico
+                    codigo[pc - 1] = (OP_ARIT, a, None)
+                    pilha[-1] = executar_operacao(a, y, pilha[-1])
+            elif op == OP_RES:
+                empilhar(gerenciar_resultado(a, historico))
+            elif op == OP_RES_OP:
+                funcao, k, _ = b
+                empilhar(funcao(gerenciar_resultado(a, historico), k))
+            elif op == OP_GUARDAR:
+                temporarios[a] = pilha[-1]
+            elif op == OP_TEMPORARIO:
+                empilhar(temporarios[a])
+            elif op == OP_ENTRAR:
+                if registradores is None:
+                    registradores = [0.0] * len(valores)
+                for slot in a:
+                    registradores[slot] = valores[slot]
+                ativos.append(a)
+            elif op == OP_SAIR:
+                for slot in a:
+                    valores[slot] = registradores[slot]
+                ativos.pop()
+            else:
+                raise ExecutorError(f"Instrução inválida: {op}")
+    except Exception:
+        if limites is not None:
+            limites['passos'] = passos + pc - segmento
+        # erro dentro de laço otimizado: a memória recebe os valores já escritos
+        for slots in ativos:
+            for slot in slots:
+                valores[slot] = registradores[slot]
+        raise
+
+    if limites is not None:
+        limites['passos'] = passos + pc - segmento
+        if limites['passos'] >= proxima:
+            verificar_limites(limites)
+
+    if len(pilha) != 1:
+        raise ExecutorError(f"Código mal formado: pilha final tem {len(pilha)} elementos")
+
+    return pilha[0]
+
+def executar_arvores(arvores, historico_resultados=None, memoria=None, otimizar=False, cache=None, perfil=None,
+                     limites=None):
+    """
+    compila e executa um programa (uma árvore por linha) com contexto compartilhado
+
+    Args:
+        arvores (list): árvores sintáticas
+        historico_resultados (list): histórico de resultados anteriores
+        memoria (dict ou MemoriaSlots): memória inicial
+        otimizar (bool): aplica dobramento de constantes e eliminação de
+            subexpressões comuns (src.otimizador) antes de compilar, e a
+            otimização de laços WHILE (ver compilar_arvore)
+        cache (dict): cache de resultados (src.memoizacao); linhas com a
+            mesma forma, as mesmas versões de MEM e os mesmos valores de
+            RES reaproveitam o resultado e as escritas gravadas
+        perfil (dict): perfil de execução (src.perfil) a acumular; o código
+            linear não tem avaliações aninhadas, então 'aninhadas' não muda
+        limites (dict): orçamento de execução (src.limites.criar_limites);
+            a profundidade é verificada antes de executar a primeira linha
+
+    Returns:
+        tuple: (resultados, historico_atualizado, memoria_atualizada)
+
+    Raises:
+        ExecutorError: para erros durante a execução, indicando a linha
+        LimiteError: se um orçamento é excedido; e.estatisticas traz o
+            limite, passos, segundos, linha e resultados já concluídos
+    """
+    # sem passos_por_fatia o gerador nunca pausa: termina no primeiro next
+    execucao = executar_arvores_em_fatias(arvores, historico_resultados, memoria, otimizar, None, limites,
+                                          cache, perfil)
+    try:
+        next(execucao)
+    except StopIteration as fim:
+        return fim.value
+    raise RuntimeError("execução sem fatias pausou")
+
+def executar_arvores_em_fatias(arvores, historico_resultados=None, memoria=None, otimizar=False,
+                               passos_por_fatia=1000, limites=None, cache=None, perfil=None):
+    """
+    gerador que executa o programa pausando a cada passos_por_fatia passos
+
+    a cada pausa produz o total de passos executados; o valor de retorno
+    (StopIteration.value, ou o resultado de yield from) é o mesmo de
+    executar_arvores. pausas acontecem nos saltos de laços e entre linhas, e
+    a memória está atualizada em cada pausa. permite que um escalonador
+    (ex.: asyncio) intercale vários programas longos em uma só thread.
+
+    Args:
+        arvores (list): árvores sintáticas
+        historico_resultados (list): histórico de resultados anteriores
+        memoria (dict ou MemoriaSlots): memória inicial
+        otimizar (bool): como em executar_arvores
+        passos_por_fatia (int): passos entre pausas; None executa sem pausas
+        limites (dict): orçamento (src.limites); sem ele um orçamento sem
+            limites é criado para contar os passos
+        cache (dict): cache de resultados, como em executar_arvores
+        perfil (dict): perfil a acumular; o tempo em pausa não é contado
+
+    Yields:
+        int: passos executados até a pausa
+
+    Raises:
+        ExecutorError: para erros durante a execução, indicando a linha
+        LimiteError: se um orçamento é excedido
+    """
+    if memoria is None:
+        memoria = MemoriaSlots()
+    elif not isinstance(memoria, MemoriaSlots):
+        memoria = MemoriaSlots.de_dict(memoria)
+
+    if perfil is not None:
+        textos = [texto_arvore(arvore) for arvore in arvores]
+
+    if limites is None and passos_por_fatia is not None:
+        limites = criar_limites()
+    if limites is not None:
+        iniciar_limites(limites)
+        for numero_linha, arvore in enumerate(arvores, 1):
+            limites['linha'] = numero_linha
+            verificar_profundidade(limites, arvore)
+
+    if otimizar:
+        max_expoente = limites['max_expoente'] if limites is not None else None
+        arvores = [otimizar_arvore(arvore, max_expoente=max_expoente)[0] for arvore in arvores]
+
+    # compila o programa inteiro antes de executar: slots fixos para todas as linhas
+    inteiros = inferir_inteiros(arvores, memoria)
+    programa = [fundir_instrucoes(compilar_arvore(arvore, memoria, otimizar, inteiros)) for arvore in arvores]
+
+    contexto = {
+        'historico_resultados': list(historico_resultados) if historico_resultados else [],
+        'memoria': memoria,
+        'pilha': [],
+        'resultado_atual': None,
+        'limites': limites
+    }
+    if passos_por_fatia is not None:
+        contexto['proxima_pausa'] = passos_por_fatia
+    resultados = []
+
+    if cache is not None:
+        iniciar_execucao(cache)
+        linhas = [analisar_linha(arvore) for arvore in arvores]
+
+    for numero_linha, codigo in enumerate(programa, 1):
+        if perfil is not None:
+            contagem = [0] * len(codigo)
+            inicio = time.perf_counter()
+        else:
+            contagem = None
+        if limites is not None:
+            limites['linha'] = numero_linha
+        try:
+            entrada = None
+            if cache is not None:
+                chave, entrada = consultar_linha(cache, linhas[numero_linha - 1], contexto)
+            if entrada is not None:
+                resultado = entrada[0]
+            else:
+                valor = executar_codigo(codigo, contexto, contagem)
+                while valor is None:
+                    # pausa no meio de um laço
+                    if perfil is not None:
+                        pausa = time.perf_counter()
+                    yield limites['passos']
+                    if perfil is not None:
+                        inicio += time.perf_counter() - pausa
+                    contexto['proxima_pausa'] = limites['passos'] + passos_por_fatia
+                    valor = executar_codigo(codigo, contexto, contagem, contexto['retomada'])
+                resultado = formatar_resultado(valor)
+            if cache is not None:
+                concluir_linha(cache, chave, entrada, linhas[numero_linha - 1], resultado, memoria)
+        except ExecutorError as e:
+            erro = ExecutorError(e.mensagem, f"linha {numero_linha}")
+        except (OverflowError, ValueError, ZeroDivisionError) as e:
+            erro = ExecutorError(f"Erro numérico: {str(e)}", f"linha {numero_linha}")
+        else:
+            erro = None
+
+        if perfil is not None:
+            contabilizar_instrucoes(perfil, codigo, contagem)
+            registrar_linha(perfil, numero_linha, textos[numero_linha - 1], time.perf_counter() - inicio,
+                            erro.mensagem if erro is not None else None)
+        if erro is not None:
+            raise erro
+
+        contexto['resultado_atual'] = resultado
+        contexto['historico_resultados'].append(resultado)
+        resultados.append(resultado)
+        if limites is not None:
+            limites['resultados'] += 1
+
+        # fatia terminada no fim da linha (programas longos sem laços)
+        if passos_por_fatia is not None and limites['passos'] >= contexto['proxima_pausa']:
+            yield limites['passos']
+            contexto['proxima_pausa'] = limites['passos'] + passos_por_fatia
+
+    return resultados, contexto['historico_resultados'], memoria
+
+def consultar_linha(cache, linha, contexto):
+    """
+    procura a linha no cache; num acerto reaplica as escritas gravadas
+
+    Returns:
+        tuple: (chave, entrada); entrada é (resultado, escritas) ou None
+    """
+    chave = montar_chave(cache, linha, contexto['historico_resultados'])
+    entrada = consultar_cache(cache, chave) if chave is not None else None
+    if entrada is not None:
+        memoria = contexto['memoria']
+        for nome, valor in entrada[1]:
+            memoria[nome] = valor
+    return chave, entrada
+
+def concluir_linha(cache, chave, entrada, linha, resultado, memoria):
+    """
+    grava o resultado de uma linha executada (falta no cache) e dá nova
+    versão às células escritas pela linha
+    """
+    if entrada is None and chave is not None:
+        escritas = tuple((nome, memoria[nome]) for nome in linha['escreve'] if nome in memoria)
+        registrar_no_cache(cache, chave, resultado, escritas)
+    invalidar_escritas(cache, linha)
+
+def executar_com_cache(codigo, linha, contexto, cache, contagem=None):
+    """
+    executa uma linha consultando o cache de resultados
+
+    num acerto as escritas gravadas são reaplicadas na memória; em qualquer
+    caso as células escritas pela linha ganham nova versão.
+
+    Returns:
+        float: resultado formatado
+    """
+    chave, entrada = consultar_linha(cache, linha, contexto)
+    if entrada is not None:
+        resultado = entrada[0]
+    else:
+        resultado = formatar_resultado(executar_codigo(codigo, contexto, contagem))
+    concluir_linha(cache, chave, entrada, linha, resultado, contexto['memoria'])
+    return resultado
+
+def contabilizar_instrucoes(perfil, codigo, contagem):
+    """
+    soma no perfil as instruções executadas de uma linha
+
+    Args:
+        perfil (dict): perfil em coleta
+        codigo (list): instruções (op, a, b)
+        contagem (list): execuções por instrução (ver executar_codigo)
+    """
+    operadores = perfil['operadores']
+    simbolos = {codigo_op: simbolo for simbolo, codigo_op in OPERACOES_DIRETAS.items()}
+    simbolos[OP_POTENCIA_INT] = '^'
+
+    for (op, a, b), vezes in zip(codigo, contagem):
+        if not vezes:
+            continue
+        if op in simbolos:
+            operadores[simbolos[op]] = operadores.get(simbolos[op], 0) + vezes
+        elif op in (OP_ARIT, OP_POTENCIA_Q):
+            operadores[a] = operadores.get(a, 0) + vezes
+        elif op == OP_CONST and b:
+            # literais dobrados por fundir_instrucoes
+            for simbolo in b:
+                operadores[simbolo] = operadores.get(simbolo, 0) + vezes
+        elif op in (OP_CONST_OP, OP_CARREGAR_OP, OP_REG_OP, OP_RES_OP):
+            operadores[b[-1]] = operadores.get(b[-1], 0) + vezes
+        if op in CONTADORES_PERFIL:
+            perfil[CONTADORES_PERFIL[op]] += vezes
+
+def texto_arvore(arvore):
+    """texto da linha para o perfil, reconstruído da árvore"""
+    try:
+        return texto_tokens(arvore_para_tokens(arvore))
+    except ExecutorError:
+        return arvore['tipo']
+
+def desmontar(codigo):
+    """
+    gera listagem legível do código compilado
+
+    Args:
+        codigo (list): instruções (op, a, b)
+
+    Returns:
+        str: uma instrução por linha
+    """
+    linhas = []
+    for pc, (op, a, b) in enumerate(codigo):
+        if op == OP_TESTAR:
+            a = next(simbolo for simbolo, funcao in FUNCOES_RELACIONAIS.items() if funcao is a)
+        elif op == OP_TESTAR_K:
+            a = next(simbolo for simbolo, funcao in FUNCOES_RELACIONAIS.items() if funcao is a[0]) + f" {a[1]}"
+        elif op in (OP_DIVIDIR, OP_RESTO):
+            a = None
+        elif op == OP_CONST:
+            b = None
+        elif op == OP_CONST_OP:
+            a, b = b[1], a
+        elif op in (OP_CARREGAR_OP, OP_REG_OP, OP_RES_OP):
+            b = f"{b[2]} {b[1]}"
+        argumentos = ' '.join(str(x) for x in (a, b) if x is not None)
+        linhas.append(f"{pc:4d}  {NOMES_OPERACOES.get(op, op):<12} {argumentos}".rstrip())
+    return '\n'.join(linhas)
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+
+    programa = [
+        "(0 I)",
+        "(I 10 < ((I 1 +) I) WHILE)",
+        "(I 5 > (I 2 *) (I) IF)",
+        "(1 RES)"
+    ]
+
+    try:
+        arvores = gerar_arvores([parse_expressao(linha) for linha in programa])
+        resultados, historico, memoria = executar_arvores(arvores)
+
+        for linha, resultado in zip(programa, resultados):
+            print(f"{linha:35} -> {resultado}")
+        print(f"Memória: {memoria.para_dict()}")
+
+        print("\nCódigo do laço:")
+        print(desmontar(compilar_arvore(arvores[1], MemoriaSlots())))
+
+    except ExecutorError as e:
+        print(f"Erro: {e}")
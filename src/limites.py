@@ -0,0 +1,128 @@
+# orçamentos de execução para programas com WHILE
+# passos (instruções executadas), profundidade de aninhamento, magnitude do
+# expoente de ^ e prazo em segundos. o interpretador só conta passos nos
+# saltos e só verifica o orçamento nos saltos para trás (laços) e no fim de
+# cada linha; o relógio é consultado a cada intervalo_verificacao passos
+
+import time
+
+class LimiteError(Exception):
+    """exceção para execuções que excedem um orçamento"""
+    def __init__(self, mensagem, estatisticas=None):
+        self.mensagem = mensagem
+        self.estatisticas = estatisticas if estatisticas is not None else {}
+        super().__init__(f"Limite de execução excedido: {mensagem}")
+
+def criar_limites(max_passos=None, max_profundidade=None, max_expoente=None,
+                  prazo_segundos=None, intervalo_verificacao=1000):
+    """
+    cria orçamento de execução (None desativa o limite correspondente)
+
+    Args:
+        max_passos (int): instruções executadas no programa inteiro
+        max_profundidade (int): parênteses aninhados em uma linha
+        max_expoente (float): |expoente| máximo aceito por ^
+        prazo_segundos (float): tempo de relógio a partir de iniciar_limites
+        intervalo_verificacao (int): passos entre consultas ao relógio
+
+    Returns:
+        dict: limites e contadores da execução
+    """
+    return {
+        'max_passos': max_passos,
+        'max_profundidade': max_profundidade,
+        'max_expoente': max_expoente,
+        'prazo_segundos': prazo_segundos,
+        'intervalo': intervalo_verificacao,
+        'passos': 0,
+        'inicio': None,
+        'prazo': None,
+        'proxima_verificacao': 0,
+        'linha': None,
+        'resultados': 0
+    }
+
+def iniciar_limites(limites):
+    """zera os contadores e começa a contar o prazo"""
+    limites['passos'] = 0
+    limites['resultados'] = 0
+    limites['linha'] = None
+    limites['inicio'] = time.perf_counter()
+    if limites['prazo_segundos'] is not None:
+        limites['prazo'] = limites['inicio'] + limites['prazo_segundos']
+    agendar_verificacao(limites)
+
+def agendar_verificacao(limites):
+    """próximo total de passos em que verificar_limites deve ser chamada"""
+    proxima = limites['passos'] + limites['intervalo'] if limites['prazo'] is not None else float('inf')
+    if limites['max_passos'] is not None:
+        proxima = min(proxima, limites['max_passos'] + 1)
+    limites['proxima_verificacao'] = proxima
+
+def estatisticas_parciais(limites, limite):
+    """
+    resumo da execução até o ponto em que o limite foi excedido
+
+    Returns:
+        dict: limite excedido, passos, segundos, linha e resultados completos
+    """
+    return {
+        'limite': limite,
+        'passos': limites['passos'],
+        'segundos': time.perf_counter() - limites['inicio'],
+        'linha': limites['linha'],
+        'resultados': limites['resultados']
+    }
+
+def verificar_limites(limites):
+    """
+    verifica passos e prazo; chamada quando passos >= proxima_verificacao
+
+    Raises:
+        LimiteError: se um dos dois foi excedido
+    """
+    if limites['max_passos'] is not None and limites['passos'] > limites['max_passos']:
+        raise LimiteError(f"mais de {limites['max_passos']} passos",
+                          estatisticas_parciais(limites, 'passos'))
+    if limites['prazo'] is not None and time.perf_counter() > limites['prazo']:
+        raise LimiteError(f"prazo de {limites['prazo_segundos']} s",
+                          estatisticas_parciais(limites, 'prazo'))
+    agendar_verificacao(limites)
+
+def verificar_expoente(limites, expoente):
+    """
+    Raises:
+        LimiteError: se |expoente| excede max_expoente
+    """
+    if limites['max_expoente'] is not None and abs(expoente) > limites['max_expoente']:
+        raise LimiteError(f"expoente {expoente} acima de {limites['max_expoente']}",
+                          estatisticas_parciais(limites, 'expoente'))
+
+def profundidade_arvore(arvore):
+    """
+    maior número de nós EXPRESSAO (parênteses) aninhados na árvore
+
+    percorre com pilha explícita: árvores muito profundas não estouram a
+    recursão do Python
+    """
+    maior = 0
+    pendentes = [(arvore, 0)]
+    while pendentes:
+        no, profundidade = pendentes.pop()
+        if no['tipo'] == 'EXPRESSAO':
+            profundidade += 1
+            maior = max(maior, profundidade)
+        pendentes.extend((filho, profundidade) for filho in no.get('filhos', []))
+    return maior
+
+def verificar_profundidade(limites, arvore):
+    """
+    Raises:
+        LimiteError: se a árvore é mais profunda que max_profundidade
+    """
+    if limites['max_profundidade'] is None:
+        return
+    profundidade = profundidade_arvore(arvore)
+    if profundidade > limites['max_profundidade']:
+        raise LimiteError(f"profundidade {profundidade} acima de {limites['max_profundidade']}",
+                          estatisticas_parciais(limites, 'profundidade'))
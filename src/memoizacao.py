@@ -0,0 +1,178 @@
+# memoização de resultados de linhas entre execuções de um programa
+# a chave é a forma canônica da árvore mais as versões das células de MEM
+# que a linha toca e os valores de histórico que ela referencia por RES
+
+import sys
+import os
+from collections import OrderedDict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.syntax_tree import coletar_acessos
+
+def criar_cache_resultados(capacidade=1024):
+    """
+    cria cache de resultados com descarte LRU
+
+    o mesmo cache pode ser reaproveitado em várias execuções: cada execução
+    abre uma nova época, e entradas que dependem de MEM só valem na época
+    em que foram gravadas (a memória pode ter mudado entre execuções).
+
+    Args:
+        capacidade (int): número máximo de entradas
+
+    Returns:
+        dict: cache com entradas, versões das células e estatísticas
+    """
+    if capacidade < 1:
+        raise ValueError("Capacidade do cache deve ser positiva")
+
+    return {
+        'entradas': OrderedDict(),
+        'capacidade': capacidade,
+        'versoes': {},
+        'relogio': 0,
+        'epoca': 0,
+        'acertos': 0,
+        'falhas': 0,
+        'descartes': 0
+    }
+
+def iniciar_execucao(cache):
+    """abre nova época: versões de MEM de execuções anteriores deixam de valer"""
+    cache['epoca'] += 1
+    cache['versoes'] = {}
+
+def forma_canonica(no):
+    """
+    gera chave estrutural hashável de uma árvore
+
+    parênteses redundantes e marcas de subexpressão comum são ignorados e
+    números são normalizados para float, então "(2 3 +)" e "(2.0 3.0 +)"
+    têm a mesma forma.
+
+    Args:
+        no (dict): nó da árvore
+
+    Returns:
+        tuple: forma canônica
+    """
+    tipo = no['tipo']
+
+    if tipo in ('EXPRESSAO', 'COMANDO_RECUPERAR') and len(no['filhos']) == 1:
+        return forma_canonica(no['filhos'][0])
+    if tipo == 'NUMERO':
+        return (tipo, float(no['valor']))
+
+    return (tipo, no['valor'] if isinstance(no['valor'], str) else None,
+            tuple(forma_canonica(filho) for filho in no['filhos']))
+
+def analisar_linha(arvore):
+    """
+    prepara a informação estática de uma linha para consultas ao cache
+
+    células escritas também entram como entrada da chave: uma escrita
+    condicional (IF/WHILE) que não acontece deixa o valor anterior.
+
+    Returns:
+        dict: 'forma', 'celulas' (ordenadas), 'escreve' e 'res' (ordenadas)
+    """
+    acessos = coletar_acessos(arvore)
+    return {
+        'forma': forma_canonica(arvore),
+        'celulas': tuple(sorted(acessos['le'] | acessos['escreve'])),
+        'escreve': tuple(sorted(acessos['escreve'])),
+        'res': tuple(sorted(acessos['res']))
+    }
+
+def montar_chave(cache, linha, historico):
+    """
+    monta a chave da linha no estado atual
+
+    Args:
+        cache (dict): cache de resultados
+        linha (dict): resultado de analisar_linha
+        historico (list): histórico de resultados
+
+    Returns:
+        tuple: chave, ou None se algum RES não puder ser resolvido (a linha
+            é executada sem cache e o erro aparece normalmente)
+    """
+    valores_res = []
+    for n in linha['res']:
+        if n <= 0 or n > len(historico):
+            return None
+        valores_res.append(historico[-n])
+
+    if linha['celulas']:
+        versoes = cache['versoes']
+        estado = (cache['epoca'], tuple(versoes.get(nome, 0) for nome in linha['celulas']))
+    else:
+        estado = None
+
+    return (linha['forma'], estado, tuple(valores_res))
+
+def consultar_cache(cache, chave):
+    """
+    busca entrada e a marca como usada recentemente
+
+    Returns:
+        tuple: (resultado, escritas) ou None
+    """
+    entradas = cache['entradas']
+    entrada = entradas.get(chave)
+    if entrada is None:
+        cache['falhas'] += 1
+        return None
+
+    entradas.move_to_end(chave)
+    cache['acertos'] += 1
+    return entrada
+
+def registrar_no_cache(cache, chave, resultado, escritas):
+    """grava entrada, descartando a menos usada se o cache estiver cheio"""
+    entradas = cache['entradas']
+    entradas[chave] = (resultado, escritas)
+    entradas.move_to_end(chave)
+
+    if len(entradas) > cache['capacidade']:
+        entradas.popitem(last=False)
+        cache['descartes'] += 1
+
+def invalidar_escritas(cache, linha):
+    """avança a versão de cada célula que a linha escreve"""
+    versoes = cache['versoes']
+    for nome in linha['escreve']:
+        cache['relogio'] += 1
+        versoes[nome] = cache['relogio']
+
+def estatisticas_cache(cache):
+    """
+    resume o uso do cache
+
+    Returns:
+        dict: acertos, falhas, descartes, entradas e taxa de acerto
+    """
+    consultas = cache['acertos'] + cache['falhas']
+    return {
+        'acertos': cache['acertos'],
+        'falhas': cache['falhas'],
+        'descartes': cache['descartes'],
+        'entradas': len(cache['entradas']),
+        'taxa_acerto': cache['acertos'] / consultas if consultas else 0.0
+    }
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+    from src.interpretador import gerar_arvores, executar_arvores
+
+    programa = [
+        "(10 A)", "(A 2 ^)", "(A 2 ^)", "((A 1 +) A)", "(A 2 ^)", "(3 4 *)", "(3 4 *)"
+    ]
+
+    arvores = gerar_arvores([parse_expressao(linha) for linha in programa])
+    cache = criar_cache_resultados(capacidade=16)
+    resultados, _, _ = executar_arvores(arvores, cache=cache)
+
+    for linha, resultado in zip(programa, resultados):
+        print(f"{linha:15} -> {resultado}")
+    print(f"Cache: {estatisticas_cache(cache)}")
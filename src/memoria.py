@@ -0,0 +1,174 @@
+# memória de identificadores resolvida em slots
+
+import sys
+import os
+from array import array
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.token_types import *
+
+class MemoriaSlots:
+    """
+    memória de identificadores indexada por slot
+
+    cada identificador distinto do programa recebe um índice fixo; os valores
+    ficam num array('d') e um bitmap marca quais slots já foram escritos.
+    o acesso por nome (get, [], items) continua disponível para depuração e
+    snapshots, e se comporta como o dicionário usado pelo executador.
+    """
+    __slots__ = ('tabela', 'valores', 'inicializados')
+
+    def __init__(self, tabela=None):
+        self.tabela = dict(tabela) if tabela else {}
+        tamanho = len(self.tabela)
+        self.valores = array('d', bytes(8 * tamanho))
+        self.inicializados = bytearray(tamanho)
+
+    def obter_slot(self, nome):
+        """
+        retorna o slot do identificador, registrando-o se for novo
+
+        Args:
+            nome (str): nome do identificador
+
+        Returns:
+            int: índice do slot
+        """
+        slot = self.tabela.get(nome)
+        if slot is None:
+            slot = len(self.tabela)
+            self.tabela[nome] = slot
+            self.valores.append(0.0)
+            self.inicializados.append(0)
+        return slot
+
+    def carregar(self, slot):
+        """retorna o valor do slot (0.0 se não inicializado)"""
+        return self.valores[slot]
+
+    def armazenar(self, slot, valor):
+        """armazena valor no slot e marca como inicializado"""
+        self.valores[slot] = valor
+        self.inicializados[slot] = 1
+
+    # acesso por nome, compatível com o dicionário de memória
+
+    def get(self, nome, padrao=0.0):
+        slot = self.tabela.get(nome)
+        if slot is None or not self.inicializados[slot]:
+            return padrao
+        return self.valores[slot]
+
+    def __getitem__(self, nome):
+        slot = self.tabela.get(nome)
+        if slot is None or not self.inicializados[slot]:
+            raise KeyError(nome)
+        return self.valores[slot]
+
+    def __setitem__(self, nome, valor):
+        self.armazenar(self.obter_slot(nome), float(valor))
+
+    def __contains__(self, nome):
+        slot = self.tabela.get(nome)
+        return slot is not None and bool(self.inicializados[slot])
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return sum(self.inicializados)
+
+    def __eq__(self, outro):
+        if isinstance(outro, (MemoriaSlots, dict)):
+            return self.para_dict() == dict(outro.items())
+        return NotImplemented
+
+    def __repr__(self):
+        return f"MemoriaSlots({self.para_dict()!r})"
+
+    def keys(self):
+        return [nome for nome, slot in self.tabela.items() if self.inicializados[slot]]
+
+    def items(self):
+        return [(nome, self.valores[slot]) for nome, slot in self.tabela.items()
+                if self.inicializados[slot]]
+
+    def copy(self):
+        """cria cópia independente (tabela, valores e bitmap)"""
+        copia = MemoriaSlots.__new__(MemoriaSlots)
+        copia.tabela = dict(self.tabela)
+        copia.valores = array('d', self.valores)
+        copia.inicializados = bytearray(self.inicializados)
+        return copia
+
+    def salvar_celulas(self, nomes):
+        """
+        guarda o estado atual das células para desfazer escritas
+
+        Args:
+            nomes (iterable): identificadores que podem ser escritos
+
+        Returns:
+            list: (slot, valor, inicializado) por célula, para restaurar_celulas
+        """
+        salvas = []
+        for nome in nomes:
+            slot = self.obter_slot(nome)
+            salvas.append((slot, self.valores[slot], self.inicializados[slot]))
+        return salvas
+
+    def restaurar_celulas(self, salvas):
+        """desfaz as escritas nas células guardadas por salvar_celulas"""
+        for slot, valor, inicializado in salvas:
+            self.valores[slot] = valor
+            self.inicializados[slot] = inicializado
+
+    def para_dict(self):
+        """
+        gera snapshot da memória indexado por nome
+
+        Returns:
+            dict: nome -> valor, apenas para slots inicializados
+        """
+        return dict(self.items())
+
+    @classmethod
+    def de_dict(cls, memoria):
+        """
+        cria memória em slots a partir de um dicionário nome -> valor
+
+        Args:
+            memoria (dict): memória indexada por nome
+
+        Returns:
+            MemoriaSlots: memória equivalente
+        """
+        nova = cls()
+        for nome, valor in memoria.items():
+            nova[nome] = valor
+        return nova
+
+def resolver_slots(expressoes_tokens, memoria):
+    """
+    passo de compilação: atribui um slot a cada identificador do programa
+
+    os tokens IDENTIFICADOR recebem a chave 'slot' com o par (tabela,
+    índice). o executor só usa o índice quando a memória de execução tem essa
+    mesma tabela; com outra memória (inclusive uma cópia, cuja tabela pode
+    divergir) o identificador é buscado pelo nome. resolver os mesmos tokens
+    para outra memória apenas troca o par.
+
+    Args:
+        expressoes_tokens (list): lista de listas de tokens
+        memoria (MemoriaSlots): memória cuja tabela recebe os identificadores
+
+    Returns:
+        dict: tabela nome -> slot
+    """
+    tabela = memoria.tabela
+    for tokens in expressoes_tokens:
+        for token in tokens:
+            if token['tipo'] == IDENTIFICADOR:
+                token['slot'] = (tabela, memoria.obter_slot(token['valor']))
+
+    return memoria.tabela
@@ -0,0 +1,304 @@
+# memória de identificadores em memória compartilhada entre processos
+# uma tabela fixa de slots (doubles) mais o índice de nomes num segmento de
+# multiprocessing.shared_memory: trabalhadores leem os valores gravados pelo
+# coordenador sem pickle.
+#
+# formato do segmento (little-endian):
+#   cabeçalho      '<4sHHIIQ': assinatura, versão, reservado, capacidade,
+#                  n_nomes, geração
+#   valores        capacidade doubles (alinhados em 8 bytes)
+#   inicializados  capacidade bytes
+#   nomes          capacidade entradas de TAMANHO_NOME bytes (UTF-8, zeros
+#                  à direita)
+#
+# consistência:
+#   - cada processo trabalha sobre um instantâneo privado (carregar): as
+#     próprias escritas são vistas por ele na hora (read-your-writes) e pelos
+#     outros só depois de publicar;
+#   - publicar é atômica para os leitores: a geração fica ímpar durante a
+#     escrita e carregar repete a cópia se ela mudou (seqlock);
+#   - publicações concorrentes precisam da mesma trava (multiprocessing.Lock)
+#     em todos os processos; sem trava, só um processo pode publicar. entre
+#     publicações, vale a última escrita de cada célula;
+#   - nomes só são acrescentados, então um slot nunca muda de dono.
+
+import sys
+import os
+import time
+import struct
+from array import array
+from multiprocessing import shared_memory
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.memoria import MemoriaSlots
+
+ASSINATURA = b'RPNM'
+VERSAO_FORMATO = 1
+CABECALHO = struct.Struct('<4sHHIIQ')
+TAMANHO_NOME = 64
+POSICAO_N_NOMES = 12
+POSICAO_GERACAO = 16
+
+class MemoriaCompartilhadaError(Exception):
+    """exceção para segmentos inválidos, cheios ou inexistentes"""
+    def __init__(self, mensagem, segmento=None):
+        self.mensagem = mensagem
+        self.segmento = segmento
+        super().__init__(f"Erro de memória compartilhada{' em ' + str(segmento) if segmento else ''}: {mensagem}")
+
+def tamanho_segmento(capacidade):
+    """bytes ocupados por um segmento com capacidade slots"""
+    return CABECALHO.size + capacidade * (8 + 1 + TAMANHO_NOME)
+
+class MemoriaCompartilhada:
+    """
+    tabela de slots de MEM num segmento compartilhado
+
+    criada pelo coordenador (criar) e anexada pelos trabalhadores (anexar,
+    pelo nome do segmento). carregar devolve uma MemoriaSlots privada com os
+    mesmos slots; publicar grava de volta as células de uma memória.
+    """
+
+    __slots__ = ('segmento', 'dono', 'trava', 'capacidade', 'tabela', 'bytes_valores', 'valores',
+                 'inicializados', 'nomes')
+
+    def __init__(self, segmento, dono=False, trava=None):
+        assinatura, versao, _, capacidade, _, _ = CABECALHO.unpack_from(segmento.buf)
+        if assinatura != ASSINATURA:
+            raise MemoriaCompartilhadaError("Assinatura inválida", segmento.name)
+        if versao != VERSAO_FORMATO:
+            raise MemoriaCompartilhadaError(f"Versão de formato não suportada: {versao}", segmento.name)
+
+        self.segmento = segmento
+        self.dono = dono
+        self.trava = trava
+        self.capacidade = capacidade
+        # cache local do índice de nomes (que só cresce)
+        self.tabela = {}
+
+        inicio_inicializados = CABECALHO.size + 8 * capacidade
+        inicio_nomes = inicio_inicializados + capacidade
+        self.bytes_valores = segmento.buf[CABECALHO.size:inicio_inicializados]
+        self.valores = self.bytes_valores.cast('d')
+        self.inicializados = segmento.buf[inicio_inicializados:inicio_nomes]
+        self.nomes = segmento.buf[inicio_nomes:inicio_nomes + capacidade * TAMANHO_NOME]
+
+    @classmethod
+    def criar(cls, capacidade=1024, nome=None, trava=None):
+        """
+        cria um segmento vazio
+
+        Args:
+            capacidade (int): número máximo de identificadores
+            nome (str): nome do segmento (None gera um nome único)
+            trava (multiprocessing.Lock): serializa publicações concorrentes
+
+        Returns:
+            MemoriaCompartilhada: dona do segmento (destruir o remove)
+        """
+        segmento = shared_memory.SharedMemory(name=nome, create=True, size=tamanho_segmento(capacidade))
+        CABECALHO.pack_into(segmento.buf, 0, ASSINATURA, VERSAO_FORMATO, 0, capacidade, 0, 0)
+        return cls(segmento, dono=True, trava=trava)
+
+    @classmethod
+    def anexar(cls, nome, trava=None):
+        """
+        abre um segmento existente pelo nome
+
+        Raises:
+            MemoriaCompartilhadaError: se o segmento não existe
+        """
+        try:
+            segmento = shared_memory.SharedMemory(name=nome)
+        except FileNotFoundError:
+            raise MemoriaCompartilhadaError("Segmento inexistente", nome)
+        return cls(segmento, trava=trava)
+
+    @property
+    def nome(self):
+        """nome do segmento, para anexar em outro processo"""
+        return self.segmento.name
+
+    @property
+    def geracao(self):
+        """contador de publicações (ímpar durante uma publicação)"""
+        return struct.unpack_from('<Q', self.segmento.buf, POSICAO_GERACAO)[0]
+
+    def n_nomes(self):
+        """identificadores registrados no segmento"""
+        return struct.unpack_from('<I', self.segmento.buf, POSICAO_N_NOMES)[0]
+
+    def atualizar_tabela(self, n_nomes):
+        """acrescenta ao cache local os nomes registrados por outros processos"""
+        for slot in range(len(self.tabela), n_nomes):
+            entrada = self.nomes[slot * TAMANHO_NOME:(slot + 1) * TAMANHO_NOME]
+            self.tabela[bytes(entrada).rstrip(b'\0').decode('utf-8')] = slot
+
+    def obter_slot(self, nome):
+        """
+        slot do identificador, registrando-o se for novo (só dentro de publicar
+        ou com a trava: registrar é uma escrita no segmento)
+
+        Raises:
+            MemoriaCompartilhadaError: nome longo demais ou segmento cheio
+        """
+        n_nomes = self.n_nomes()
+        self.atualizar_tabela(n_nomes)
+        slot = self.tabela.get(nome)
+        if slot is not None:
+            return slot
+
+        codificado = nome.encode('utf-8')
+        if len(codificado) > TAMANHO_NOME:
+            raise MemoriaCompartilhadaError(f"Nome com mais de {TAMANHO_NOME} bytes: {nome}", self.nome)
+        if n_nomes == self.capacidade:
+            raise MemoriaCompartilhadaError(f"Capacidade de {self.capacidade} identificadores esgotada", self.nome)
+
+        inicio = n_nomes * TAMANHO_NOME
+        self.nomes[inicio:inicio + TAMANHO_NOME] = codificado.ljust(TAMANHO_NOME, b'\0')
+        # o contador só cresce depois do nome gravado: leitores nunca veem nome parcial
+        struct.pack_into('<I', self.segmento.buf, POSICAO_N_NOMES, n_nomes + 1)
+        self.tabela[nome] = n_nomes
+        return n_nomes
+
+    def publicar(self, memoria, nomes=None):
+        """
+        grava células no segmento, tornando-as visíveis aos outros processos
+
+        Args:
+            memoria (dict ou MemoriaSlots): memória de onde vêm os valores
+            nomes (iterable): identificadores a publicar; None publica todas
+                as células inicializadas da memória
+
+        Returns:
+            int: geração após a publicação
+
+        Raises:
+            MemoriaCompartilhadaError: nome longo demais ou capacidade
+                insuficiente (nada é publicado)
+        """
+        if nomes is None:
+            celulas = list(memoria.items())
+        else:
+            celulas = [(nome, memoria[nome]) for nome in nomes if nome in memoria]
+
+        if self.trava is not None:
+            self.trava.acquire()
+        try:
+            # valida os nomes novos antes de escrever: publicar é tudo ou nada
+            n_nomes = self.n_nomes()
+            self.atualizar_tabela(n_nomes)
+            novos = {nome for nome, _ in celulas if nome not in self.tabela}
+            for nome in novos:
+                if len(nome.encode('utf-8')) > TAMANHO_NOME:
+                    raise MemoriaCompartilhadaError(f"Nome com mais de {TAMANHO_NOME} bytes: {nome}", self.nome)
+            if n_nomes + len(novos) > self.capacidade:
+                raise MemoriaCompartilhadaError(f"Capacidade de {self.capacidade} identificadores esgotada",
+                                                self.nome)
+
+            geracao = self.geracao + 1
+            struct.pack_into('<Q', self.segmento.buf, POSICAO_GERACAO, geracao)
+            try:
+                for nome, valor in celulas:
+                    slot = self.obter_slot(nome)
+                    self.valores[slot] = float(valor)
+                    self.inicializados[slot] = 1
+            finally:
+                geracao += 1
+                struct.pack_into('<Q', self.segmento.buf, POSICAO_GERACAO, geracao)
+        finally:
+            if self.trava is not None:
+                self.trava.release()
+        return geracao
+
+    def carregar(self):
+        """
+        instantâneo privado da memória publicada
+
+        a cópia dos valores é um único memcpy; o índice de nomes é lido só
+        para os nomes novos desde a última chamada.
+
+        Returns:
+            MemoriaSlots: memória com os mesmos slots do segmento
+        """
+        while True:
+            geracao = self.geracao
+            if geracao & 1:
+                # publicação em andamento
+                time.sleep(0)
+                continue
+            n_nomes = self.n_nomes()
+            valores = array('d')
+            valores.frombytes(self.bytes_valores[:8 * n_nomes])
+            inicializados = bytearray(self.inicializados[:n_nomes])
+            if self.geracao == geracao:
+                break
+
+        self.atualizar_tabela(n_nomes)
+        memoria = MemoriaSlots.__new__(MemoriaSlots)
+        memoria.tabela = dict(self.tabela) if len(self.tabela) == n_nomes else \
+            {nome: slot for nome, slot in self.tabela.items() if slot < n_nomes}
+        memoria.valores = valores
+        memoria.inicializados = inicializados
+        return memoria
+
+    def ler(self, nome, padrao=0.0):
+        """valor publicado de um identificador (padrao se não inicializado)"""
+        while True:
+            geracao = self.geracao
+            if geracao & 1:
+                time.sleep(0)
+                continue
+            self.atualizar_tabela(self.n_nomes())
+            slot = self.tabela.get(nome)
+            valor = padrao if slot is None or not self.inicializados[slot] else self.valores[slot]
+            if self.geracao == geracao:
+                return valor
+
+    def fechar(self):
+        """libera as visões e fecha o segmento neste processo"""
+        for visao in (self.valores, self.bytes_valores, self.inicializados, self.nomes):
+            visao.release()
+        self.segmento.close()
+
+    def destruir(self):
+        """fecha e remove o segmento (só o dono)"""
+        self.fechar()
+        if self.dono:
+            self.segmento.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.destruir()
+
+    def __repr__(self):
+        return (f"MemoriaCompartilhada({self.nome!r}, capacidade={self.capacidade}, "
+                f"nomes={self.n_nomes()}, geracao={self.geracao})")
+
+if __name__ == '__main__':
+    from concurrent.futures import ProcessPoolExecutor
+    from src.lexer import parse_expressao
+    from src.interpretador import gerar_arvores, executar_arvores
+
+    def trabalhador(nome_segmento, linha):
+        """executa uma linha sobre o instantâneo publicado; devolve resultado e escritas"""
+        compartilhada = MemoriaCompartilhada.anexar(nome_segmento)
+        try:
+            memoria = compartilhada.carregar()
+            antes = memoria.para_dict()
+            resultados, _, memoria = executar_arvores(gerar_arvores([parse_expressao(linha)]), memoria=memoria)
+            return resultados[0], {nome: valor for nome, valor in memoria.items() if antes.get(nome) != valor}
+        finally:
+            compartilhada.fechar()
+
+    with MemoriaCompartilhada.criar(capacidade=16) as compartilhada:
+        compartilhada.publicar({'A': 2.0, 'B': 3.0})
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            respostas = list(pool.map(trabalhador, [compartilhada.nome] * 3, ["(A B *)", "(A B ^)", "((A B +) C)"]))
+        # só o coordenador publica: sem trava, um único escritor
+        for resultado, escritas in respostas:
+            compartilhada.publicar(escritas)
+        print([resultado for resultado, _ in respostas])
+        print(compartilhada, compartilhada.carregar().para_dict())
@@ -0,0 +1,88 @@
+# registro único dos operadores aritméticos
+# cada símbolo aponta para sua aridade, a função de avaliação, a mensagem de
+# erro para divisor zero e os ganchos de geração de código. léxico, gramática,
+# executor, otimizador e geradores consultam esta tabela: um operador novo é
+# acrescentado só aqui (o léxico reconhece símbolos de um caractere)
+
+import operator
+
+def potencia(base, expoente):
+    """
+    potenciação sem resultado complexo
+
+    Raises:
+        ValueError: base negativa com expoente fracionário
+        OverflowError: resultado fora do intervalo de float
+    """
+    resultado = pow(base, expoente)
+    if isinstance(resultado, complex):
+        raise ValueError("Resultado complexo na potenciação")
+    return resultado
+
+def criar_operador(simbolo, avaliar, divisor_zero=None, sem_erro=False, python=None,
+                   numpy=None, assembly=None, erro_nao_finito=False):
+    """
+    cria a definição de um operador binário
+
+    Args:
+        simbolo (str): símbolo no código-fonte
+        avaliar (function): avaliar(operando1, operando2) -> float
+        divisor_zero (str): mensagem de erro quando o segundo operando é zero;
+            None se zero é aceito
+        sem_erro (bool): nunca levanta erro com operandos float (overflow vira
+            inf); permite avaliação inline e içamento para fora de laços
+        python (str): modelo de expressão Python inline, com {0} e {1} para os
+            operandos; None usa a chamada a executar_operacao
+        numpy (str): nome da ufunc do numpy equivalente
+        assembly (str): instruções AVR que combinam r20 e r21 em r20
+        erro_nao_finito (bool): resultado não finito com operandos finitos é
+            erro (a avaliação escalar levanta OverflowError)
+
+    Returns:
+        dict: definição do operador
+    """
+    return {
+        'simbolo': simbolo,
+        'aridade': 2,
+        'avaliar': avaliar,
+        'divisor_zero': divisor_zero,
+        'sem_erro': sem_erro,
+        'python': python,
+        'numpy': numpy,
+        'assembly': assembly,
+        'erro_nao_finito': erro_nao_finito
+    }
+
+OPERADORES = {
+    '+': criar_operador('+', operator.add, sem_erro=True, python="({0} + {1})", numpy='add',
+                        assembly="    add r20, r21\n"),
+    '-': criar_operador('-', operator.sub, sem_erro=True, python="({0} - {1})", numpy='subtract',
+                        assembly="    sub r20, r21\n"),
+    '*': criar_operador('*', operator.mul, sem_erro=True, python="({0} * {1})", numpy='multiply',
+                        assembly="    call multiply_r20_r21\n"),
+    '/': criar_operador('/', operator.truediv, divisor_zero="Divisão por zero", numpy='divide',
+                        assembly="""    mov r16, r20
+    mov r17, r21
+    call div_r16_r17
+    mov r20, r18             ; Quociente em r20
+"""),
+    '%': criar_operador('%', operator.mod, divisor_zero="Divisão por zero no resto", numpy='mod',
+                        assembly="""    mov r16, r20
+    mov r17, r21
+    call div_r16_r17        ; Resto fica em r16
+    mov r20, r16
+"""),
+    '^': criar_operador('^', potencia, numpy='power', assembly="    call power_r20_r21\n",
+                        erro_nao_finito=True)
+}
+
+def obter_operador(simbolo):
+    """
+    definição do operador ou None se o símbolo não é operador aritmético
+    """
+    return OPERADORES.get(simbolo)
+
+if __name__ == '__main__':
+    for simbolo, definicao in OPERADORES.items():
+        print(f"{simbolo}: aridade {definicao['aridade']}, divisor zero: {definicao['divisor_zero']}, "
+              f"inline: {definicao['python']}, numpy: {definicao['numpy']}")
@@ -0,0 +1,437 @@
+# otimizações sobre a árvore sintática: dobramento de constantes e
+# eliminação de subexpressões comuns
+
+import sys
+import os
+import math
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.token_types import *
+from src.executor import ExecutorError, executar_operacao
+from src.operadores import OPERADORES
+from src.syntax_tree import criar_no, contar_nos, gerar_arvore
+from src.control_structures import FUNCOES_RELACIONAIS
+from src.parser import parsear
+
+def criar_estatisticas():
+    """
+    cria contadores do passo de otimização
+
+    Returns:
+        dict: contadores zerados
+    """
+    return {
+        'nos_originais': 0,
+        'nos_otimizados': 0,
+        'nos_eliminados': 0,
+        'constantes_dobradas': 0,
+        'subexpressoes_reutilizadas': 0
+    }
+
+def valor_constante(no):
+    """
+    retorna o valor numérico do nó se ele for um literal (com ou sem parênteses)
+
+    Args:
+        no (dict): nó da árvore
+
+    Returns:
+        float: valor do literal ou None
+    """
+    while no['tipo'] == 'EXPRESSAO' and len(no['filhos']) == 1:
+        no = no['filhos'][0]
+    if no['tipo'] == 'NUMERO':
+        return float(no['valor'])
+    return None
+
+def criar_no_constante(valor):
+    """cria nó NUMERO com a representação exata do valor"""
+    return criar_no('NUMERO', repr(float(valor)), [])
+
+def como_operando(no):
+    """remove parênteses em volta de literal usado como operando"""
+    if no['tipo'] == 'EXPRESSAO' and len(no['filhos']) == 1 and no['filhos'][0]['tipo'] == 'NUMERO':
+        return no['filhos'][0]
+    return no
+
+def dobrar_constantes(no, estatisticas, dobrar_raiz=True, max_expoente=None):
+    """
+    avalia em tempo de compilação as subárvores formadas só por literais
+
+    operações que falhariam em execução (divisão por zero, overflow, resultado
+    complexo) não são dobradas, para que o erro continue acontecendo na linha
+    original. o primeiro operando de uma operação cujo segundo operando é um
+    identificador mantém a última operação: "(1.5 A +)" seria lido como
+    armazenamento ao voltar para tokens.
+
+    Args:
+        no (dict): nó da árvore (não é modificado)
+        estatisticas (dict): contadores do passo
+        dobrar_raiz (bool): False mantém a operação deste nó (os filhos
+            ainda são dobrados)
+        max_expoente (float): ^ com |expoente| maior não é dobrado, para que
+            o orçamento (src.limites) seja verificado na execução
+
+    Returns:
+        dict: nó equivalente, possivelmente reduzido
+    """
+    tipo = no['tipo']
+    if tipo in ('OPERACAO', 'CONDICAO') and como_operando(no['filhos'][1])['tipo'] == 'IDENTIFICADOR':
+        filhos = [dobrar_constantes(no['filhos'][0], estatisticas, False, max_expoente),
+                  dobrar_constantes(no['filhos'][1], estatisticas, True, max_expoente)]
+    elif tipo == 'EXPRESSAO' and len(no['filhos']) == 1:
+        filhos = [dobrar_constantes(no['filhos'][0], estatisticas, dobrar_raiz, max_expoente)]
+    else:
+        filhos = [dobrar_constantes(filho, estatisticas, True, max_expoente) for filho in no['filhos']]
+
+    if tipo in ('OPERACAO', 'CONDICAO', 'COMANDO_ARMAZENAR'):
+        filhos = [como_operando(filho) for filho in filhos]
+
+    if not dobrar_raiz:
+        pass
+    elif tipo == 'OPERACAO':
+        a = valor_constante(filhos[0])
+        b = valor_constante(filhos[1])
+        if max_expoente is not None and no['valor'] == '^' and b is not None and abs(b) > max_expoente:
+            a = None
+        if a is not None and b is not None:
+            try:
+                resultado = executar_operacao(no['valor'], b, a)
+            except (ExecutorError, ZeroDivisionError, OverflowError, ValueError):
+                resultado = None
+            if resultado is not None and math.isfinite(resultado):
+                estatisticas['constantes_dobradas'] += 1
+                return criar_no_constante(resultado)
+
+    elif tipo in ('DECISAO', 'LACO'):
+        condicao = filhos[0]
+        a = valor_constante(condicao['filhos'][0])
+        b = valor_constante(condicao['filhos'][1])
+        if a is not None and b is not None:
+            verdadeira = FUNCOES_RELACIONAIS[condicao['valor']](a, b)
+            if tipo == 'DECISAO':
+                estatisticas['constantes_dobradas'] += 1
+                return filhos[1] if verdadeira else filhos[2]
+            if not verdadeira:
+                # laço que nunca executa vale 0.0
+                estatisticas['constantes_dobradas'] += 1
+                return criar_no_constante(0.0)
+
+    novo = criar_no(tipo, no['valor'], filhos)
+    if 'temporario' in no:
+        novo['temporario'] = no['temporario']
+    return novo
+
+def identificadores_escritos(no, escritos=None):
+    """
+    coleta os identificadores armazenados em qualquer ponto da árvore
+
+    Returns:
+        set: nomes dos identificadores escritos
+    """
+    if escritos is None:
+        escritos = set()
+    if no['tipo'] == 'COMANDO_ARMAZENAR':
+        escritos.add(no['filhos'][1]['valor'])
+    for filho in no['filhos']:
+        identificadores_escritos(filho, escritos)
+    return escritos
+
+def chave_estrutural(no):
+    """
+    forma canônica do nó (parênteses redundantes ignorados)
+
+    Returns:
+        tuple: chave hashable que identifica subárvores estruturalmente iguais
+    """
+    while no['tipo'] == 'EXPRESSAO' and len(no['filhos']) == 1:
+        no = no['filhos'][0]
+    return (no['tipo'], no['valor'], tuple(chave_estrutural(filho) for filho in no['filhos']))
+
+def eh_pura(no, escritos):
+    """verifica se a subárvore não tem efeitos nem lê identificadores escritos na linha"""
+    tipo = no['tipo']
+    if tipo in ('COMANDO_ARMAZENAR', 'DECISAO', 'LACO', 'TEMPORARIO'):
+        return False
+    if tipo == 'IDENTIFICADOR' and no['valor'] in escritos:
+        return False
+    return all(eh_pura(filho, escritos) for filho in no['filhos'])
+
+def eh_invariante(no, escritos):
+    """
+    verifica se a subárvore pode ser calculada uma vez antes do laço
+
+    além de não ler identificadores escritos no laço, ela não pode falhar:
+    é avaliada mesmo quando o laço não executa nenhuma iteração.
+    """
+    tipo = no['tipo']
+    if tipo == 'OPERACAO':
+        # só operações que nunca levantam erro com operandos float
+        if not OPERADORES[no['valor']]['sem_erro']:
+            return False
+    elif tipo == 'IDENTIFICADOR':
+        if no['valor'] in escritos:
+            return False
+    elif tipo not in ('NUMERO', 'EXPRESSAO', 'COMANDO_RECUPERAR'):
+        return False
+    return all(eh_invariante(filho, escritos) for filho in no['filhos'])
+
+def subexpressoes_invariantes(laco):
+    """
+    encontra as operações invariantes de um laço WHILE (maximais: uma
+    invariante dentro de outra não é listada)
+
+    Args:
+        laco (dict): nó LACO
+
+    Returns:
+        list: nós OPERACAO da condição e do bloco que não mudam entre iterações
+    """
+    escritos = identificadores_escritos(laco)
+    encontradas = []
+    condicao, bloco = laco['filhos']
+    for filho in condicao['filhos'] + [bloco]:
+        coletar_invariantes(filho, escritos, encontradas)
+    return encontradas
+
+def coletar_invariantes(no, escritos, encontradas):
+    """acumula operações invariantes sem descer nas já encontradas"""
+    if no['tipo'] == 'OPERACAO' and eh_invariante(no, escritos):
+        encontradas.append(no)
+        return
+    for filho in no['filhos']:
+        coletar_invariantes(filho, escritos, encontradas)
+
+def posicoes_incondicionais(no):
+    """
+    filhos avaliados sempre que o nó é avaliado (exclui blocos de IF e o laço inteiro)
+    """
+    if no['tipo'] == 'DECISAO':
+        return no['filhos'][:1]
+    if no['tipo'] == 'LACO':
+        return []
+    return no['filhos']
+
+def contar_candidatas(no, escritos, contagem):
+    """conta ocorrências de cada operação pura em posição incondicional"""
+    if no['tipo'] == 'OPERACAO' and eh_pura(no, escritos):
+        chave = chave_estrutural(no)
+        contagem[chave] = contagem.get(chave, 0) + 1
+    for filho in posicoes_incondicionais(no):
+        contar_candidatas(filho, escritos, contagem)
+
+def eliminar_subexpressoes_comuns(arvore, estatisticas):
+    """
+    faz subárvores estruturalmente iguais serem calculadas uma única vez
+
+    a primeira ocorrência (na ordem de avaliação) recebe a chave
+    'temporario' com um índice; as seguintes viram nós TEMPORARIO que leem
+    o valor guardado. só participam operações puras fora de blocos de IF e
+    de laços, para que a primeira ocorrência sempre execute antes das demais.
+
+    Args:
+        arvore (dict): raiz da árvore
+        estatisticas (dict): contadores do passo
+
+    Returns:
+        dict: nova árvore
+    """
+    escritos = identificadores_escritos(arvore)
+    contagem = {}
+    contar_candidatas(arvore, escritos, contagem)
+
+    repetidas = {chave for chave, total in contagem.items() if total > 1}
+    if not repetidas:
+        return arvore
+
+    estado = {
+        'escritos': escritos,
+        'repetidas': repetidas,
+        'temporarios': {},
+        'usos': {}
+    }
+    nova = reescrever_subexpressoes(arvore, True, estado)
+    estatisticas['subexpressoes_reutilizadas'] += sum(estado['usos'].values())
+
+    # ocorrências absorvidas por outra reutilização não precisam guardar valor
+    nao_usados = {indice for indice, total in estado['usos'].items() if total == 0}
+    if nao_usados:
+        remover_temporarios(nova, nao_usados)
+
+    return nova
+
+def reescrever_subexpressoes(no, incondicional, estado):
+    """
+    percorre a árvore em ordem de avaliação marcando/reutilizando temporários
+
+    Args:
+        no (dict): nó atual
+        incondicional (bool): se o nó é sempre avaliado quando a linha executa
+        estado (dict): identificadores escritos, chaves repetidas e temporários
+
+    Returns:
+        dict: novo nó
+    """
+    if incondicional and no['tipo'] == 'OPERACAO' and eh_pura(no, estado['escritos']):
+        chave = chave_estrutural(no)
+        if chave in estado['repetidas']:
+            temporarios = estado['temporarios']
+            if chave in temporarios:
+                indice = temporarios[chave]
+                estado['usos'][indice] += 1
+                return criar_no('TEMPORARIO', indice, [])
+
+            indice = temporarios[chave] = len(temporarios)
+            estado['usos'][indice] = 0
+            filhos = [reescrever_subexpressoes(filho, True, estado) for filho in no['filhos']]
+            novo = criar_no(no['tipo'], no['valor'], filhos)
+            novo['temporario'] = indice
+            return novo
+
+    seguros = posicoes_incondicionais(no)
+    filhos = [
+        reescrever_subexpressoes(filho, incondicional and any(filho is s for s in seguros), estado)
+        for filho in no['filhos']
+    ]
+    novo = criar_no(no['tipo'], no['valor'], filhos)
+    if 'temporario' in no:
+        novo['temporario'] = no['temporario']
+    return novo
+
+def remover_temporarios(no, indices):
+    """remove marcação 'temporario' dos índices sem reutilização"""
+    if no.get('temporario') in indices:
+        del no['temporario']
+    for filho in no['filhos']:
+        remover_temporarios(filho, indices)
+
+def otimizar_arvore(arvore, subexpressoes=True, estatisticas=None, max_expoente=None):
+    """
+    aplica dobramento de constantes e eliminação de subexpressões comuns
+
+    Args:
+        arvore (dict): raiz da árvore (syntax_tree.gerar_arvore)
+        subexpressoes (bool): se False, apenas dobra constantes
+        estatisticas (dict): contadores a acumular (criados se omitidos)
+        max_expoente (float): limite de expoente do orçamento de execução;
+            potências acima dele ficam para a execução
+
+    Returns:
+        tuple: (arvore_otimizada, estatisticas)
+    """
+    if estatisticas is None:
+        estatisticas = criar_estatisticas()
+
+    antes = contar_nos(arvore)
+    nova = dobrar_constantes(arvore, estatisticas, max_expoente=max_expoente)
+    if subexpressoes:
+        nova = eliminar_subexpressoes_comuns(nova, estatisticas)
+    depois = contar_nos(nova)
+
+    estatisticas['nos_originais'] += antes
+    estatisticas['nos_otimizados'] += depois
+    estatisticas['nos_eliminados'] += antes - depois
+
+    return nova, estatisticas
+
+def otimizar_programa(arvores, subexpressoes=True):
+    """
+    otimiza todas as árvores de um programa
+
+    Returns:
+        tuple: (arvores_otimizadas, estatisticas acumuladas)
+    """
+    estatisticas = criar_estatisticas()
+    otimizadas = [otimizar_arvore(arvore, subexpressoes, estatisticas)[0] for arvore in arvores]
+    return otimizadas, estatisticas
+
+def arvore_para_tokens(arvore):
+    """
+    converte árvore (sem nós TEMPORARIO) de volta para lista de tokens
+
+    Args:
+        arvore (dict): raiz da árvore
+
+    Returns:
+        list: tokens no formato do analisador léxico
+
+    Raises:
+        ExecutorError: se a árvore tiver nós sem representação em tokens
+    """
+    tokens = []
+    emitir_tokens(arvore, tokens)
+    if tokens[0]['tipo'] != PARENTESE_ABRE:
+        tokens = [criar_token(PARENTESE_ABRE, '(')] + tokens + [criar_token(PARENTESE_FECHA, ')')]
+    return tokens
+
+def emitir_tokens(no, tokens):
+    """emite os tokens de um nó em notação pós-fixa"""
+    tipo = no['tipo']
+    filhos = no['filhos']
+
+    if tipo == 'EXPRESSAO':
+        tokens.append(criar_token(PARENTESE_ABRE, '('))
+        for filho in filhos:
+            emitir_tokens(filho, tokens)
+        tokens.append(criar_token(PARENTESE_FECHA, ')'))
+    elif tipo == 'NUMERO':
+        tokens.append(criar_token(NUMERO, no['valor']))
+    elif tipo == 'IDENTIFICADOR':
+        tokens.append(criar_token(IDENTIFICADOR, no['valor']))
+    elif tipo in ('COMANDO_RECUPERAR', 'COMANDO_ARMAZENAR'):
+        for filho in filhos:
+            emitir_tokens(filho, tokens)
+    elif tipo == 'COMANDO_RES':
+        emitir_tokens(filhos[0], tokens)
+        tokens.append(criar_token(PALAVRA_RESERVADA, 'RES'))
+    elif tipo in ('OPERACAO', 'CONDICAO'):
+        emitir_tokens(filhos[0], tokens)
+        emitir_tokens(filhos[1], tokens)
+        tipo_operador = OPERADOR if tipo == 'OPERACAO' else OPERADOR_RELACIONAL
+        tokens.append(criar_token(tipo_operador, no['valor']))
+    elif tipo in ('DECISAO', 'LACO'):
+        for filho in filhos:
+            emitir_tokens(filho, tokens)
+        tokens.append(criar_token(PALAVRA_RESERVADA, no['valor']))
+    else:
+        raise ExecutorError(f"Nó sem representação em tokens: {tipo}")
+
+def otimizar_tokens(tokens, estatisticas=None):
+    """
+    dobra constantes de uma expressão tokenizada, para backends baseados em tokens
+
+    subexpressões comuns não têm representação em tokens, então só o
+    dobramento é aplicado. expressões que o parser não aceita são
+    devolvidas sem alteração.
+
+    Args:
+        tokens (list): tokens da expressão
+        estatisticas (dict): contadores a acumular
+
+    Returns:
+        list: tokens otimizados
+    """
+    try:
+        # o parser descendente não consulta a tabela LL(1)
+        arvore = gerar_arvore(parsear(tokens, None)['derivacao'])
+    except Exception:
+        return tokens
+    arvore, _ = otimizar_arvore(arvore, subexpressoes=False, estatisticas=estatisticas)
+    return arvore_para_tokens(arvore)
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+    from src.syntax_tree import imprimir_arvore
+
+    exemplos = [
+        "((2 3 +) (4 5 *) -)",
+        "((A B *) (A B *) +)",
+        "(((X 1 +) (2 2 *) *) ((X 1 +) (2 2 *) *) /)"
+    ]
+
+    for linha in exemplos:
+        arvore = gerar_arvore(parsear(parse_expressao(linha), None)['derivacao'])
+        otimizada, estatisticas = otimizar_arvore(arvore)
+        print(f"{linha}")
+        print(imprimir_arvore(otimizada))
+        print(f"  nós eliminados: {estatisticas['nos_eliminados']}\n")
@@ -0,0 +1,241 @@
+# execução paralela de linhas independentes de um programa
+# as únicas ligações entre linhas são (N RES) e leituras/escritas de MEM;
+# o grafo de dependências define níveis que rodam num pool de processos
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.executor import ExecutorError, formatar_resultado
+from src.memoria import MemoriaSlots
+from src.interpretador import compilar_arvore, fundir_instrucoes, executar_codigo
+from src.syntax_tree import coletar_acessos
+
+def analisar_dependencias(arvores):
+    """
+    constrói o grafo de dependências entre as linhas do programa
+
+    uma linha depende de:
+      - linha i-N, para cada (N RES);
+      - último escritor de cada identificador lido (leitura após escrita);
+      - último escritor e leitores posteriores a ele, para cada
+        identificador escrito (escrita após escrita / após leitura).
+
+    escritas dentro de IF/WHILE contam como escritas da linha (conservador).
+
+    Args:
+        arvores (list): árvores sintáticas, uma por linha
+
+    Returns:
+        list: por linha, dict com 'le', 'escreve', 'res' e 'depende' (índices)
+    """
+    analise = []
+    ultimo_escritor = {}
+    leitores = {}
+
+    for i, arvore in enumerate(arvores):
+        acessos = coletar_acessos(arvore)
+        acessos['depende'] = set()
+
+        for n in acessos['res']:
+            if 0 < n <= i:
+                acessos['depende'].add(i - n)
+
+        for nome in acessos['le']:
+            if nome in ultimo_escritor:
+                acessos['depende'].add(ultimo_escritor[nome])
+
+        for nome in acessos['escreve']:
+            if nome in ultimo_escritor:
+                acessos['depende'].add(ultimo_escritor[nome])
+            acessos['depende'].update(leitores.get(nome, ()))
+
+        acessos['depende'].discard(i)
+
+        for nome in acessos['le']:
+            leitores.setdefault(nome, set()).add(i)
+        for nome in acessos['escreve']:
+            ultimo_escritor[nome] = i
+            leitores[nome] = set()
+
+        analise.append(acessos)
+
+    return analise
+
+def calcular_niveis(analise):
+    """
+    agrupa as linhas em níveis: cada linha depende só de níveis anteriores
+
+    Args:
+        analise (list): resultado de analisar_dependencias
+
+    Returns:
+        list: lista de níveis, cada um com índices de linha em ordem crescente
+    """
+    nivel_linha = []
+    niveis = []
+
+    for acessos in analise:
+        nivel = 1 + max((nivel_linha[j] for j in acessos['depende']), default=-1)
+        nivel_linha.append(nivel)
+        if nivel == len(niveis):
+            niveis.append([])
+        niveis[nivel].append(len(nivel_linha) - 1)
+
+    return niveis
+
+def executar_lote(tarefas):
+    """
+    executa um lote de linhas num processo trabalhador
+
+    cada tarefa traz a árvore, os valores de memória que a linha lê e os
+    resultados anteriores que ela referencia por RES.
+
+    Args:
+        tarefas (list): tuplas (indice, arvore, memoria_entrada, resultados_res)
+
+    Returns:
+        list: tuplas (indice, resultado, escritas, erro)
+    """
+    saida = []
+
+    for indice, arvore, memoria_entrada, resultados_res in tarefas:
+        memoria = MemoriaSlots.de_dict(memoria_entrada)
+
+        # histórico mínimo: historico[-n] é o resultado n linhas atrás
+        tamanho = max(resultados_res, default=0)
+        historico = [0.0] * tamanho
+        for n, valor in resultados_res.items():
+            historico[tamanho - n] = valor
+
+        try:
+            codigo = fundir_instrucoes(compilar_arvore(arvore, memoria))
+            resultado = formatar_resultado(executar_codigo(codigo, {
+                'historico_resultados': historico,
+                'memoria': memoria
+            }))
+            saida.append((indice, resultado, memoria.para_dict(), None))
+        except ExecutorError as e:
+            saida.append((indice, None, None, e.mensagem))
+        except (OverflowError, ValueError, ZeroDivisionError) as e:
+            saida.append((indice, None, None, f"Erro numérico: {str(e)}"))
+
+    return saida
+
+def executar_paralelo(arvores, historico_resultados=None, memoria=None, max_processos=None, tamanho_lote=64):
+    """
+    executa um programa avaliando linhas independentes em paralelo
+
+    o resultado é idêntico ao de interpretador.executar_arvores: histórico
+    e memória são atualizados na ordem original das linhas e, em caso de
+    erro, é levantado o da primeira linha que falharia sequencialmente.
+
+    Args:
+        arvores (list): árvores sintáticas, uma por linha
+        historico_resultados (list): histórico de resultados anteriores
+        memoria (dict ou MemoriaSlots): memória inicial
+        max_processos (int): tamanho do pool (None usa os.cpu_count())
+        tamanho_lote (int): linhas enviadas por tarefa ao pool
+
+    Returns:
+        tuple: (resultados, historico_atualizado, memoria_atualizada)
+
+    Raises:
+        ExecutorError: erro da primeira linha que falhou, indicando a linha
+    """
+    if memoria is None:
+        memoria = MemoriaSlots()
+    elif not isinstance(memoria, MemoriaSlots):
+        memoria = MemoriaSlots.de_dict(memoria)
+
+    historico_inicial = list(historico_resultados) if historico_resultados else []
+    analise = analisar_dependencias(arvores)
+    niveis = calcular_niveis(analise)
+
+    resultados = [None] * len(arvores)
+    primeiro_erro = None
+    # estado anterior das células escritas por linha confirmada, para desfazer
+    # linhas posteriores a um erro confirmadas em níveis anteriores
+    confirmadas = []
+
+    with ProcessPoolExecutor(max_workers=max_processos) as pool:
+        for nivel in niveis:
+            # linhas após um erro não executariam sequencialmente
+            if primeiro_erro is not None:
+                nivel = [i for i in nivel if i < primeiro_erro[0]]
+                if not nivel:
+                    continue
+
+            tarefas = [preparar_tarefa(i, arvores[i], analise[i], resultados, historico_inicial, memoria)
+                       for i in nivel]
+            lotes = [tarefas[k:k + tamanho_lote] for k in range(0, len(tarefas), tamanho_lote)]
+
+            concluidas = []
+            for saida in pool.map(executar_lote, lotes):
+                concluidas.extend(saida)
+
+            # confirma em ordem de linha
+            for indice, resultado, escritas, erro in sorted(concluidas, key=lambda item: item[0]):
+                if erro is not None:
+                    if primeiro_erro is None or indice < primeiro_erro[0]:
+                        primeiro_erro = (indice, erro)
+                    continue
+                if primeiro_erro is not None and indice > primeiro_erro[0]:
+                    continue
+                resultados[indice] = resultado
+                nomes = [nome for nome in analise[indice]['escreve'] if nome in escritas]
+                confirmadas.append((indice, memoria.salvar_celulas(nomes)))
+                for nome in nomes:
+                    memoria[nome] = escritas[nome]
+
+    if primeiro_erro is not None:
+        for indice, salvas in reversed(confirmadas):
+            if indice > primeiro_erro[0]:
+                memoria.restaurar_celulas(salvas)
+        raise ExecutorError(primeiro_erro[1], f"linha {primeiro_erro[0] + 1}")
+
+    return resultados, historico_inicial + resultados, memoria
+
+def preparar_tarefa(indice, arvore, acessos, resultados, historico_inicial, memoria):
+    """
+    monta a tarefa de uma linha com os valores que ela precisa
+
+    Returns:
+        tuple: (indice, arvore, memoria_entrada, resultados_res)
+    """
+    memoria_entrada = {nome: memoria[nome] for nome in acessos['le'] | acessos['escreve'] if nome in memoria}
+
+    resultados_res = {}
+    for n in acessos['res']:
+        origem = indice - n
+        if n <= 0:
+            continue
+        if origem >= 0:
+            resultados_res[n] = resultados[origem]
+        elif -origem <= len(historico_inicial):
+            resultados_res[n] = historico_inicial[origem]
+
+    return (indice, arvore, memoria_entrada, resultados_res)
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+    from src.interpretador import gerar_arvores
+
+    programa = [
+        "(10 A)", "(20 B)", "(A 2 *)", "(B 3 *)",
+        "((2 RES) (2 RES) +)", "((A 1 +) A)", "(A B +)"
+    ]
+
+    try:
+        arvores = gerar_arvores([parse_expressao(linha) for linha in programa])
+        niveis = calcular_niveis(analisar_dependencias(arvores))
+        print(f"Níveis: {[[i + 1 for i in nivel] for nivel in niveis]}")
+
+        resultados, _, memoria = executar_paralelo(arvores)
+        for linha, resultado in zip(programa, resultados):
+            print(f"{linha:22} -> {resultado}")
+        print(f"Memória: {memoria.para_dict()}")
+
+    except ExecutorError as e:
+        print(f"Erro: {e}")
@@ -261,6 +261,7 @@ def parse_operacao_ou_estrutura(contexto, tabela):
 def parse_operacao(contexto, tabela):
     """
     analisa OPERACAO -> OPERANDO OPERANDO OPERADOR_ARIT
+    e também condições seguidas de IF/WHILE e o armazenamento ((expr) MEM)
     
     Args:
         contexto (dict): contexto do parser
@@ -277,6 +278,14 @@ def parse_operacao(contexto, tabela):
     if token is None:
         raise ParserError("Esperado operador, encontrado fim de arquivo")
     
+    if token['tipo'] == PARENTESE_FECHA and operando1['tipo'] == 'EXPRESSAO' and operando2['tipo'] == 'IDENTIFICADOR':
+        # armazenar resultado de expressão: ((expr) MEM)
+        return {
+            'tipo': 'COMANDO_ARMAZENAR',
+            'valor': operando1,
+            'identificador': operando2['valor']
+        }
+    
     if token['tipo'] == OPERADOR:
         operador = match(OPERADOR, contexto)
         return {
@@ -294,7 +303,8 @@ def parse_operacao(contexto, tabela):
         bloco1 = parse_expressao(contexto, tabela)
         
         token_estrutura = token_atual(contexto)
-        if token_estrutura and token_estrutura['valor'] == 'IF':
+        if token_estrutura and token_estrutura['tipo'] == PARENTESE_ABRE:
+            # PALAVRA_CONTROLE -> EXPRESSAO IF
             bloco2 = parse_expressao(contexto, tabela)
             match_valor('IF', contexto)
             return {
@@ -0,0 +1,139 @@
+# perfil de execução: contagem por operador e tempo por linha de programa
+# opcional: os executadores só coletam quando recebem um perfil
+
+import sys
+import os
+import json
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.operadores import OPERADORES
+
+OPERADORES_PERFIL = tuple(OPERADORES)
+
+def criar_perfil():
+    """
+    cria perfil vazio; pode ser reaproveitado em várias execuções (acumula)
+
+    Returns:
+        dict: contadores de operações e tempos por linha
+    """
+    return {
+        'operadores': {operador: 0 for operador in OPERADORES_PERFIL},
+        'mem_leituras': 0,
+        'mem_escritas': 0,
+        'res': 0,
+        'aninhadas': 0,
+        'excecoes': 0,
+        'excecoes_por_mensagem': {},
+        'linhas': {},
+        'tempo_total': 0.0
+    }
+
+def texto_tokens(tokens):
+    """
+    reconstrói o texto de uma linha a partir dos tokens
+
+    Args:
+        tokens (list): tokens da linha
+
+    Returns:
+        str: texto no formato "(3 4 +)"
+    """
+    texto = ' '.join(str(token['valor']) for token in tokens)
+    return texto.replace('( ', '(').replace(' )', ')')
+
+def registrar_linha(perfil, numero_linha, texto, segundos, erro=None):
+    """
+    acumula o tempo de uma linha executada
+
+    linhas com o mesmo texto são agregadas, então uma fórmula repetida
+    aparece uma vez com o tempo somado de todas as execuções.
+
+    Args:
+        perfil (dict): perfil em coleta
+        numero_linha (int): número da linha (1-based)
+        texto (str): texto da linha
+        segundos (float): tempo gasto
+        erro (str): mensagem de erro, se a linha falhou
+    """
+    linha = perfil['linhas'].get(texto)
+    if linha is None:
+        linha = {'texto': texto, 'linha': numero_linha, 'execucoes': 0, 'tempo': 0.0, 'erros': 0}
+        perfil['linhas'][texto] = linha
+
+    linha['execucoes'] += 1
+    linha['tempo'] += segundos
+    perfil['tempo_total'] += segundos
+
+    if erro is not None:
+        linha['erros'] += 1
+        perfil['excecoes'] += 1
+        contagem = perfil['excecoes_por_mensagem']
+        contagem[erro] = contagem.get(erro, 0) + 1
+
+def linhas_mais_lentas(perfil, n=10):
+    """
+    retorna as n linhas com maior tempo acumulado
+
+    Returns:
+        list: entradas de linha em ordem decrescente de tempo
+    """
+    return sorted(perfil['linhas'].values(), key=lambda linha: linha['tempo'], reverse=True)[:n]
+
+def relatorio_perfil(perfil, top_n=10):
+    """
+    monta relatório serializável do perfil
+
+    Args:
+        perfil (dict): perfil coletado
+        top_n (int): número de linhas mais lentas no relatório
+
+    Returns:
+        dict: contadores, tempo total e linhas mais lentas
+    """
+    return {
+        'operadores': dict(perfil['operadores']),
+        'mem_leituras': perfil['mem_leituras'],
+        'mem_escritas': perfil['mem_escritas'],
+        'res': perfil['res'],
+        'aninhadas': perfil['aninhadas'],
+        'excecoes': perfil['excecoes'],
+        'excecoes_por_mensagem': dict(perfil['excecoes_por_mensagem']),
+        'linhas_distintas': len(perfil['linhas']),
+        'tempo_total': perfil['tempo_total'],
+        'linhas_mais_lentas': [dict(linha) for linha in linhas_mais_lentas(perfil, top_n)]
+    }
+
+def exportar_perfil_json(perfil, caminho=None, top_n=10):
+    """
+    exporta o relatório do perfil em JSON
+
+    Args:
+        perfil (dict): perfil coletado
+        caminho (str): arquivo de saída; se omitido só retorna o texto
+        top_n (int): número de linhas mais lentas no relatório
+
+    Returns:
+        str: relatório em JSON
+    """
+    texto = json.dumps(relatorio_perfil(perfil, top_n), ensure_ascii=False, indent=2)
+
+    if caminho is not None:
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto)
+
+    return texto
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+    from src.executor import executar_programa, ExecutorError
+
+    programa = ["(10 A)", "((A 2 ^) (A 3 ^) +)", "((1 RES) 7 %)", "(A 0 /)"]
+    perfil = criar_perfil()
+
+    try:
+        executar_programa([parse_expressao(linha) for linha in programa], perfil=perfil)
+    except ExecutorError as e:
+        print(f"Erro: {e}")
+
+    print(exportar_perfil_json(perfil, top_n=3))
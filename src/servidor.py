@@ -0,0 +1,250 @@
+# servidor asyncio de avaliação de expressões RPN em socket Unix
+# cada conexão é uma sessão com memória e histórico próprios; o cliente
+# pode enviar várias linhas sem esperar e recebe uma resposta JSON por linha
+
+import sys
+import os
+import json
+import asyncio
+from collections import deque
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.lexer import parse_expressao, LexerError
+from src.parser import ParserError
+from src.syntax_tree import SyntaxTreeError
+from src.executor import ExecutorError, validar_expressao, avaliar_rpn, formatar_resultado
+from src.memoria import MemoriaSlots, resolver_slots
+from src.token_types import IDENTIFICADOR
+from src.interpretador import gerar_arvores, executar_arvores_em_fatias
+from src.otimizador import identificadores_escritos
+
+CAMINHO_PADRAO = '/tmp/rpn.sock'
+
+def criar_sessao(limite_historico=1000):
+    """
+    cria sessão de cliente
+
+    Args:
+        limite_historico (int): resultados mantidos para RES; os mais antigos
+            são descartados para a sessão não crescer indefinidamente
+
+    Returns:
+        dict: sessão com memória, histórico e contador de linhas
+    """
+    return {
+        'memoria': MemoriaSlots(),
+        'historico': deque(maxlen=limite_historico),
+        'linhas': 0
+    }
+
+def avaliar_linha(sessao, linha):
+    """
+    avalia uma linha no contexto da sessão
+
+    a linha é atômica: se falhar, memória e histórico ficam como antes. só
+    as células dos identificadores da linha são guardadas para desfazer
+    (custo proporcional à linha, não à memória da sessão).
+
+    Args:
+        sessao (dict): sessão do cliente
+        linha (str): expressão RPN
+
+    Returns:
+        dict: {'linha': n, 'resultado': valor} ou
+            {'linha': n, 'erro': {'tipo': ..., 'mensagem': ..., ...}}
+    """
+    sessao['linhas'] += 1
+    resposta = {'linha': sessao['linhas']}
+
+    memoria = sessao['memoria']
+
+    try:
+        tokens = parse_expressao(linha)
+        validar_expressao(tokens)
+
+        resolver_slots([tokens], memoria)
+        salvas = memoria.salvar_celulas({token['valor'] for token in tokens if token['tipo'] == IDENTIFICADOR})
+        try:
+            resultado = formatar_resultado(avaliar_rpn(tokens, {
+                'historico_resultados': sessao['historico'],
+                'memoria': memoria,
+                'pilha': [],
+                'resultado_atual': None
+            }))
+        except BaseException:
+            memoria.restaurar_celulas(salvas)
+            raise
+    except LexerError as e:
+        resposta['erro'] = {'tipo': 'lexico', 'mensagem': e.mensagem, 'posicao': e.posicao}
+        return resposta
+    except ExecutorError as e:
+        resposta['erro'] = {'tipo': 'execucao', 'mensagem': e.mensagem}
+        return resposta
+    except Exception as e:
+        resposta['erro'] = {'tipo': 'execucao', 'mensagem': f"Erro interno durante execução: {str(e)}"}
+        return resposta
+
+    sessao['historico'].append(resultado)
+    resposta['resultado'] = resultado
+    return resposta
+
+async def avaliar_linha_cooperativa(sessao, linha, passos_por_fatia=1000):
+    """
+    avalia uma linha da sessão no interpretador, cedendo a vez a cada fatia
+
+    aceita IF e WHILE; um laço longo não bloqueia as outras sessões. como em
+    avaliar_linha, a linha é atômica: as células que ela pode escrever são
+    guardadas antes e restauradas se ela falhar (ou for cancelada).
+
+    Args:
+        sessao (dict): sessão do cliente
+        linha (str): expressão RPN
+        passos_por_fatia (int): passos entre pausas
+
+    Returns:
+        dict: resposta no formato de avaliar_linha; erros de sintaxe têm
+            tipo 'sintatico'
+    """
+    sessao['linhas'] += 1
+    resposta = {'linha': sessao['linhas']}
+    memoria = sessao['memoria']
+
+    try:
+        arvores = gerar_arvores([parse_expressao(linha)])
+        salvas = memoria.salvar_celulas(identificadores_escritos(arvores[0]))
+        try:
+            resultados, _, _ = await executar_cooperativo(arvores, memoria, historico_resultados=sessao['historico'],
+                                                          passos_por_fatia=passos_por_fatia)
+        except BaseException:
+            memoria.restaurar_celulas(salvas)
+            raise
+    except LexerError as e:
+        resposta['erro'] = {'tipo': 'lexico', 'mensagem': e.mensagem, 'posicao': e.posicao}
+        return resposta
+    except ParserError as e:
+        resposta['erro'] = {'tipo': 'sintatico', 'mensagem': e.mensagem, 'posicao': e.posicao}
+        return resposta
+    except SyntaxTreeError as e:
+        resposta['erro'] = {'tipo': 'sintatico', 'mensagem': e.mensagem}
+        return resposta
+    except ExecutorError as e:
+        resposta['erro'] = {'tipo': 'execucao', 'mensagem': e.mensagem}
+        return resposta
+    except Exception as e:
+        resposta['erro'] = {'tipo': 'execucao', 'mensagem': f"Erro interno durante execução: {str(e)}"}
+        return resposta
+
+    sessao['historico'].append(resultados[0])
+    resposta['resultado'] = resultados[0]
+    return resposta
+
+async def atender_cliente(leitor, escritor, limite_historico=1000):
+    """
+    atende uma conexão até o cliente fechar
+
+    linhas vazias são ignoradas; cada linha não vazia recebe exatamente uma
+    resposta, na ordem de envio.
+
+    Args:
+        leitor (asyncio.StreamReader): fluxo de entrada do cliente
+        escritor (asyncio.StreamWriter): fluxo de saída para o cliente
+        limite_historico (int): tamanho máximo do histórico da sessão
+    """
+    sessao = criar_sessao(limite_historico)
+
+    try:
+        while True:
+            try:
+                dados = await leitor.readline()
+            except ValueError:
+                # linha maior que o limite do leitor: não há como ressincronizar
+                resposta = {'linha': sessao['linhas'] + 1,
+                            'erro': {'tipo': 'protocolo', 'mensagem': 'Linha excede o tamanho máximo'}}
+                escritor.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b'\n')
+                break
+
+            if not dados:
+                break
+
+            linha = dados.decode('utf-8', errors='replace').strip()
+            if not linha:
+                continue
+
+            resposta = await avaliar_linha_cooperativa(sessao, linha)
+            escritor.write(json.dumps(resposta, ensure_ascii=False).encode('utf-8') + b'\n')
+
+            # só bloqueia se o cliente não estiver lendo (buffer acima do limite)
+            await escritor.drain()
+    except ConnectionError:
+        pass
+    finally:
+        escritor.close()
+        try:
+            await escritor.wait_closed()
+        except ConnectionError:
+            pass
+
+async def iniciar_servidor(caminho=CAMINHO_PADRAO, limite_historico=1000):
+    """
+    abre o socket Unix e começa a aceitar conexões
+
+    Args:
+        caminho (str): caminho do socket (um arquivo antigo é removido)
+        limite_historico (int): tamanho máximo do histórico por sessão
+
+    Returns:
+        asyncio.AbstractServer: servidor em execução
+    """
+    if os.path.exists(caminho):
+        os.unlink(caminho)
+
+    async def atender(leitor, escritor):
+        await atender_cliente(leitor, escritor, limite_historico)
+
+    return await asyncio.start_unix_server(atender, path=caminho)
+
+async def executar_cooperativo(arvores, memoria=None, otimizar=False, passos_por_fatia=1000, limites=None,
+                               historico_resultados=None):
+    """
+    executa um programa com WHILE no laço de eventos, cedendo a vez a cada fatia
+
+    outras tarefas (ex.: linhas curtas de outras sessões) rodam entre as
+    fatias, então um laço longo não bloqueia o servidor.
+
+    Args:
+        arvores (list): árvores sintáticas (interpretador.gerar_arvores)
+        memoria (dict ou MemoriaSlots): memória do programa
+        otimizar (bool): como em interpretador.executar_arvores
+        passos_por_fatia (int): passos entre pausas
+        limites (dict): orçamento opcional (src.limites)
+        historico_resultados (list ou deque): resultados anteriores (RES)
+
+    Returns:
+        tuple: (resultados, historico, memoria) como em executar_arvores
+    """
+    execucao = executar_arvores_em_fatias(arvores, historico_resultados, memoria, otimizar,
+                                          passos_por_fatia, limites)
+    while True:
+        try:
+            next(execucao)
+        except StopIteration as fim:
+            return fim.value
+        await asyncio.sleep(0)
+
+async def servir(caminho=CAMINHO_PADRAO, limite_historico=1000):
+    """executa o servidor até ser interrompido"""
+    servidor = await iniciar_servidor(caminho, limite_historico)
+    async with servidor:
+        await servidor.serve_forever()
+
+if __name__ == '__main__':
+    caminho = sys.argv[1] if len(sys.argv) > 1 else CAMINHO_PADRAO
+    print(f"Servindo em {caminho} (exemplo: printf '(2 3 +)\\n(1 RES)\\n' | nc -U {caminho})")
+
+    try:
+        asyncio.run(servir(caminho))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if os.path.exists(caminho):
+            os.unlink(caminho)
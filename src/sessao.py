@@ -0,0 +1,201 @@
+# snapshot binário do estado de uma sessão (histórico e memória)
+#
+# formato (little-endian):
+#   cabeçalho  '<4sHHQIIQ': assinatura, versão, reservado, n_historico,
+#              n_slots, tamanho do bloco de nomes, linhas avaliadas
+#              (a versão 1, sem o último campo, ainda é lida)
+#   historico  n_historico doubles
+#   valores    n_slots doubles (ordem dos slots)
+#   bitmap     n_slots bytes (slot inicializado)
+#   nomes      n_slots entradas: comprimento '<H' + nome em UTF-8
+#
+# os doubles começam alinhados em 8 bytes, então o histórico pode ser lido
+# direto de um mmap, sem cópia
+
+import sys
+import os
+import mmap
+import struct
+from array import array
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.memoria import MemoriaSlots
+
+ASSINATURA = b'RPNS'
+VERSAO_FORMATO = 2
+CABECALHO = struct.Struct('<4sHHQIIQ')
+CABECALHOS = {1: struct.Struct('<4sHHQII'), 2: CABECALHO}
+COMPRIMENTO_NOME = struct.Struct('<H')
+
+class SessaoError(Exception):
+    """exceção para arquivos de sessão inválidos"""
+    def __init__(self, mensagem, caminho=None):
+        self.mensagem = mensagem
+        self.caminho = caminho
+        super().__init__(f"Erro de sessão{' em ' + str(caminho) if caminho else ''}: {mensagem}")
+
+def doubles_little_endian(valores):
+    """converte array('d') para bytes little-endian"""
+    if sys.byteorder != 'little':
+        valores = array('d', valores)
+        valores.byteswap()
+    return valores.tobytes()
+
+def salvar_sessao(caminho, historico_resultados, memoria, linhas=None):
+    """
+    grava histórico e memória em formato binário compacto
+
+    Args:
+        caminho (str): arquivo de destino
+        historico_resultados (iterable): resultados anteriores (list, deque, array)
+        memoria (dict ou MemoriaSlots): memória da sessão
+        linhas (int): linhas avaliadas na sessão, inclusive as que falharam;
+            None usa o tamanho do histórico
+
+    Returns:
+        int: número de bytes gravados
+    """
+    if not isinstance(memoria, MemoriaSlots):
+        memoria = MemoriaSlots.de_dict(memoria)
+
+    historico = historico_resultados if isinstance(historico_resultados, array) \
+        else array('d', historico_resultados)
+
+    nomes = sorted(memoria.tabela, key=memoria.tabela.get)
+    bloco_nomes = bytearray()
+    for nome in nomes:
+        codificado = nome.encode('utf-8')
+        bloco_nomes += COMPRIMENTO_NOME.pack(len(codificado)) + codificado
+
+    partes = [
+        CABECALHO.pack(ASSINATURA, VERSAO_FORMATO, 0, len(historico), len(nomes), len(bloco_nomes),
+                       len(historico) if linhas is None else linhas),
+        doubles_little_endian(historico),
+        doubles_little_endian(memoria.valores),
+        bytes(memoria.inicializados),
+        bytes(bloco_nomes)
+    ]
+
+    # grava em arquivo temporário e renomeia: um snapshot nunca fica pela metade
+    temporario = caminho + '.tmp'
+    with open(temporario, 'wb') as arquivo:
+        for parte in partes:
+            arquivo.write(parte)
+    os.replace(temporario, caminho)
+
+    return sum(len(parte) for parte in partes)
+
+def carregar_sessao(caminho, usar_mmap=False):
+    """
+    restaura histórico e memória gravados por salvar_sessao
+
+    Returns:
+        tuple: (historico, memoria), como em carregar_estado_sessao
+
+    Raises:
+        SessaoError: se o arquivo estiver truncado ou não for uma sessão
+    """
+    historico, memoria, _ = carregar_estado_sessao(caminho, usar_mmap)
+    return historico, memoria
+
+def carregar_estado_sessao(caminho, usar_mmap=False):
+    """
+    restaura histórico, memória e contador de linhas gravados por salvar_sessao
+
+    o custo é proporcional ao tamanho do arquivo. com usar_mmap=True o
+    histórico é uma memoryview somente leitura sobre o arquivo mapeado
+    (sem cópia; as páginas são lidas sob demanda) - serve para consultas RES,
+    e array('d', historico) produz uma cópia extensível.
+
+    Args:
+        caminho (str): arquivo de sessão
+        usar_mmap (bool): mapeia o arquivo em vez de lê-lo
+
+    Returns:
+        tuple: (historico, memoria, linhas) - array('d') ou memoryview,
+            MemoriaSlots e linhas avaliadas (tamanho do histórico na versão 1)
+
+    Raises:
+        SessaoError: se o arquivo estiver truncado ou não for uma sessão
+    """
+    with open(caminho, 'rb') as arquivo:
+        if usar_mmap:
+            if os.fstat(arquivo.fileno()).st_size == 0:
+                raise SessaoError("Arquivo vazio", caminho)
+            dados = memoryview(mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            dados = memoryview(arquivo.read())
+
+    if len(dados) < 6:
+        raise SessaoError("Arquivo truncado", caminho)
+    assinatura, versao = struct.unpack_from('<4sH', dados)
+    if assinatura != ASSINATURA:
+        raise SessaoError("Assinatura inválida", caminho)
+    cabecalho = CABECALHOS.get(versao)
+    if cabecalho is None:
+        raise SessaoError(f"Versão de formato não suportada: {versao}", caminho)
+    if len(dados) < cabecalho.size:
+        raise SessaoError("Arquivo truncado", caminho)
+
+    campos = cabecalho.unpack_from(dados)
+    n_historico, n_slots, tamanho_nomes = campos[3:6]
+    linhas = campos[6] if versao >= 2 else n_historico
+
+    inicio_valores = cabecalho.size + 8 * n_historico
+    inicio_bitmap = inicio_valores + 8 * n_slots
+    inicio_nomes = inicio_bitmap + n_slots
+    if len(dados) != inicio_nomes + tamanho_nomes:
+        raise SessaoError("Tamanho do arquivo não confere com o cabeçalho", caminho)
+
+    bloco_historico = dados[cabecalho.size:inicio_valores]
+    if usar_mmap and sys.byteorder == 'little':
+        historico = bloco_historico.cast('d')
+    else:
+        historico = ler_doubles(bloco_historico)
+
+    memoria = MemoriaSlots.__new__(MemoriaSlots)
+    memoria.valores = ler_doubles(dados[inicio_valores:inicio_bitmap])
+    memoria.inicializados = bytearray(dados[inicio_bitmap:inicio_nomes])
+    memoria.tabela = {}
+
+    posicao = inicio_nomes
+    for slot in range(n_slots):
+        (comprimento,) = COMPRIMENTO_NOME.unpack_from(dados, posicao)
+        posicao += COMPRIMENTO_NOME.size
+        memoria.tabela[bytes(dados[posicao:posicao + comprimento]).decode('utf-8')] = slot
+        posicao += comprimento
+
+    if len(memoria.tabela) != n_slots:
+        raise SessaoError("Nomes de memória repetidos", caminho)
+
+    return historico, memoria, linhas
+
+def ler_doubles(dados):
+    """converte bytes little-endian em array('d')"""
+    valores = array('d')
+    valores.frombytes(dados)
+    if sys.byteorder != 'little':
+        valores.byteswap()
+    return valores
+
+if __name__ == '__main__':
+    import tempfile
+    import time
+
+    historico = [float(i) for i in range(1_000_000)]
+    memoria = {f"VAR{i}": i * 0.5 for i in range(1000)}
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'sessao.bin')
+
+        inicio = time.perf_counter()
+        tamanho = salvar_sessao(caminho, historico, memoria)
+        print(f"Gravado: {tamanho:,} bytes em {(time.perf_counter() - inicio) * 1000:.1f} ms")
+
+        for usar_mmap in (False, True):
+            inicio = time.perf_counter()
+            historico_lido, memoria_lida = carregar_sessao(caminho, usar_mmap)
+            decorrido = (time.perf_counter() - inicio) * 1000
+            print(f"Carregado (mmap={usar_mmap}): {decorrido:.1f} ms, "
+                  f"último resultado {historico_lido[-1]}, VAR999 = {memoria_lida['VAR999']}")
+            del historico_lido
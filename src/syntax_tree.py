@@ -92,7 +92,11 @@ def converter_derivacao_para_arvore(derivacao):
         valor = derivacao.get('valor')
         identificador = derivacao.get('identificador')
         
-        filho_valor = criar_no('NUMERO', valor, [])
+        # valor pode ser número literal ou expressão: ((expr) MEM)
+        if isinstance(valor, dict):
+            filho_valor = converter_derivacao_para_arvore(valor)
+        else:
+            filho_valor = criar_no('NUMERO', valor, [])
         filho_id = criar_no('IDENTIFICADOR', identificador, [])
         
         return criar_no('COMANDO_ARMAZENAR', None, [filho_valor, filho_id])
@@ -292,6 +296,37 @@ def calcular_altura(raiz):
     
     return 1 + max(alturas_filhos) if alturas_filhos else 0
 
+def coletar_acessos(no, acessos=None):
+    """
+    coleta identificadores lidos, escritos e distâncias de RES de uma árvore
+    
+    Args:
+        no (dict): nó da árvore
+        acessos (dict): conjuntos 'le', 'escreve' e 'res' a preencher
+        
+    Returns:
+        dict: conjuntos 'le', 'escreve' e 'res'
+    """
+    if acessos is None:
+        acessos = {'le': set(), 'escreve': set(), 'res': set()}
+    
+    tipo = no['tipo']
+    
+    if tipo == 'COMANDO_ARMAZENAR':
+        coletar_acessos(no['filhos'][0], acessos)
+        acessos['escreve'].add(no['filhos'][1]['valor'])
+        return acessos
+    
+    if tipo == 'IDENTIFICADOR':
+        acessos['le'].add(no['valor'])
+    elif tipo == 'COMANDO_RES':
+        acessos['res'].add(int(float(no['filhos'][0]['valor'])))
+    
+    for filho in no.get('filhos', []):
+        coletar_acessos(filho, acessos)
+    
+    return acessos
+
 if __name__ == '__main__':
     # teste da árvore sintática
     print("=== TESTE DA ÁRVORE SINTÁTICA ===\n")
@@ -1,5 +1,7 @@
 # definições de tipos de tokens e funções auxiliares para o analisador léxico
 
+from src.operadores import OPERADORES
+
 # constantes para tipos de tokens
 NUMERO = "NUMERO"
 OPERADOR = "OPERADOR"
@@ -10,7 +12,7 @@ PALAVRA_RESERVADA = "PALAVRA_RESERVADA"
 IDENTIFICADOR = "IDENTIFICADOR"
 
 # conjuntos de caracteres válidos
-OPERADORES_VALIDOS = {'+', '-', '*', '/', '%', '^'}
+OPERADORES_VALIDOS = frozenset(OPERADORES)
 OPERADORES_RELACIONAIS = {'>', '<', '=', '!'}
 PALAVRAS_RESERVADAS = {'RES', 'IF', 'WHILE', 'THEN', 'ELSE', 'PRINT'}
 
@@ -0,0 +1,142 @@
+# varredura de parâmetros: um programa executado uma vez por linha de CSV
+# as colunas do CSV são identificadores de memória; o programa é analisado e
+# compilado uma única vez (src.compilador) e as linhas são distribuídas em
+# lotes entre processos trabalhadores
+
+import sys
+import os
+import csv
+import marshal
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.executor import ExecutorError
+from src.compilador import ler_programa, gerar_codigo_python, criar_namespace
+
+# função do programa compilado, carregada uma vez por processo
+_programa = None
+
+def carregar_funcao(codigo_serializado):
+    """
+    instala a função do programa compilado neste processo
+
+    Args:
+        codigo_serializado (bytes): objeto de código em formato marshal
+    """
+    global _programa
+    namespace = criar_namespace()
+    exec(marshal.loads(codigo_serializado), namespace)
+    _programa = namespace['executar']
+
+def executar_linhas_csv(linhas):
+    """
+    executa o programa para um lote de linhas do CSV
+
+    Args:
+        linhas (list): dicts coluna -> texto
+
+    Returns:
+        list: por linha, (resultados, erro)
+    """
+    saida = []
+    for linha in linhas:
+        try:
+            memoria = {nome: float(valor) for nome, valor in linha.items()}
+        except (TypeError, ValueError) as e:
+            saida.append((None, f"Valor não numérico: {str(e)}"))
+            continue
+
+        try:
+            historico, _ = _programa(memoria)
+            saida.append((historico, None))
+        except ExecutorError as e:
+            saida.append((None, f"{e.contexto}: {e.mensagem}"))
+    return saida
+
+def lotes(iteravel, tamanho):
+    """divide um iterável em listas de até tamanho elementos"""
+    iterador = iter(iteravel)
+    while True:
+        lote = list(islice(iterador, tamanho))
+        if not lote:
+            return
+        yield lote
+
+def executar_varredura(caminho_programa, caminho_csv, caminho_saida, max_processos=None,
+                       tamanho_lote=256, otimizar=False):
+    """
+    executa o programa uma vez por linha do CSV e grava os resultados
+
+    o CSV de saída repete as colunas de entrada e acrescenta resultado_1 ...
+    resultado_N (uma por linha de programa) e erro. a ordem das linhas é
+    preservada; no máximo 4 lotes por processo ficam em memória de cada vez.
+
+    Args:
+        caminho_programa (str): arquivo do programa RPN
+        caminho_csv (str): CSV com cabeçalho; colunas são identificadores
+        caminho_saida (str): CSV de saída
+        max_processos (int): número de processos (None usa os.cpu_count();
+            0 ou 1 executa no processo atual)
+        tamanho_lote (int): linhas do CSV enviadas por tarefa
+        otimizar (bool): aplica src.otimizador antes de compilar
+
+    Returns:
+        dict: número de 'linhas' processadas e de 'erros'
+
+    Raises:
+        CompiladorError: se o programa não compilar
+    """
+    with open(caminho_programa, encoding='utf-8') as arquivo:
+        arvores = ler_programa(arquivo.read(), otimizar)
+    n_resultados = len(arvores)
+    # objetos de código não passam por pickle; marshal sim
+    codigo_serializado = marshal.dumps(compile(gerar_codigo_python(arvores), caminho_programa, 'exec'))
+
+    estatisticas = {'linhas': 0, 'erros': 0}
+    processos = os.cpu_count() if max_processos is None else max_processos
+
+    with open(caminho_csv, newline='', encoding='utf-8') as entrada, \
+         open(caminho_saida, 'w', newline='', encoding='utf-8') as saida:
+        leitor = csv.DictReader(entrada)
+        colunas = list(leitor.fieldnames or [])
+        escritor = csv.writer(saida)
+        escritor.writerow(colunas + [f"resultado_{i}" for i in range(1, n_resultados + 1)] + ['erro'])
+
+        def gravar(lote, respostas):
+            for linha, (resultados, erro) in zip(lote, respostas):
+                estatisticas['linhas'] += 1
+                if erro is None:
+                    escritor.writerow([linha[coluna] for coluna in colunas] + list(resultados) + [''])
+                else:
+                    estatisticas['erros'] += 1
+                    escritor.writerow([linha[coluna] for coluna in colunas] + [''] * n_resultados + [erro])
+
+        if processos <= 1:
+            carregar_funcao(codigo_serializado)
+            for lote in lotes(leitor, tamanho_lote):
+                gravar(lote, executar_linhas_csv(lote))
+            return estatisticas
+
+        with ProcessPoolExecutor(max_workers=processos, initializer=carregar_funcao,
+                                 initargs=(codigo_serializado,)) as pool:
+            # janela limitada de lotes em andamento: memória constante
+            for janela in lotes(lotes(leitor, tamanho_lote), 4 * processos):
+                for lote, respostas in zip(janela, pool.map(executar_linhas_csv, janela)):
+                    gravar(lote, respostas)
+
+    return estatisticas
+
+if __name__ == '__main__':
+    if len(sys.argv) < 4:
+        print("Uso: python src/varredura.py <programa.txt> <parametros.csv> <saida.csv> [processos]")
+        sys.exit(1)
+
+    processos = int(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    try:
+        estatisticas = executar_varredura(sys.argv[1], sys.argv[2], sys.argv[3], processos)
+        print(f"{estatisticas['linhas']} linhas, {estatisticas['erros']} com erro")
+    except Exception as e:
+        print(f"Erro: {e}")
+        sys.exit(2)
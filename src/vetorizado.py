@@ -0,0 +1,284 @@
+# avaliação vetorizada com NumPy: uma expressão sobre muitas linhas de dados
+# cada identificador é ligado a um array (uma posição por linha de entrada)
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.executor import ExecutorError
+from src.operadores import OPERADORES
+
+try:
+    import numpy as np
+except ImportError:  # dependência opcional
+    np = None
+
+def exigir_numpy():
+    """
+    garante que NumPy está disponível
+
+    Raises:
+        ExecutorError: se NumPy não estiver instalado
+    """
+    if np is None:
+        raise ExecutorError("Modo vetorizado requer NumPy (pip install numpy)")
+
+def criar_contexto_vetorizado(colunas, n_linhas=None):
+    """
+    cria contexto de avaliação vetorizada
+
+    Args:
+        colunas (dict): identificador -> array (ou escalar) com um valor por linha
+        n_linhas (int): número de linhas; inferido das colunas se omitido
+
+    Returns:
+        dict: contexto com memória, histórico e máscara de erros
+
+    Raises:
+        ExecutorError: se os tamanhos das colunas divergirem
+    """
+    exigir_numpy()
+
+    tamanhos = {np.shape(valor)[0] for valor in colunas.values() if np.ndim(valor) > 0}
+    if n_linhas is not None:
+        tamanhos.add(n_linhas)
+    if len(tamanhos) > 1:
+        raise ExecutorError(f"Colunas com tamanhos diferentes: {sorted(tamanhos)}")
+    if not tamanhos:
+        raise ExecutorError("Número de linhas não informado")
+    n_linhas = tamanhos.pop()
+
+    memoria = {}
+    for nome, valor in colunas.items():
+        memoria[nome] = np.broadcast_to(np.asarray(valor, dtype=np.float64), (n_linhas,)).copy()
+
+    return {
+        'memoria': memoria,
+        'historico_resultados': [],
+        'erros': np.zeros(n_linhas, dtype=bool),
+        'temporarios': {},
+        'linhas': n_linhas
+    }
+
+def aplicar_operacao_vetorizada(operador, a, b, ativo, contexto):
+    """
+    aplica operador aritmético elemento a elemento
+
+    divisões por zero e resultados não finitos de ^ marcam a linha com erro
+    (apenas nas posições ativas) e produzem NaN nessa posição.
+
+    Args:
+        operador (str): operador aritmético
+        a (ndarray): primeiro operando
+        b (ndarray): segundo operando
+        ativo (ndarray): máscara das linhas em avaliação
+        contexto (dict): contexto vetorizado
+
+    Returns:
+        ndarray: resultado
+    """
+    definicao = OPERADORES.get(operador)
+    if definicao is None:
+        raise ExecutorError(f"Operador inválido: {operador}")
+
+    funcao = getattr(np, definicao['numpy'])
+    if definicao['sem_erro']:
+        return funcao(a, b)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        if definicao['divisor_zero'] is not None:
+            zero = b == 0
+            resultado = funcao(a, np.where(zero, 1.0, b))
+            resultado[zero] = np.nan
+            contexto['erros'] |= zero & ativo
+            return resultado
+
+        resultado = funcao(a, b)
+        if definicao['erro_nao_finito']:
+            invalido = ~np.isfinite(resultado) & np.isfinite(a) & np.isfinite(b)
+            contexto['erros'] |= invalido & ativo
+        return resultado
+
+OPERADORES_RELACIONAIS_VETORIZADOS = {
+    '>': 'greater',
+    '<': 'less',
+    '==': 'equal',
+    '!=': 'not_equal',
+    '>=': 'greater_equal',
+    '<=': 'less_equal'
+}
+
+def avaliar_condicao_vetorizada(condicao, contexto, ativo):
+    """avalia nó CONDICAO, retornando máscara booleana por linha"""
+    nome = OPERADORES_RELACIONAIS_VETORIZADOS.get(condicao['valor'])
+    if nome is None:
+        raise ExecutorError(f"Condição inválida: {condicao['valor']}")
+
+    operando1, operando2 = condicao['filhos']
+    a = avaliar_no_vetorizado(operando1, contexto, ativo)
+    b = avaliar_no_vetorizado(operando2, contexto, ativo)
+    return getattr(np, nome)(a, b)
+
+def avaliar_no_vetorizado(no, contexto, ativo):
+    """
+    avalia nó da árvore sintática para todas as linhas de uma vez
+
+    Args:
+        no (dict): nó da árvore
+        contexto (dict): contexto vetorizado
+        ativo (ndarray): máscara das linhas em que o nó é executado
+            (IF e WHILE restringem a máscara; escritas em memória só
+            afetam linhas ativas)
+
+    Returns:
+        ndarray: valor do nó por linha
+    """
+    tipo = no['tipo']
+    filhos = no['filhos']
+
+    if tipo == 'EXPRESSAO':
+        return avaliar_no_vetorizado(filhos[0], contexto, ativo)
+
+    if tipo == 'NUMERO':
+        return np.full(contexto['linhas'], float(no['valor']))
+
+    if tipo == 'IDENTIFICADOR':
+        valor = contexto['memoria'].get(no['valor'])
+        return valor if valor is not None else np.zeros(contexto['linhas'])
+
+    if tipo == 'COMANDO_RECUPERAR':
+        return avaliar_no_vetorizado(filhos[0], contexto, ativo)
+
+    if tipo == 'COMANDO_ARMAZENAR':
+        valor = avaliar_no_vetorizado(filhos[0], contexto, ativo)
+        nome = filhos[1]['valor']
+        anterior = contexto['memoria'].get(nome)
+        if anterior is None:
+            anterior = np.zeros(contexto['linhas'])
+        contexto['memoria'][nome] = np.where(ativo, valor, anterior)
+        return valor
+
+    if tipo == 'COMANDO_RES':
+        n = int(float(filhos[0]['valor']))
+        historico = contexto['historico_resultados']
+        if n <= 0 or n > len(historico):
+            raise ExecutorError(f"RES: não há resultado {n} linhas atrás")
+        valores, erros = historico[-n]
+        # resultado que falhou numa linha continua inválido para quem o referencia
+        contexto['erros'] |= erros & ativo
+        return valores
+
+    if tipo == 'OPERACAO':
+        a = avaliar_no_vetorizado(filhos[0], contexto, ativo)
+        b = avaliar_no_vetorizado(filhos[1], contexto, ativo)
+        resultado = aplicar_operacao_vetorizada(no['valor'], a, b, ativo, contexto)
+        if 'temporario' in no:
+            # subexpressão comum marcada por src.otimizador
+            contexto['temporarios'][no['temporario']] = resultado
+        return resultado
+
+    if tipo == 'TEMPORARIO':
+        return contexto['temporarios'][no['valor']]
+
+    if tipo == 'DECISAO':
+        condicao, bloco_verdadeiro, bloco_falso = filhos
+        teste = avaliar_condicao_vetorizada(condicao, contexto, ativo)
+        verdadeiro = avaliar_no_vetorizado(bloco_verdadeiro, contexto, ativo & teste)
+        falso = avaliar_no_vetorizado(bloco_falso, contexto, ativo & ~teste)
+        return np.where(teste, verdadeiro, falso)
+
+    if tipo == 'LACO':
+        condicao, bloco = filhos
+        resultado = np.zeros(contexto['linhas'])
+        ativo_laco = ativo.copy()
+        # itera enquanto alguma linha ainda satisfaz a condição
+        while True:
+            teste = avaliar_condicao_vetorizada(condicao, contexto, ativo_laco)
+            ativo_laco &= teste & ~contexto['erros']
+            if not ativo_laco.any():
+                return resultado
+            valor = avaliar_no_vetorizado(bloco, contexto, ativo_laco)
+            resultado = np.where(ativo_laco, valor, resultado)
+
+    raise ExecutorError(f"Nó não executável: {tipo}")
+
+def arredondar_como_escalar(valores):
+    """
+    arredonda para 2 casas com o mesmo resultado de round(valor, 2)
+
+    np.round multiplica por 100 e arredonda, o que diverge de round() perto
+    de empates decimais (2.675 vira 2.68; round dá 2.67, pois o double é
+    2.67499...) e transborda para valores enormes. essas posições são
+    refeitas com round(); nas demais, k/100 com k inteiro exato já é o
+    double mais próximo, igual ao de round().
+
+    Args:
+        valores (ndarray): valores float64
+
+    Returns:
+        ndarray: valores arredondados
+    """
+    with np.errstate(invalid='ignore', over='ignore'):
+        escalados = valores * 100.0
+        arredondados = np.round(escalados) / 100.0
+        # |x| < 1e7: erro de x * 100 bem abaixo da janela em volta do empate
+        suspeitos = (np.abs(np.abs(escalados) % 1.0 - 0.5) < 1e-6) | ~(np.abs(valores) < 1e7)
+    suspeitos &= np.isfinite(valores)
+    for indice in np.flatnonzero(suspeitos):
+        arredondados[indice] = round(float(valores[indice]), 2)
+    return arredondados
+
+def executar_vetorizado(arvores, colunas, n_linhas=None):
+    """
+    executa um programa (uma árvore por linha de programa) sobre todas as
+    linhas de dados simultaneamente
+
+    diferente do executador escalar, erros não abortam: cada linha de
+    programa devolve uma máscara com as linhas de dados que falharam (valor
+    NaN). como na execução escalar, que pára no primeiro erro, uma linha de
+    dados que falhou fica desativada nas linhas de programa seguintes: não
+    escreve na memória e continua marcada com erro. o arredondamento é o
+    mesmo de round(valor, 2) (ver arredondar_como_escalar).
+
+    Args:
+        arvores (list): árvores sintáticas do programa
+        colunas (dict): identificador -> array com um valor por linha de dados
+        n_linhas (int): número de linhas de dados, se não houver colunas
+
+    Returns:
+        tuple: (resultados, erros, memoria) - listas de arrays por linha de
+            programa e a memória final (identificador -> array)
+    """
+    contexto = criar_contexto_vetorizado(colunas, n_linhas)
+    falhas = np.zeros(contexto['linhas'], dtype=bool)
+    resultados = []
+    erros = []
+
+    for arvore in arvores:
+        contexto['erros'] = falhas.copy()
+        valor = avaliar_no_vetorizado(arvore, contexto, ~falhas)
+        falhas = contexto['erros']
+        valor = np.where(falhas, np.nan, arredondar_como_escalar(valor))
+
+        contexto['historico_resultados'].append((valor, contexto['erros']))
+        resultados.append(valor)
+        erros.append(contexto['erros'])
+
+    return resultados, erros, contexto['memoria']
+
+if __name__ == '__main__':
+    from src.lexer import parse_expressao
+    from src.interpretador import gerar_arvores
+
+    try:
+        exigir_numpy()
+        programa = ["(A B /)", "(A 10 > (A) (B) IF)", "((1 RES) 2 *)"]
+        arvores = gerar_arvores([parse_expressao(linha) for linha in programa])
+        colunas = {'A': np.array([1.0, 20.0, 3.0]), 'B': np.array([2.0, 4.0, 0.0])}
+
+        resultados, erros, _ = executar_vetorizado(arvores, colunas)
+        for linha, valores, mascara in zip(programa, resultados, erros):
+            print(f"{linha:25} -> {valores} erros={mascara}")
+
+    except ExecutorError as e:
+        print(f"Erro: {e}")
@@ -0,0 +1,142 @@
+"""
+testes para a compilação antecipada de programas
+"""
+
+import unittest
+import random
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import compilador
+from src.compilador import (executar_arquivo_compilado, compilar_programa, ler_programa,
+                            CompiladorError)
+from src.interpretador import executar_arvores
+from src.executor import ExecutorError
+
+def executar_texto(diretorio, texto, **opcoes):
+    """grava o programa num arquivo e executa a versão compilada"""
+    caminho = os.path.join(diretorio, 'programa.txt')
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write(texto)
+    return executar_arquivo_compilado(caminho, **opcoes)
+
+class TestCompilador(unittest.TestCase):
+    """testes para geração de código Python e cache em disco"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        compilador._programas_carregados.clear()
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def teste_equivalente_ao_interpretador(self):
+        """teste resultados e memória iguais aos do interpretador"""
+        texto = "\n".join([
+            "(0 I)", "(I 10 < ((I 1 +) I) WHILE)", "(I 5 > (I 2 *) (I) IF)",
+            "((1 RES) 3 ^)", "(17 5 %)", "(15.6 3.0 /)", "", "(VAR)", "((2 RES) (1 RES) -)"
+        ])
+        esperado, _, memoria_esperada = executar_arvores(ler_programa(texto))
+        resultados, _, memoria = executar_texto(self.diretorio.name, texto)
+
+        self.assertEqual(resultados, esperado)
+        self.assertEqual(memoria, memoria_esperada)
+
+    def teste_ordem_de_avaliacao_com_escrita(self):
+        """teste leitura anterior à escrita na mesma linha"""
+        resultados, _, memoria = executar_texto(self.diretorio.name, "(1 A)\n(A ((A 10 +) A) +)\n")
+
+        self.assertEqual(resultados, [1.0, 12.0])
+        self.assertEqual(memoria['A'], 11.0)
+
+    def teste_memoria_inicial(self):
+        """teste memória inicial vira variáveis locais"""
+        resultados, _, memoria = executar_texto(self.diretorio.name, "(X 2 *)\n", memoria={'X': 4.0})
+
+        self.assertEqual(resultados, [8.0])
+        self.assertEqual(memoria, {'X': 4.0})
+
+    def teste_erro_indica_linha(self):
+        """teste erros de execução com número da linha"""
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_texto(self.diretorio.name, "(1 2 +)\n(1 0 /)\n")
+        self.assertEqual(contexto.exception.contexto, "linha 2")
+
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_texto(self.diretorio.name, "(1 2 +)\n(3 RES)\n")
+        self.assertIn("RES", contexto.exception.mensagem)
+
+    def teste_memoria_nao_usada_preservada(self):
+        """teste células da memória inicial que o programa não usa continuam na saída"""
+        _, _, memoria = executar_texto(self.diretorio.name, "(1 A)\n", memoria={'B': 2.0, 'A': 0.0})
+
+        self.assertEqual(memoria, {'A': 1.0, 'B': 2.0})
+
+    def teste_erro_do_primeiro_operando(self):
+        """teste primeiro operando avaliado antes do segundo, como no interpretador"""
+        texto = "((1 0 /) (1 0 %) /)\n"
+        with self.assertRaises(ExecutorError) as esperado:
+            executar_arvores(ler_programa(texto))
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_texto(self.diretorio.name, texto)
+        self.assertEqual(contexto.exception.mensagem, esperado.exception.mensagem)
+        self.assertEqual(contexto.exception.mensagem, "Divisão por zero")
+
+    def teste_linha_de_erro_ignora_linhas_vazias(self):
+        """teste erro de compilação e de execução contam as mesmas linhas"""
+        with self.assertRaises(CompiladorError) as contexto:
+            compilar_programa("(1 2 +)\n\n(3.14.5 2 +)\n")
+        self.assertEqual(contexto.exception.linha, 2)
+
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_texto(self.diretorio.name, "(1 2 +)\n\n(1 0 /)\n")
+        self.assertEqual(contexto.exception.contexto, "linha 2")
+
+    def teste_erro_lexico_na_compilacao(self):
+        """teste programa inválido não compila"""
+        with self.assertRaises(CompiladorError) as contexto:
+            compilar_programa("(1 2 +)\n(3.14.5 2 +)\n")
+        self.assertEqual(contexto.exception.linha, 2)
+
+    def teste_cache_em_disco(self):
+        """teste programa inalterado é carregado do cache sem recompilar"""
+        texto = "(2 3 +)\n((1 RES) 2 *)\n"
+        executar_texto(self.diretorio.name, texto)
+        cache = os.path.join(self.diretorio.name, '__rpncache__')
+        self.assertEqual(len(os.listdir(cache)), 1)
+
+        compilador._programas_carregados.clear()
+        original = compilador.compilar_programa
+        compilador.compilar_programa = None  # falharia se fosse chamado
+        try:
+            resultados, _, _ = executar_texto(self.diretorio.name, texto)
+        finally:
+            compilador.compilar_programa = original
+
+        self.assertEqual(resultados, [5.0, 10.0])
+
+    def teste_programas_aleatorios(self):
+        """teste equivalência em programas aleatórios com IF/WHILE"""
+        gerador = random.Random(35)
+        modelos = [
+            "({n} A)", "({n} B)", "(A B +)", "(A {n} *)", "((1 RES) {n} -)",
+            "((A 1 +) A)", "(A {n} > ((A 1 -) B) (A) IF)", "(B 3 < ((B 1 +) B) WHILE)",
+            "((A 2 ^) (B 1 +) /)", "(B ((B 2 *) B) +)"
+        ]
+
+        for indice in range(20):
+            linhas = ["(1 A)", "(2 B)"]
+            linhas += [gerador.choice(modelos).format(n=gerador.randint(1, 3)) for _ in range(25)]
+            texto = "\n".join(linhas)
+
+            esperado, _, memoria_esperada = executar_arvores(ler_programa(texto))
+            for otimizar in (False, True):
+                resultados, _, memoria = executar_texto(self.diretorio.name, texto, otimizar=otimizar)
+                self.assertEqual(resultados, esperado, f"programa {indice}, otimizar={otimizar}")
+                self.assertEqual(memoria, memoria_esperada)
+
+if __name__ == '__main__':
+    unittest.main()
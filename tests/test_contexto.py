@@ -0,0 +1,92 @@
+"""
+testes para o contexto de execução com __slots__
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.contexto import ContextoExecucao
+from src.executor import avaliar_rpn, avaliar_contexto, criar_contexto_execucao, ExecutorError
+from src.memoria import MemoriaSlots, resolver_slots
+from src.perfil import criar_perfil
+from src.lexer import parse_expressao
+
+LINHAS = ["(5 3 +)", "(42 MEM)", "(MEM 2 *)", "(1 RES)", "(((1 2 +) (3 4 *) +) 2 /)",
+          "((10 5 /) (3 2 ^) *)", "((MEM 1 +) (2 RES) -)", "(VAR)"]
+
+class TestContextoExecucao(unittest.TestCase):
+    """testes para a pilha, o adaptador dict e a avaliação"""
+
+    def teste_pilha(self):
+        """teste empilhar além da capacidade e desempilhar na ordem inversa"""
+        contexto = ContextoExecucao(capacidade=2)
+        for valor in range(5):
+            contexto.empilhar(float(valor))
+        self.assertEqual([contexto.desempilhar() for _ in range(5)], [4.0, 3.0, 2.0, 1.0, 0.0])
+        with self.assertRaises(IndexError):
+            contexto.desempilhar()
+
+    def teste_registrar_resultado(self):
+        """teste resultado entra no histórico e a pilha é esvaziada"""
+        contexto = ContextoExecucao()
+        contexto.empilhar(1.0)
+        contexto.registrar_resultado(3.5)
+        self.assertEqual((contexto.resultado_atual, contexto.historico_resultados, contexto['pilha']),
+                         (3.5, [3.5], []))
+
+    def teste_adaptador_dict(self):
+        """teste acesso por chave como no contexto antigo"""
+        contexto = criar_contexto_execucao()
+        contexto['memoria']['X'] = 2.0
+        contexto['historico_resultados'].append(1.0)
+        contexto['pilha'] = [7.0, 8.0]
+
+        self.assertEqual(contexto.memoria, {'X': 2.0})
+        self.assertEqual(contexto.desempilhar(), 8.0)
+        self.assertEqual(contexto.get('perfil'), None)
+        self.assertEqual(contexto.get('outra', 'padrao'), 'padrao')
+        with self.assertRaises(KeyError):
+            contexto['outra']
+
+        copia = ContextoExecucao.de_dict(contexto.para_dict())
+        self.assertEqual(copia.para_dict(), contexto.para_dict())
+
+    def teste_mesmos_resultados_e_perfil_que_dict(self):
+        """teste avaliação iterativa igual à recursiva, inclusive no perfil"""
+        tokens = [parse_expressao(linha) for linha in LINHAS]
+        for memoria_inicial in ({}, MemoriaSlots()):
+            with self.subTest(memoria=type(memoria_inicial).__name__):
+                memorias = [memoria_inicial.copy(), memoria_inicial.copy()]
+                if isinstance(memoria_inicial, MemoriaSlots):
+                    for memoria in memorias:
+                        resolver_slots(tokens, memoria)
+                perfis = [criar_perfil(), criar_perfil()]
+                antigo = {'historico_resultados': [], 'memoria': memorias[0], 'pilha': [],
+                          'resultado_atual': None, 'perfil': perfis[0]}
+                novo = ContextoExecucao([], memorias[1], perfil=perfis[1])
+
+                for linha in tokens:
+                    antigo['historico_resultados'].append(round(avaliar_rpn(linha, antigo), 2))
+                    novo.registrar_resultado(round(avaliar_rpn(linha, novo), 2))
+
+                self.assertEqual(novo.historico_resultados, antigo['historico_resultados'])
+                self.assertEqual(dict(memorias[1].items()), dict(memorias[0].items()))
+                self.assertEqual(perfis[1], perfis[0])
+
+    def teste_mesmos_erros_que_dict(self):
+        """teste mensagens de erro iguais às da avaliação recursiva"""
+        for linha in ["(1 +)", "((1 2) 3 +)", "(1 2 3 +)", "(1 0 /)", "(5 RES)", "((1 2 +) +)"]:
+            with self.subTest(linha=linha):
+                tokens = parse_expressao(linha)
+                with self.assertRaises(ExecutorError) as esperado:
+                    avaliar_rpn(tokens, {'historico_resultados': [], 'memoria': {}})
+                contexto = ContextoExecucao()
+                with self.assertRaises(ExecutorError) as obtido:
+                    avaliar_contexto(tokens, contexto)
+                self.assertEqual(obtido.exception.mensagem, esperado.exception.mensagem)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,12 +3,16 @@ testes para o executador de expressões RPN
 """
 
 import unittest
+import math
 import sys
 import os
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.executor import executar_expressao, ExecutorError
+from src.executor import (executar_expressao, executar_expressoes, executar_programa, avaliar_rpn,
+                          ExecutorError)
+from src.contexto import ContextoExecucao
+from src.memoria import MemoriaSlots, resolver_slots
 from src.lexer import parse_expressao
 
 def teste_operacao_simples():
@@ -128,6 +132,86 @@ def teste_erro_operandos_insuficientes():
     except ExecutorError:
         pass
 
+def teste_programa_com_slots():
+    """teste programa com identificadores resolvidos em slots"""
+    linhas = ["(42.5 MEM)", "(3 VAR)", "(MEM VAR +)", "(OUTRA)", "(1 RES)"]
+    expressoes = [parse_expressao(linha) for linha in linhas]
+    resultados, historico, memoria = executar_programa(expressoes)
+    
+    assert resultados == [42.5, 3.0, 45.5, 0.0, 0.0]
+    assert historico == resultados
+    assert isinstance(memoria, MemoriaSlots)
+    assert memoria.tabela == {'MEM': 0, 'VAR': 1, 'OUTRA': 2}
+    # OUTRA foi apenas lida: tem slot mas não aparece no snapshot
+    assert memoria.para_dict() == {'MEM': 42.5, 'VAR': 3.0}
+
+def teste_memoria_slots_acesso_por_nome():
+    """teste acesso por nome na memória em slots"""
+    memoria = MemoriaSlots.de_dict({'MEM': 1.5})
+    assert memoria['MEM'] == 1.5
+    assert memoria.get('X') == 0.0
+    assert 'X' not in memoria
+    
+    tokens = parse_expressao("(MEM 2 *)")
+    resultado, _, nova_memoria = executar_expressao(tokens, memoria=memoria)
+    assert resultado == 3.0
+    assert nova_memoria == {'MEM': 1.5}
+
+def teste_slots_de_outra_memoria():
+    """teste tokens resolvidos para uma memória executados com outra"""
+    tokens = parse_expressao("(A B -)")
+    primeira = MemoriaSlots.de_dict({'A': 1.0, 'B': 2.0})
+    resolver_slots([tokens], primeira)
+    
+    # mesma quantidade de slots, nomes em outra ordem
+    segunda = MemoriaSlots.de_dict({'B': 10.0, 'A': 20.0, 'C': 30.0})
+    for contexto in ({'historico_resultados': [], 'memoria': segunda, 'pilha': [], 'resultado_atual': None},
+                     ContextoExecucao(memoria=segunda)):
+        assert avaliar_rpn(tokens, contexto) == 10.0
+    assert avaliar_rpn(tokens, ContextoExecucao(memoria=primeira)) == -1.0
+
+def teste_programa_erro_indica_linha():
+    """teste erro de programa informa a linha"""
+    expressoes = [parse_expressao("(1 2 +)"), parse_expressao("(5 0 /)")]
+    try:
+        executar_programa(expressoes)
+        assert False, "deveria ter dado erro"
+    except ExecutorError as e:
+        assert e.contexto == "linha 2"
+
+def teste_lote_sem_erros():
+    """teste lote igual ao programa quando nenhuma linha falha"""
+    linhas = ["(42.5 MEM)", "(3 VAR)", "(MEM VAR +)", "(1 RES)", "((1 2 +) (2 RES) *)"]
+    esperado, _, _ = executar_programa([parse_expressao(linha) for linha in linhas])
+    resultados, erros = executar_expressoes([parse_expressao(linha) for linha in linhas])
+    
+    assert list(resultados) == esperado
+    assert erros == []
+
+def teste_lote_com_erros():
+    """teste erros por linha sem interromper o lote"""
+    tokens = [parse_expressao(linha) for linha in ["(1 2 +)", "(1 0 /)", "(5 X)", "(X (1 RES) *)"]]
+    tokens.insert(1, [])
+    contexto = ContextoExecucao(memoria=MemoriaSlots())
+    resultados, erros = executar_expressoes(tokens, contexto)
+    
+    assert [resultados[0], resultados[3], resultados[4]] == [3.0, 5.0, 25.0]
+    assert math.isnan(resultados[1]) and math.isnan(resultados[2])
+    assert erros == [(2, "Lista de tokens vazia"), (3, "Divisão por zero")]
+    # linhas com erro não entram no histórico
+    assert contexto.historico_resultados == [3.0, 5.0, 25.0]
+    assert contexto.memoria['X'] == 5.0
+
+def teste_lote_contexto_dict():
+    """teste contexto dict atualizado pelo lote"""
+    contexto = {'historico_resultados': [10.0], 'memoria': {}}
+    resultados, _ = executar_expressoes([parse_expressao("(1 RES)"), parse_expressao("(7 A)")], contexto)
+    
+    assert list(resultados) == [10.0, 7.0]
+    assert contexto['historico_resultados'] == [10.0, 10.0, 7.0]
+    assert contexto['memoria'] == {'A': 7.0}
+    assert contexto['resultado_atual'] == 7.0
+
 class TestExecutor(unittest.TestCase):
     """testes para o executador de expressões"""
     
@@ -167,8 +251,29 @@ class TestExecutor(unittest.TestCase):
     def teste_erro_res_invalido(self):
         teste_erro_res_invalido()
     
+    def teste_slots_de_outra_memoria(self):
+        teste_slots_de_outra_memoria()
+    
     def teste_erro_operandos_insuficientes(self):
         teste_erro_operandos_insuficientes()
+    
+    def teste_programa_com_slots(self):
+        teste_programa_com_slots()
+    
+    def teste_memoria_slots_acesso_por_nome(self):
+        teste_memoria_slots_acesso_por_nome()
+    
+    def teste_programa_erro_indica_linha(self):
+        teste_programa_erro_indica_linha()
+    
+    def teste_lote_sem_erros(self):
+        teste_lote_sem_erros()
+    
+    def teste_lote_com_erros(self):
+        teste_lote_com_erros()
+    
+    def teste_lote_contexto_dict(self):
+        teste_lote_contexto_dict()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
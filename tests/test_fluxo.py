@@ -0,0 +1,80 @@
+"""
+testes para a execução em fluxo
+"""
+
+import unittest
+import io
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.fluxo import executar_fluxo
+from src.executor import executar_programa, ExecutorError
+from src.lexer import parse_expressao
+
+PROGRAMA = ["(10 A)", "", "(A 2 *)", "((1 RES) (2 RES) +)", "(3 RES)"]
+
+class TestFluxo(unittest.TestCase):
+    """testes para executar_fluxo"""
+
+    def teste_mesmos_resultados_que_programa(self):
+        """teste resultados iguais aos do executador de programa"""
+        esperado, _, _ = executar_programa([parse_expressao(linha) for linha in PROGRAMA if linha])
+        recebidos = []
+        executar_fluxo(PROGRAMA, lambda numero, resultado, erro: recebidos.append(resultado))
+
+        self.assertEqual(recebidos, esperado)
+
+    def teste_arquivo_para_arquivo(self):
+        """teste leitura e escrita em arquivos"""
+        with tempfile.TemporaryDirectory() as diretorio:
+            entrada = os.path.join(diretorio, 'programa.txt')
+            saida = os.path.join(diretorio, 'resultados.txt')
+            with open(entrada, 'w', encoding='utf-8') as arquivo:
+                arquivo.write("\n".join(PROGRAMA) + "\n")
+
+            estatisticas = executar_fluxo(entrada, saida)
+            with open(saida, encoding='utf-8') as arquivo:
+                conteudo = arquivo.read()
+
+        self.assertEqual(conteudo, "10.0\n20.0\n30.0\n10.0\n")
+        self.assertEqual(estatisticas['linhas'], 4)
+        self.assertEqual(estatisticas['memoria']['A'], 10.0)
+
+    def teste_profundidade_do_historico(self):
+        """teste RES além da profundidade configurada falha"""
+        saida = io.StringIO()
+        estatisticas = executar_fluxo(["(1 1 +)", "(2 2 +)", "(3 3 +)", "(2 RES)", "(4 RES)"], saida,
+                                      profundidade_historico=3, continuar_apos_erro=True)
+
+        linhas = saida.getvalue().splitlines()
+        self.assertEqual(linhas[3], "4.0")
+        self.assertTrue(linhas[4].startswith("ERRO linha 5"))
+        self.assertEqual(estatisticas['erros'], 1)
+
+    def teste_erro_interrompe(self):
+        """teste erro escrito no destino e levantado com a linha"""
+        saida = io.StringIO()
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_fluxo(["(1 2 +)", "(1 0 /)", "(5 5 +)"], saida)
+
+        self.assertEqual(contexto.exception.contexto, "linha 2")
+        self.assertEqual(saida.getvalue(), "3.0\nERRO linha 2: Divisão por zero\n")
+
+    def teste_entrada_consumida_sob_demanda(self):
+        """teste cada resultado sai antes da próxima linha ser lida"""
+        eventos = []
+
+        def linhas():
+            for linha in ["(1 1 +)", "(2 2 +)"]:
+                eventos.append(('lida', linha))
+                yield linha
+
+        executar_fluxo(linhas(), lambda numero, resultado, erro: eventos.append(('escrita', resultado)))
+
+        self.assertEqual(eventos, [('lida', "(1 1 +)"), ('escrita', 2.0), ('lida', "(2 2 +)"), ('escrita', 4.0)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+testes para o gerenciador de sessões com despejo em disco
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.gerenciador_sessoes import (criar_gerenciador, executar_na_sessao, obter_sessao,
+                                     descartar_sessao, despejar_todas, estatisticas_gerenciador,
+                                     tamanho_sessao)
+
+class TestGerenciadorSessoes(unittest.TestCase):
+    """testes para orçamento, LRU e restauração"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def teste_sessoes_independentes(self):
+        """teste cada sessão tem memória e histórico próprios"""
+        gerenciador = criar_gerenciador(self.diretorio.name)
+        executar_na_sessao(gerenciador, 'a', "(5 X)")
+        executar_na_sessao(gerenciador, 'b', "(7 X)")
+
+        self.assertEqual(executar_na_sessao(gerenciador, 'a', "(X (1 RES) +)")['resultado'], 10.0)
+        self.assertEqual(executar_na_sessao(gerenciador, 'b', "(X (1 RES) +)")['resultado'], 14.0)
+
+    def teste_despejo_e_restauracao(self):
+        """teste sessão despejada volta com o mesmo estado"""
+        gerenciador = criar_gerenciador(self.diretorio.name, orcamento_bytes=200)
+        for cliente in range(10):
+            executar_na_sessao(gerenciador, cliente, f"({cliente} X)")
+            executar_na_sessao(gerenciador, cliente, "(X 2 *)")
+
+        estatisticas = estatisticas_gerenciador(gerenciador)
+        self.assertLessEqual(estatisticas['bytes'], 200)
+        self.assertGreater(estatisticas['despejos'], 0)
+        self.assertLess(estatisticas['residentes'], 10)
+
+        resposta = executar_na_sessao(gerenciador, 0, "((1 RES) (2 RES) +)")
+        self.assertEqual(resposta['resultado'], 0.0)
+        resposta = executar_na_sessao(gerenciador, 3, "((1 RES) X +)")
+        self.assertEqual(resposta['resultado'], 9.0)
+        self.assertGreater(estatisticas_gerenciador(gerenciador)['restauradas'], 0)
+
+    def teste_lru_preserva_sessao_usada(self):
+        """teste a sessão mais recente não é despejada"""
+        gerenciador = criar_gerenciador(self.diretorio.name, orcamento_bytes=120)
+        executar_na_sessao(gerenciador, 'antiga', "(1 A)")
+        executar_na_sessao(gerenciador, 'quente', "(1 A)")
+        executar_na_sessao(gerenciador, 'quente', "(2 A)")
+        executar_na_sessao(gerenciador, 'nova', "(1 A)")
+
+        self.assertNotIn('antiga', gerenciador['residentes'])
+        self.assertIn('nova', gerenciador['residentes'])
+
+    def teste_contabilidade_de_bytes(self):
+        """teste total de bytes igual à soma das sessões residentes"""
+        gerenciador = criar_gerenciador(self.diretorio.name, orcamento_bytes=300)
+        for indice in range(30):
+            executar_na_sessao(gerenciador, indice % 7, f"({indice} V{indice % 3})")
+
+        soma = sum(tamanho_sessao(sessao) for sessao in gerenciador['residentes'].values())
+        self.assertEqual(gerenciador['bytes'], soma)
+
+    def teste_contador_de_linhas_restaurado(self):
+        """teste linhas com erro continuam contadas depois do despejo"""
+        gerenciador = criar_gerenciador(self.diretorio.name)
+        executar_na_sessao(gerenciador, 'a', "(1 X)")
+        executar_na_sessao(gerenciador, 'a', "(1 0 /)")
+        despejar_todas(gerenciador)
+
+        self.assertEqual(executar_na_sessao(gerenciador, 'a', "(X 1 +)")['linha'], 3)
+
+    def teste_taxa_de_acerto(self):
+        """teste acertos contam acessos a sessões residentes"""
+        gerenciador = criar_gerenciador(self.diretorio.name)
+        for _ in range(4):
+            obter_sessao(gerenciador, 'x')
+
+        estatisticas = estatisticas_gerenciador(gerenciador)
+        self.assertEqual((estatisticas['acertos'], estatisticas['falhas']), (3, 1))
+        self.assertEqual(estatisticas['taxa_acerto'], 0.75)
+
+    def teste_descartar_e_despejar_todas(self):
+        """teste descarte apaga do disco e despejo total grava tudo"""
+        gerenciador = criar_gerenciador(self.diretorio.name)
+        executar_na_sessao(gerenciador, 'a', "(1 X)")
+        executar_na_sessao(gerenciador, 'b', "(2 X)")
+        despejar_todas(gerenciador)
+        self.assertEqual(len(os.listdir(self.diretorio.name)), 2)
+
+        descartar_sessao(gerenciador, 'a')
+        self.assertEqual(len(os.listdir(self.diretorio.name)), 1)
+        self.assertEqual(obter_sessao(gerenciador, 'a')['memoria'].para_dict(), {})
+        self.assertEqual(obter_sessao(gerenciador, 'b')['memoria'].para_dict(), {'X': 2.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,16 @@ testes para a gramática LL(1)
 """
 
 import unittest
+import random
+import pickle
 import sys
 import os
+import tempfile
+from array import array
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src import grammar
 from src.grammar import (
     construir_gramatica,
     calcular_first,
@@ -15,9 +20,66 @@ from src.grammar import (
     construir_tabela_ll1,
     validar_gramatica_ll1,
     obter_producao,
-    GramaticaError
+    GramaticaError,
+    definir_producoes,
+    carregar_gramatica,
+    calcular_artefatos,
+    calcular_all_first,
+    calcular_all_follow,
+    eh_terminal,
+    compilar_tabela_ll1,
+    obter_producao_compilada,
+    indexar_simbolos,
+    SEM_PRODUCAO
 )
 
+def first_follow_referencia(gramatica, inicial):
+    """FIRST e FOLLOW pela definição: repete sobre todas as produções até não mudar"""
+    first = {nt: set() for nt in gramatica}
+    follow = {nt: set() for nt in gramatica}
+    follow[inicial].add('$')
+
+    def first_sequencia(sequencia):
+        resultado = set()
+        for simbolo in sequencia:
+            if simbolo not in gramatica:
+                if eh_terminal(simbolo):
+                    resultado.add(simbolo)
+                return resultado
+            resultado |= first[simbolo] - {'ε'}
+            if 'ε' not in first[simbolo]:
+                return resultado
+        return resultado | {'ε'}
+
+    mudou = True
+    while mudou:
+        mudou = False
+        for nt, producoes in gramatica.items():
+            for producao in producoes:
+                novo = first[nt] | first_sequencia(producao)
+                if novo != first[nt]:
+                    first[nt], mudou = novo, True
+                for i, simbolo in enumerate(producao):
+                    if simbolo not in gramatica:
+                        continue
+                    resto = first_sequencia(producao[i + 1:])
+                    novo = follow[simbolo] | (resto - {'ε'})
+                    if 'ε' in resto:
+                        novo |= follow[nt]
+                    if novo != follow[simbolo]:
+                        follow[simbolo], mudou = novo, True
+    return first, follow
+
+def gramatica_aleatoria(gerador, n_nao_terminais, n_terminais):
+    """gramática com recursão (inclusive à esquerda e mútua) e produções vazias"""
+    nao_terminais = [f"N{i}" for i in range(n_nao_terminais)]
+    terminais = [f"t{i}" for i in range(n_terminais)]
+    gramatica = {}
+    for nt in nao_terminais:
+        gramatica[nt] = [[gerador.choice(nao_terminais + terminais) for _ in range(gerador.randint(0, 3))]
+                         for _ in range(gerador.randint(1, 3))]
+    return gramatica
+
 class TestGrammar(unittest.TestCase):
     """testes para a gramática"""
     
@@ -137,6 +199,169 @@ class TestGrammar(unittest.TestCase):
         for op in operadores_rel:
             self.assertIn(op, operadores_na_gramatica)
 
+class TestFirstFollowPontoFixo(unittest.TestCase):
+    """testes para FIRST/FOLLOW por ponto fixo com conjuntos em bits"""
+    
+    def teste_gramatica_rpn_igual_referencia(self):
+        """teste FIRST e FOLLOW da gramática RPN iguais aos da definição"""
+        producoes = definir_producoes()
+        first, follow = first_follow_referencia(producoes, 'PROGRAMA')
+        
+        self.assertEqual(calcular_all_first(producoes), first)
+        self.assertEqual(calcular_all_follow(producoes, first), follow)
+        self.assertEqual(first['OPERACAO_OU_COMANDO'], {'numero', 'identificador', '('})
+        self.assertEqual(first['RESTO_IDENTIFICADOR'], {'numero', 'identificador', '(', 'ε'})
+        self.assertEqual(follow['RESTO_IDENTIFICADOR'], {')'})
+    
+    def teste_recursao_a_esquerda_mutua(self):
+        """teste ciclo A -> B, B -> A b com ε (a versão recursiva não terminava)"""
+        gramatica = {'S': [['A', 'x']], 'A': [['B'], ['a']], 'B': [['A', 'b'], []]}
+        first = calcular_all_first(gramatica)
+        
+        self.assertEqual(first, {'S': {'a', 'b', 'x'}, 'A': {'a', 'b', 'ε'}, 'B': {'a', 'b', 'ε'}})
+        self.assertEqual(calcular_all_follow(gramatica, first),
+                         {'S': {'$'}, 'A': {'x', 'b'}, 'B': {'x', 'b'}})
+    
+    def teste_follow_mutuo(self):
+        """teste FOLLOW completo quando A termina B e B termina A"""
+        gramatica = {'S': [['A', 'x']], 'A': [['y', 'B']], 'B': [['z', 'A'], ['w']]}
+        follow = calcular_all_follow(gramatica, calcular_all_first(gramatica))
+        
+        self.assertEqual(follow['A'], {'x'})
+        self.assertEqual(follow['B'], {'x'})
+    
+    def teste_gramaticas_aleatorias(self):
+        """teste gramáticas aleatórias, pequenas e com centenas de símbolos"""
+        gerador = random.Random(49)
+        for n_nao_terminais, n_terminais in [(3, 2)] * 50 + [(12, 6)] * 20 + [(300, 100)]:
+            gramatica = gramatica_aleatoria(gerador, n_nao_terminais, n_terminais)
+            first, follow = first_follow_referencia(gramatica, 'N0')
+            with self.subTest(n_nao_terminais=n_nao_terminais):
+                self.assertEqual(calcular_all_first(gramatica), first)
+                self.assertEqual(calcular_all_follow(gramatica, first), follow)
+
+class TestTabelaCompilada(unittest.TestCase):
+    """testes para a tabela LL(1) densa indexada por inteiros"""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.gramatica_info = construir_gramatica()
+        cls.compilada = cls.gramatica_info['tabela_compilada']
+    
+    def teste_mesmas_producoes_da_tabela(self):
+        """teste cada par (não-terminal, terminal) igual ao de obter_producao"""
+        compilada = self.compilada
+        simbolos = compilada['terminais'] + compilada['nao_terminais']
+        self.assertEqual(len(compilada['entradas']), len(compilada['nao_terminais']) * compilada['n_terminais'])
+        
+        for indice_nt, nao_terminal in enumerate(compilada['nao_terminais']):
+            for terminal, nome_terminal in enumerate(compilada['terminais']):
+                esperado = obter_producao(self.gramatica_info['tabela'], nao_terminal, nome_terminal)
+                indice = obter_producao_compilada(compilada, indice_nt, terminal)
+                with self.subTest(nao_terminal=nao_terminal, terminal=nome_terminal):
+                    if esperado is None:
+                        self.assertEqual(indice, SEM_PRODUCAO)
+                    else:
+                        self.assertEqual([simbolos[s] for s in compilada['producoes'][indice]], esperado)
+                        self.assertEqual(simbolos[compilada['lados'][indice]], nao_terminal)
+    
+    def teste_ids(self):
+        """teste terminais antes dos não-terminais e $ com id 0"""
+        ids = indexar_simbolos(self.compilada)
+        n_terminais = self.compilada['n_terminais']
+        
+        self.assertEqual(ids['$'], 0)
+        self.assertLess(ids['('], n_terminais)
+        self.assertEqual(ids['PROGRAMA'], n_terminais)
+        indice = obter_producao_compilada(self.compilada, ids['EXPRESSAO'] - n_terminais, ids['('])
+        self.assertEqual(self.compilada['producoes'][indice], (ids['('], ids['CONTEUDO'], ids[')']))
+    
+    def teste_pickle(self):
+        """teste tabela compilada atravessa pickle sem perder o array"""
+        copia = pickle.loads(pickle.dumps(self.compilada))
+        
+        self.assertEqual(copia, self.compilada)
+        self.assertIsInstance(copia['entradas'], array)
+        self.assertEqual(copia['entradas'].typecode, 'h')
+    
+    def teste_simbolo_sem_producoes(self):
+        """teste erro para não-terminal usado mas não definido"""
+        with self.assertRaises(GramaticaError):
+            compilar_tabela_ll1({'S': [['A', 'x']]}, {})
+    
+    def teste_limite_de_producoes(self):
+        """teste erro quando os índices não cabem em array('h')"""
+        gramatica = {'S': [['x']] * 32768}
+        with self.assertRaises(GramaticaError):
+            compilar_tabela_ll1(gramatica, {})
+
+class TestCacheGramatica(unittest.TestCase):
+    """testes para o cache em disco e em processo dos artefatos LL(1)"""
+    
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        grammar._gramaticas_carregadas.clear()
+        grammar._gramatica_rpn.clear()
+    
+    def tearDown(self):
+        self.diretorio.cleanup()
+        grammar._gramaticas_carregadas.clear()
+        grammar._gramatica_rpn.clear()
+    
+    def teste_cache_igual_ao_calculo(self):
+        """teste artefatos lidos do disco iguais aos calculados"""
+        calculado = calcular_artefatos(definir_producoes())
+        construir_gramatica(self.diretorio.name)
+        self.assertEqual(len(os.listdir(self.diretorio.name)), 1)
+        
+        grammar._gramaticas_carregadas.clear()
+        grammar._gramatica_rpn.clear()
+        original = grammar.calcular_artefatos
+        grammar.calcular_artefatos = None  # falharia se fosse chamado
+        try:
+            carregado = construir_gramatica(self.diretorio.name)
+        finally:
+            grammar.calcular_artefatos = original
+        
+        self.assertEqual({chave: carregado[chave] for chave in calculado}, calculado)
+        self.assertEqual(carregado['tabela_compilada'],
+                         compilar_tabela_ll1(calculado['producoes'], calculado['tabela']))
+    
+    def teste_memo_em_processo(self):
+        """teste chamadas repetidas devolvem os mesmos artefatos sem ler o disco"""
+        primeiro = construir_gramatica(self.diretorio.name)
+        for nome in os.listdir(self.diretorio.name):
+            os.remove(os.path.join(self.diretorio.name, nome))
+        
+        self.assertIs(construir_gramatica(self.diretorio.name), primeiro)
+        self.assertIs(carregar_gramatica(definir_producoes(), self.diretorio.name), primeiro)
+        self.assertEqual(os.listdir(self.diretorio.name), [])
+    
+    def teste_producoes_alteradas_invalidam_cache(self):
+        """teste chave muda com as produções"""
+        producoes = definir_producoes()
+        carregar_gramatica(producoes, self.diretorio.name)
+        producoes['OPERADOR_REL'] = producoes['OPERADOR_REL'][:-1]
+        alterada = carregar_gramatica(producoes, self.diretorio.name)
+        
+        self.assertEqual(len(os.listdir(self.diretorio.name)), 2)
+        self.assertNotIn('<=', alterada['tabela']['OPERADOR_REL'])
+    
+    def teste_cache_corrompido_recalculado(self):
+        """teste arquivo inválido é ignorado e regravado"""
+        construir_gramatica(self.diretorio.name)
+        caminho = os.path.join(self.diretorio.name, os.listdir(self.diretorio.name)[0])
+        with open(caminho, 'wb') as arquivo:
+            arquivo.write(b'RPNG lixo')
+        
+        grammar._gramaticas_carregadas.clear()
+        grammar._gramatica_rpn.clear()
+        gramatica_info = construir_gramatica(self.diretorio.name)
+        
+        self.assertIn('(', gramatica_info['tabela']['EXPRESSAO'])
+        with open(caminho, 'rb') as arquivo:
+            self.assertNotEqual(arquivo.read(), b'RPNG lixo')
+
 def teste_construir_gramatica():
     """função de teste standalone"""
     gramatica_info = construir_gramatica()
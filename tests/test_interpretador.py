@@ -0,0 +1,413 @@
+"""
+testes para o interpretador da árvore sintática
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.interpretador import (gerar_arvores, executar_arvores, executar_arvores_em_fatias, compilar_arvore,
+                               executar_codigo, inferir_inteiros, fundir_instrucoes, OP_SALTAR, OP_TESTAR_K,
+                               OP_CARREGAR_REG, OP_TEMPORARIO, OP_ARIT, OP_DIVIDIR, OP_RESTO, OP_POTENCIA_INT,
+                               OP_POTENCIA_Q, OP_CONST, OP_CONST_OP, OP_CARREGAR_OP, OP_REG_OP, OP_RES_OP,
+                               LIMIAR_AQUECIMENTO)
+from src.executor import executar_programa, ExecutorError, formatar_resultado
+from src.memoria import MemoriaSlots
+from src.lexer import parse_expressao
+from src.memoizacao import criar_cache_resultados
+from src.perfil import criar_perfil
+from src.limites import criar_limites
+
+def executar_linhas(linhas, memoria=None):
+    """tokeniza, gera árvores e executa as linhas"""
+    arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+    return executar_arvores(arvores, memoria=memoria)
+
+class TestInterpretador(unittest.TestCase):
+    """testes para o interpretador com IF/WHILE"""
+    
+    def teste_equivalente_ao_executor(self):
+        """teste resultados iguais aos do executador de tokens"""
+        linhas = [
+            "(5 3 +)", "(17 5 %)", "(2 8 ^)", "(15.6 3.0 /)", "(42 MEM)",
+            "(MEM 2 *)", "(1 RES)", "(((1 2 +) (3 4 *) +) 2 /)", "(VAR)"
+        ]
+        esperado, _, _ = executar_programa([parse_expressao(linha) for linha in linhas])
+        resultados, _, _ = executar_linhas(linhas)
+        
+        self.assertEqual(resultados, esperado)
+    
+    def teste_laco_while(self):
+        """teste laço WHILE atualizando memória"""
+        resultados, _, memoria = executar_linhas(["(0 I)", "(I 10 < ((I 1 +) I) WHILE)"])
+        
+        self.assertEqual(resultados, [0.0, 10.0])
+        self.assertEqual(memoria['I'], 10.0)
+    
+    def teste_laco_sem_iteracoes(self):
+        """teste laço cuja condição é falsa de início vale 0.0"""
+        resultados, _, memoria = executar_linhas(["(20 I)", "(I 10 < ((I 1 +) I) WHILE)"])
+        
+        self.assertEqual(resultados[1], 0.0)
+        self.assertEqual(memoria['I'], 20.0)
+    
+    def teste_operadores_relacionais(self):
+        """teste IF com os seis operadores relacionais"""
+        casos = [
+            ('>', 1.0), ('<', 2.0), ('==', 2.0),
+            ('!=', 1.0), ('>=', 1.0), ('<=', 2.0)
+        ]
+        for operador, esperado in casos:
+            with self.subTest(operador=operador):
+                resultados, _, _ = executar_linhas([f"(5 3 {operador} (1 0 +) (2 0 +) IF)"])
+                self.assertEqual(resultados[0], esperado)
+    
+    def teste_decisao_executa_apenas_um_ramo(self):
+        """teste IF não executa o ramo não escolhido"""
+        _, _, memoria = executar_linhas(["(1 0 > (7 A) (9 B) IF)"])
+        
+        self.assertEqual(memoria.para_dict(), {'A': 7.0})
+    
+    def teste_laco_aninhado(self):
+        """teste WHILE dentro de WHILE (J reiniciado a cada iteração externa)"""
+        corpo_interno = "(((J 1 +) J) ((T 1 +) T) +)"
+        laco_interno = f"((0 J) (J 2 < {corpo_interno} WHILE) +)"
+        linha = f"(I 3 < ((({laco_interno} 0 *) (I 1 +) +) I) WHILE)"
+        _, _, memoria = executar_linhas([linha])
+        
+        self.assertEqual(memoria.para_dict(), {'I': 3.0, 'J': 2.0, 'T': 6.0})
+    
+    def teste_laco_usa_salto_sem_recursao(self):
+        """teste laço compilado em código linear com salto para trás"""
+        arvore = gerar_arvores([parse_expressao("(I 10 < ((I 1 +) I) WHILE)")])[0]
+        codigo = compilar_arvore(arvore, MemoriaSlots())
+        
+        saltos = [instrucao for instrucao in codigo if instrucao[0] == OP_SALTAR]
+        self.assertEqual(len(saltos), 1)
+        self.assertLess(saltos[0][1], len(codigo))
+    
+    def teste_erro_divisao_zero(self):
+        """teste erro de divisão por zero indica linha"""
+        with self.assertRaises(ExecutorError) as erro:
+            executar_linhas(["(1 1 +)", "(5 0 /)"])
+        self.assertEqual(erro.exception.contexto, "linha 2")
+
+class TestOtimizacaoLacos(unittest.TestCase):
+    """testes para invariantes, testes especializados e registradores em WHILE"""
+    
+    def compilar(self, linha, memoria):
+        """compila uma linha com otimização de laços"""
+        arvore = gerar_arvores([parse_expressao(linha)])[0]
+        return compilar_arvore(arvore, memoria, otimizar_lacos=True)
+    
+    def teste_codigo_do_laco_otimizado(self):
+        """teste invariante fora do laço, TESTAR_K e registradores"""
+        memoria = MemoriaSlots()
+        codigo = self.compilar("(I 10 < ((I (K 2 *) +) I) WHILE)", memoria)
+        operacoes = [instrucao[0] for instrucao in codigo]
+        
+        self.assertIn(OP_TESTAR_K, operacoes)
+        self.assertIn(OP_CARREGAR_REG, operacoes)
+        inicio_laco = next(pc for pc, instrucao in enumerate(codigo) if instrucao[0] == OP_SALTAR)
+        self.assertIn(OP_TEMPORARIO, operacoes[codigo[inicio_laco][1]:inicio_laco])
+    
+    def teste_constante_a_esquerda(self):
+        """teste relação invertida quando o literal (dobrado) é o primeiro operando"""
+        arvores = gerar_arvores([parse_expressao("((2 3 +) I > ((I 1 +) I) WHILE)")])
+        resultados, _, memoria = executar_arvores(arvores, otimizar=True)
+        
+        self.assertEqual(resultados, [5.0])
+        self.assertEqual(memoria['I'], 5.0)
+    
+    def teste_erro_no_laco_preserva_memoria(self):
+        """teste células em registradores voltam à memória quando o laço falha"""
+        linhas = ["(3 I)", "(I 10 < (((I 1 -) I) (I 0 /) +) WHILE)"]
+        arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+        memorias = []
+        for otimizar in (False, True):
+            memoria = MemoriaSlots()
+            with self.assertRaises(ExecutorError):
+                executar_arvores(arvores, memoria=memoria, otimizar=otimizar)
+            memorias.append(memoria.para_dict())
+        
+        self.assertEqual(memorias[0], memorias[1])
+        self.assertEqual(memorias[1], {'I': 2.0})
+    
+    def teste_programas_aleatorios(self):
+        """teste laços otimizados equivalentes ao interpretador simples"""
+        gerador = random.Random(36)
+        condicoes = ["(I {n} <)", "((0 {n} +) I >)", "(I J <=)", "(I {n} !=)"]
+        corpos = [
+            "((I 1 +) I)", "(((I 1 +) I) ((S (K 2 *) +) S) +)",
+            "(((I 1 +) I) (J K > ((J 1 -) J) ((S J +) S) IF) *)",
+            "(((I 1 +) I) ((0 J) (J 2 < (((J 1 +) J) ((S 1 +) S) +) WHILE) +) +)",
+            "(((I 1 +) I) ((S (K K *) -) S) -)",
+            "(((I 1 +) I) ((S (1 RES) +) S) +)"
+        ]
+        
+        for indice in range(40):
+            linhas = [f"({gerador.randint(0, 3)} I)", f"({gerador.randint(1, 4)} J)", "(2 K)", "(0 S)"]
+            for _ in range(4):
+                condicao = gerador.choice(condicoes).format(n=gerador.randint(2, 8))[1:-1]
+                corpo = gerador.choice(corpos)
+                linhas.append(f"({condicao} {corpo} WHILE)")
+                linhas.append(f"({gerador.randint(0, 2)} I)")
+            arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+            
+            esperado = executar_arvores(arvores)
+            otimizado = executar_arvores(arvores, otimizar=True)
+            self.assertEqual(otimizado[0], esperado[0], f"programa {indice}: {linhas}")
+            self.assertEqual(otimizado[2], esperado[2])
+
+class TestValoresInteiros(unittest.TestCase):
+    """testes para a inferência de inteiros e as instruções especializadas"""
+
+    GENERICAS = {OP_DIVIDIR: '/', OP_RESTO: '%', OP_POTENCIA_INT: '^'}
+
+    def nomes_inteiros(self, linhas, memoria):
+        """identificadores inferidos como inteiros"""
+        arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+        inteiros = inferir_inteiros(arvores, memoria)
+        return {nome for nome, slot in memoria.tabela.items() if slot in inteiros}
+
+    def executar_as_duas_formas(self, linha, memoria):
+        """resultado (ou mensagem de erro) com e sem as instruções especializadas"""
+        arvore = gerar_arvores([parse_expressao(linha)])[0]
+        saidas = []
+        for especializado in (True, False):
+            copia = memoria.copy()
+            codigo = compilar_arvore(arvore, copia, inteiros=inferir_inteiros([arvore], copia))
+            if not especializado:
+                codigo = [(OP_ARIT, self.GENERICAS[op], None) if op in self.GENERICAS else (op, a, b)
+                          for op, a, b in codigo]
+            try:
+                valor = executar_codigo(codigo, {'historico_resultados': [], 'memoria': copia})
+                saidas.append(repr(formatar_resultado(valor)))
+            except ExecutorError as e:
+                saidas.append(e.mensagem)
+            except (OverflowError, ValueError, ZeroDivisionError) as e:
+                saidas.append(f"{type(e).__name__}: {e}")
+        return saidas
+
+    def teste_inferencia_de_slots(self):
+        """teste células que só recebem inteiros (ponto fixo sobre o programa)"""
+        linhas = ["(0 I)", "(I 10 < ((I 1 +) I) WHILE)", "(2.5 X)", "((X 1 +) Y)",
+                  "((I 3 %) J)", "((I 2 ^) K)", "((I 2 /) L)", "((K (1 RES) +) M)", "((Z 1 -) Z)"]
+
+        self.assertEqual(self.nomes_inteiros(linhas, MemoriaSlots()), {'I', 'J', 'K', 'Z'})
+
+    def teste_memoria_inicial_fracionaria(self):
+        """teste valor inicial fracionário impede a célula de ser inteira"""
+        memoria = MemoriaSlots.de_dict({'I': 0.5, 'N': 4.0})
+
+        self.assertEqual(self.nomes_inteiros(["((I 1 +) I)", "((N 1 +) N)"], memoria), {'N'})
+
+    def teste_potencia_com_expoente_inteiro(self):
+        """teste POTENCIA_INT só com expoente inteiro"""
+        memoria = MemoriaSlots()
+        arvores = gerar_arvores([parse_expressao(linha) for linha in ["(B (I 3 %) ^)", "(B 0.5 ^)", "(B X ^)"]])
+        inteiros = inferir_inteiros(arvores + gerar_arvores([parse_expressao("(1.5 X)")]), memoria)
+        operacoes = [[op for op, _, _ in compilar_arvore(arvore, memoria, inteiros=inteiros)] for arvore in arvores]
+
+        self.assertIn(OP_POTENCIA_INT, operacoes[0])
+        self.assertIn(OP_RESTO, operacoes[0])
+        self.assertIn(OP_ARIT, operacoes[1])
+        self.assertIn(OP_ARIT, operacoes[2])
+
+    def teste_mesmo_resultado_do_caminho_generico(self):
+        """teste resultados e mensagens de erro idênticos aos de ARIT"""
+        memoria = MemoriaSlots.de_dict({'N': -3.0, 'Z': 0.0, 'G': 1e300, 'F': 2.5})
+        linhas = [
+            "(17 5 %)", "(N 5 %)", "((3 3 +) N %)", "(Z N %)", "(N 0 %)", "(17 4 /)", "(N Z /)",
+            "(N 3 ^)", "(N (7 2 %) ^)", "(Z N ^)", "(10 400 ^)", "(G 2 ^)", "(F (N 2 %) ^)",
+            "((N 0 *) 1 ^)", "(((2 53 ^) 1 +) 3 %)", "((G G *) (G G *) -)"
+        ]
+        for linha in linhas:
+            with self.subTest(linha=linha):
+                especializado, generico = self.executar_as_duas_formas(linha, memoria)
+                self.assertEqual(especializado, generico)
+
+    def teste_resultados_com_otimizacao(self):
+        """teste laço com resto e potência igual com e sem otimização"""
+        linhas = ["(0 I)", "(0 S)", "(I 50 < (((S ((I 7 %) (I 3 ^) +) +) S) ((I 1 +) I) +) WHILE)", "(S 9 %)"]
+        arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+        self.assertEqual(executar_arvores(arvores)[0], executar_arvores(arvores, otimizar=True)[0])
+        self.assertEqual(executar_arvores(arvores)[2]['S'], float(sum(i % 7 + i ** 3 for i in range(50))))
+
+class TestSuperinstrucoes(unittest.TestCase):
+    """testes para fundir_instrucoes e o aquecimento de ^"""
+
+    def compilar(self, linha, memoria=None, otimizar_lacos=False):
+        """compila uma linha sem fundir"""
+        arvore = gerar_arvores([parse_expressao(linha)])[0]
+        return compilar_arvore(arvore, memoria if memoria is not None else MemoriaSlots(), otimizar_lacos)
+
+    def executar_contando(self, codigo, memoria, historico):
+        """executa e devolve (valor ou erro, instruções executadas)"""
+        contagem = [0] * len(codigo)
+        try:
+            valor = executar_codigo(codigo, {'historico_resultados': historico, 'memoria': memoria}, contagem)
+        except ExecutorError as e:
+            valor = e.mensagem
+        except (OverflowError, ValueError, ZeroDivisionError) as e:
+            valor = f"{type(e).__name__}: {e}"
+        return valor, sum(contagem)
+
+    def teste_padroes(self):
+        """teste cada padrão vira uma superinstrução"""
+        casos = [
+            ("(2 3 +)", [OP_CONST]), ("((2 3 +) 4 *)", [OP_CONST]), ("(A 2 *)", [OP_CARREGAR_OP]),
+            ("((1 RES) 2 -)", [OP_RES_OP]), ("((A B +) 2 %)", [1, 1, 3, OP_CONST_OP]),
+            ("(5 0 /)", [0, 0, OP_DIVIDIR]), ("(A 0 %)", [1, 0, OP_RESTO])
+        ]
+        for linha, esperado in casos:
+            with self.subTest(linha=linha):
+                self.assertEqual([op for op, _, _ in fundir_instrucoes(self.compilar(linha))], esperado)
+
+        self.assertEqual(fundir_instrucoes(self.compilar("((2 3 +) 4 *)")), [(OP_CONST, 20.0, ('+', '*'))])
+
+    def teste_laco_com_registradores(self):
+        """teste REG_OP e TESTAR_K dentro de laço, saltos corrigidos"""
+        memoria = MemoriaSlots()
+        codigo = fundir_instrucoes(self.compilar("(I 10 < ((I 1 +) I) WHILE)", memoria, otimizar_lacos=True))
+        operacoes = [op for op, _, _ in codigo]
+
+        self.assertIn(OP_REG_OP, operacoes)
+        self.assertIn(OP_TESTAR_K, operacoes)
+        executar_codigo(codigo, {'historico_resultados': [], 'memoria': memoria})
+        self.assertEqual(memoria.para_dict(), {'I': 10.0})
+
+    def teste_programas_aleatorios(self):
+        """teste código fundido com mesmos resultados, erros e memória, e menos instruções"""
+        gerador = random.Random(47)
+        operandos = ["A", "B", "(1 RES)", "2", "3", "0", "(A 1 +)", "(B 2 *)"]
+        operadores = ['+', '-', '*', '/', '%', '^']
+
+        def expressao(profundidade):
+            if profundidade == 0 or gerador.random() < 0.3:
+                return gerador.choice(operandos)
+            return f"({expressao(profundidade - 1)} {expressao(profundidade - 1)} {gerador.choice(operadores)})"
+
+        for indice in range(200):
+            corpo = expressao(3)
+            if not corpo.startswith('('):
+                corpo = f"({corpo} 1 *)"
+            linha = gerador.choice([corpo, f"({corpo} A)", f"(A 4 < {corpo} (B 2 -) IF)",
+                                    f"(A 6 < ((({corpo} 0 *) (A 1 +) +) A) WHILE)"])
+            try:
+                gerar_arvores([parse_expressao(linha)])
+            except Exception:
+                continue  # literal seguido de identificador não é aceito pelo parser
+            for otimizar_lacos in (False, True):
+                memorias = [MemoriaSlots.de_dict({'A': 2.0, 'B': -3.0}) for _ in range(2)]
+                codigo = self.compilar(linha, memorias[0], otimizar_lacos)
+                fundido = fundir_instrucoes(self.compilar(linha, memorias[1], otimizar_lacos))
+                esperado, passos = self.executar_contando(codigo, memorias[0], [1.5])
+                obtido, passos_fundido = self.executar_contando(fundido, memorias[1], [1.5])
+
+                mensagem = f"programa {indice}: {linha}"
+                self.assertEqual(repr(obtido), repr(esperado), mensagem)
+                self.assertEqual(memorias[1], memorias[0], mensagem)
+                self.assertLessEqual(passos_fundido, passos, mensagem)
+
+    def teste_aquecimento_de_potencia(self):
+        """teste ^ genérico vira POTENCIA_Q e volta a ARIT com expoente fracionário"""
+        memoria = MemoriaSlots.de_dict({'B': 2.0})
+        codigo = fundir_instrucoes(self.compilar("(I 20 < (((S (B I ^) +) S) ((I 1 +) I) +) WHILE)", memoria))
+        executar_codigo(codigo, {'historico_resultados': [], 'memoria': memoria})
+
+        self.assertEqual(memoria['S'], float(2 ** 20 - 1))
+        self.assertIn((OP_POTENCIA_Q, '^', None), codigo)
+
+        memoria['I'] = 0.5
+        memoria['S'] = 0.0
+        executar_codigo(codigo, {'historico_resultados': [], 'memoria': memoria})
+
+        self.assertEqual(memoria['S'], sum(2 ** (0.5 + i) for i in range(20)))
+        self.assertIn((OP_ARIT, '^', None), codigo)
+        self.assertNotIn(OP_POTENCIA_Q, [op for op, _, _ in codigo])
+
+    def teste_aquecimento_exige_expoentes_seguidos(self):
+        """teste expoente fracionário antes do limiar desativa o aquecimento"""
+        memoria = MemoriaSlots.de_dict({'I': 1.0, 'B': 2.0})
+        n = LIMIAR_AQUECIMENTO - 1
+        linha = f"(I {n + 1} < (((S (B I ^) +) S) ((I (I {n} < (1 0 +) (0.5 0 +) IF) +) I) +) WHILE)"
+        codigo = fundir_instrucoes(self.compilar(linha, memoria))
+        executar_codigo(codigo, {'historico_resultados': [], 'memoria': memoria})
+
+        self.assertIn((OP_ARIT, '^', None), codigo)
+
+class TestExecucaoEmFatias(unittest.TestCase):
+    """testes para o interpretador como gerador"""
+
+    LINHAS = ["(0 I)", "(0 S)", "(I 500 < (((S I +) S) ((I 1 +) I) +) WHILE)", "(S 2 /)", "(I 500 < (1 2 +) (3 4 +) IF)"]
+
+    def executar_ate_o_fim(self, execucao):
+        """consome o gerador; retorna (pausas, valor de retorno)"""
+        pausas = []
+        while True:
+            try:
+                pausas.append(next(execucao))
+            except StopIteration as fim:
+                return pausas, fim.value
+
+    def teste_mesmos_resultados(self):
+        """teste resultado e memória iguais aos de executar_arvores"""
+        for otimizar in (False, True):
+            with self.subTest(otimizar=otimizar):
+                arvores = gerar_arvores([parse_expressao(linha) for linha in self.LINHAS])
+                esperado, _, memoria_esperada = executar_arvores(arvores, otimizar=otimizar)
+                pausas, (resultados, historico, memoria) = self.executar_ate_o_fim(
+                    executar_arvores_em_fatias(arvores, otimizar=otimizar, passos_por_fatia=100))
+
+                self.assertEqual(resultados, esperado)
+                self.assertEqual(historico, esperado)
+                self.assertEqual(memoria.para_dict(), memoria_esperada.para_dict())
+                self.assertGreater(len(pausas), 10)
+                self.assertEqual(pausas, sorted(pausas))
+
+    def teste_memoria_atualizada_nas_pausas(self):
+        """teste memória visível entre fatias, inclusive com registradores"""
+        memoria = MemoriaSlots()
+        arvores = gerar_arvores([parse_expressao("(0 I)"), parse_expressao("(I 1000 < ((I 1 +) I) WHILE)")])
+        execucao = executar_arvores_em_fatias(arvores, memoria=memoria, otimizar=True, passos_por_fatia=50)
+
+        vistos = []
+        for _ in execucao:
+            vistos.append(memoria['I'])
+        self.assertEqual(vistos, sorted(vistos))
+        self.assertTrue(0 < vistos[0] < vistos[-1] <= 1000)
+        self.assertEqual(memoria['I'], 1000.0)
+
+    def teste_cache_e_perfil(self):
+        """teste pausas com cache de resultados e perfil"""
+        arvores = gerar_arvores([parse_expressao(linha) for linha in self.LINHAS + self.LINHAS])
+        esperado, _, _ = executar_arvores(arvores)
+        cache = criar_cache_resultados()
+        perfil = criar_perfil()
+        _, (resultados, _, _) = self.executar_ate_o_fim(
+            executar_arvores_em_fatias(arvores, passos_por_fatia=100, cache=cache, perfil=perfil))
+
+        self.assertEqual(resultados, esperado)
+        self.assertEqual(len(perfil['linhas']), len(self.LINHAS))
+
+    def teste_sem_pausas_fora_do_gerador(self):
+        """teste executar_arvores com limites nunca pausa"""
+        arvores = gerar_arvores([parse_expressao(linha) for linha in self.LINHAS])
+        limites = criar_limites(max_passos=10 ** 6, intervalo_verificacao=10)
+        resultados, _, _ = executar_arvores(arvores, limites=limites)
+        self.assertEqual(resultados[2:], [125250.0, 62375.0, 7.0])
+
+    def teste_erro_indica_linha(self):
+        """teste erro dentro do gerador informa a linha"""
+        arvores = gerar_arvores([parse_expressao("(1 2 +)"), parse_expressao("(5 0 /)")])
+        with self.assertRaises(ExecutorError) as contexto:
+            self.executar_ate_o_fim(executar_arvores_em_fatias(arvores))
+        self.assertEqual(contexto.exception.contexto, "linha 2")
+
+if __name__ == '__main__':
+    unittest.main()
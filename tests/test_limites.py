@@ -0,0 +1,108 @@
+"""
+testes para os orçamentos de execução
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.limites import criar_limites, iniciar_limites, LimiteError, profundidade_arvore
+from src.interpretador import gerar_arvores, executar_arvores, compilar_arvore, executar_codigo
+from src.memoria import MemoriaSlots
+from src.lexer import parse_expressao
+
+LACO_INFINITO = ["(1 I)", "(I 0 > ((I 1 +) I) WHILE)"]
+
+def arvores_de(linhas):
+    """tokeniza e gera as árvores das linhas"""
+    return gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+class TestLimites(unittest.TestCase):
+    """testes para passos, prazo, profundidade e expoente"""
+
+    def teste_passos_iguais_as_instrucoes_executadas(self):
+        """teste contagem por trechos igual à contagem instrução a instrução"""
+        for linha in ["(I 10 < ((I 1 +) I) WHILE)", "(I 5 > (1 2 +) (3 4 +) IF)", "(0 I)"]:
+            for otimizar in (False, True):
+                with self.subTest(linha=linha, otimizar=otimizar):
+                    arvore = arvores_de([linha])[0]
+                    memoria = MemoriaSlots()
+                    codigo = compilar_arvore(arvore, memoria, otimizar_lacos=otimizar)
+                    contagem = [0] * len(codigo)
+                    limites = criar_limites(max_passos=10 ** 6)
+                    iniciar_limites(limites)
+                    executar_codigo(codigo, {'memoria': memoria, 'historico_resultados': [],
+                                             'limites': limites}, contagem)
+                    self.assertEqual(limites['passos'], sum(contagem))
+
+    def teste_sem_limites_atingidos(self):
+        """teste resultados iguais com e sem orçamento"""
+        linhas = ["(0 I)", "(I 100 < ((I 1 +) I) WHILE)", "(2 10 ^)"]
+        esperado = executar_arvores(arvores_de(linhas))[0]
+        obtido = executar_arvores(arvores_de(linhas), limites=criar_limites(10 ** 6, 10, 100, 60.0))[0]
+        self.assertEqual(obtido, esperado)
+
+    def teste_maximo_de_passos(self):
+        """teste laço infinito interrompido com estatísticas parciais"""
+        with self.assertRaises(LimiteError) as contexto:
+            executar_arvores(arvores_de(LACO_INFINITO), limites=criar_limites(max_passos=5000))
+
+        estatisticas = contexto.exception.estatisticas
+        self.assertEqual(estatisticas['limite'], 'passos')
+        self.assertEqual((estatisticas['linha'], estatisticas['resultados']), (2, 1))
+        self.assertGreater(estatisticas['passos'], 5000)
+        self.assertLess(estatisticas['passos'], 5100)
+
+    def teste_prazo(self):
+        """teste prazo verificado a cada intervalo de passos"""
+        limites = criar_limites(prazo_segundos=0.05, intervalo_verificacao=500)
+        with self.assertRaises(LimiteError) as contexto:
+            executar_arvores(arvores_de(LACO_INFINITO), limites=limites, memoria=MemoriaSlots())
+
+        estatisticas = contexto.exception.estatisticas
+        self.assertEqual(estatisticas['limite'], 'prazo')
+        self.assertGreaterEqual(estatisticas['segundos'], 0.05)
+        self.assertLess(estatisticas['segundos'], 1.0)
+
+    def teste_memoria_preservada_com_lacos_otimizados(self):
+        """teste registradores devolvidos à memória quando o orçamento estoura"""
+        memoria = MemoriaSlots()
+        with self.assertRaises(LimiteError):
+            executar_arvores(arvores_de(LACO_INFINITO), memoria=memoria, otimizar=True,
+                             limites=criar_limites(max_passos=1000))
+        self.assertGreater(memoria['I'], 1.0)
+
+    def teste_profundidade(self):
+        """teste profundidade rejeitada antes de executar"""
+        arvores = arvores_de(["(1 A)", "(((1 2 +) 3 *) 4 -)"])
+        self.assertEqual(profundidade_arvore(arvores[1]), 3)
+
+        memoria = MemoriaSlots()
+        with self.assertRaises(LimiteError) as contexto:
+            executar_arvores(arvores, memoria=memoria, limites=criar_limites(max_profundidade=2))
+        self.assertEqual(contexto.exception.estatisticas['linha'], 2)
+        self.assertNotIn('A', memoria)
+
+    def teste_expoente(self):
+        """teste magnitude do expoente de ^"""
+        limites = criar_limites(max_expoente=64)
+        self.assertEqual(executar_arvores(arvores_de(["(1 64 ^)"]), limites=limites)[0], [1.0])
+
+        with self.assertRaises(LimiteError) as contexto:
+            executar_arvores(arvores_de(["(1 X)", "(X 65 ^)"]), limites=limites)
+        self.assertEqual(contexto.exception.estatisticas['limite'], 'expoente')
+
+    def teste_expoente_com_otimizacao(self):
+        """teste potência constante acima do limite não é dobrada pelo otimizador"""
+        limites = criar_limites(max_expoente=64)
+        resultados, _, _ = executar_arvores(arvores_de(["(2 (4 4 *) ^)"]), otimizar=True, limites=limites)
+        self.assertEqual(resultados, [65536.0])
+
+        with self.assertRaises(LimiteError) as contexto:
+            executar_arvores(arvores_de(["(1 (5 13 *) ^)"]), otimizar=True, limites=limites)
+        self.assertEqual(contexto.exception.estatisticas['limite'], 'expoente')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+testes para o cache de resultados entre linhas
+"""
+
+import unittest
+import random
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.interpretador import gerar_arvores, executar_arvores
+from src.memoizacao import criar_cache_resultados, estatisticas_cache, forma_canonica
+from src.lexer import parse_expressao
+
+def arvores_de(linhas):
+    """tokeniza e gera as árvores das linhas"""
+    return gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+class TestMemoizacao(unittest.TestCase):
+    """testes para memoização de linhas"""
+
+    def teste_forma_canonica(self):
+        """teste formato numérico não muda a forma"""
+        a, b, c = arvores_de(["(2 3 +)", "(2.0 3.0 +)", "(3 2 +)"])
+
+        self.assertEqual(forma_canonica(a), forma_canonica(b))
+        self.assertNotEqual(forma_canonica(a), forma_canonica(c))
+
+    def teste_escrita_invalida_entrada(self):
+        """teste (V MEM) invalida linhas que leem MEM"""
+        cache = criar_cache_resultados()
+        linhas = ["(10 A)", "(A 2 *)", "(A 2 *)", "(7 A)", "(A 2 *)"]
+        resultados, _, _ = executar_arvores(arvores_de(linhas), cache=cache)
+
+        self.assertEqual(resultados, [10.0, 20.0, 20.0, 7.0, 14.0])
+        self.assertEqual(estatisticas_cache(cache)['acertos'], 1)
+
+    def teste_res_depende_do_historico(self):
+        """teste (1 RES) só é reaproveitado com o mesmo valor anterior"""
+        cache = criar_cache_resultados()
+        linhas = ["(1 2 +)", "((1 RES) 2 *)", "(5 5 +)", "((1 RES) 2 *)", "(1 2 +)", "((1 RES) 2 *)"]
+        resultados, _, _ = executar_arvores(arvores_de(linhas), cache=cache)
+
+        self.assertEqual(resultados, [3.0, 6.0, 10.0, 20.0, 3.0, 6.0])
+        self.assertEqual(estatisticas_cache(cache)['acertos'], 2)
+
+    def teste_acerto_reaplica_escritas(self):
+        """teste acerto em linha com escrita grava a memória"""
+        cache = criar_cache_resultados()
+        linhas = ["(0 I)", "(I 3 < ((I 1 +) I) WHILE)", "(0 I)", "(I 3 < ((I 1 +) I) WHILE)", "(I)"]
+        resultados, _, memoria = executar_arvores(arvores_de(linhas), cache=cache)
+
+        self.assertEqual(resultados, [0.0, 3.0, 0.0, 3.0, 3.0])
+        self.assertEqual(memoria['I'], 3.0)
+
+    def teste_nova_execucao_nao_usa_memoria_antiga(self):
+        """teste cache reaproveitado entre execuções com memórias diferentes"""
+        cache = criar_cache_resultados()
+        arvores = arvores_de(["(A 1 +)", "(2 3 *)"])
+
+        executar_arvores(arvores, memoria={'A': 1.0}, cache=cache)
+        resultados, _, _ = executar_arvores(arvores, memoria={'A': 5.0}, cache=cache)
+
+        self.assertEqual(resultados, [6.0, 6.0])
+        self.assertEqual(estatisticas_cache(cache)['acertos'], 1)
+
+    def teste_descarte_lru(self):
+        """teste capacidade limitada descarta a entrada menos usada"""
+        cache = criar_cache_resultados(capacidade=2)
+        executar_arvores(arvores_de(["(1 1 +)", "(2 2 +)", "(1 1 +)", "(3 3 +)", "(1 1 +)", "(2 2 +)"]), cache=cache)
+        estatisticas = estatisticas_cache(cache)
+
+        self.assertEqual(estatisticas['entradas'], 2)
+        self.assertEqual(estatisticas['acertos'], 2)
+        self.assertEqual(estatisticas['descartes'], 2)
+
+    def teste_programas_aleatorios(self):
+        """teste resultados e memória iguais com e sem cache"""
+        gerador = random.Random(31)
+        modelos = [
+            "({n} A)", "({n} B)", "(A B +)", "(A {n} *)", "((1 RES) {n} +)",
+            "((A 1 +) A)", "(A {n} > ((A 1 -) B) (A) IF)", "(B A <= (B) ((B 1 +) B) IF)",
+            "({n} {n} -)", "((2 RES) B *)"
+        ]
+
+        for _ in range(20):
+            linhas = ["(1 A)", "(2 B)"]
+            linhas += [gerador.choice(modelos).format(n=gerador.randint(0, 3)) for _ in range(30)]
+            arvores = arvores_de(linhas)
+
+            esperado, _, memoria_esperada = executar_arvores(arvores)
+            resultados, _, memoria = executar_arvores(arvores, cache=criar_cache_resultados(8))
+
+            self.assertEqual(resultados, esperado)
+            self.assertEqual(memoria, memoria_esperada)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+testes para a memória de identificadores em memória compartilhada
+"""
+
+import unittest
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.memoria_compartilhada import MemoriaCompartilhada, MemoriaCompartilhadaError
+from src.memoria import MemoriaSlots
+from src.interpretador import gerar_arvores, executar_arvores
+from src.lexer import parse_expressao
+
+def executar_em_trabalhador(nome_segmento, linhas):
+    """executa linhas sobre o instantâneo publicado, em outro processo"""
+    compartilhada = MemoriaCompartilhada.anexar(nome_segmento)
+    try:
+        memoria = compartilhada.carregar()
+        resultados, _, _ = executar_arvores(gerar_arvores([parse_expressao(linha) for linha in linhas]),
+                                            memoria=memoria)
+        return resultados
+    finally:
+        compartilhada.fechar()
+
+class TestMemoriaCompartilhada(unittest.TestCase):
+    """testes para publicar, carregar e anexar segmentos"""
+
+    def setUp(self):
+        self.compartilhada = MemoriaCompartilhada.criar(capacidade=8)
+
+    def tearDown(self):
+        self.compartilhada.destruir()
+
+    def teste_publicar_e_carregar(self):
+        """teste valores publicados visíveis em outro handle do mesmo segmento"""
+        self.compartilhada.publicar({'A': 2.5, 'B': -1.0})
+        outro = MemoriaCompartilhada.anexar(self.compartilhada.nome)
+        try:
+            memoria = outro.carregar()
+            self.assertIsInstance(memoria, MemoriaSlots)
+            self.assertEqual(memoria.para_dict(), {'A': 2.5, 'B': -1.0})
+            self.assertEqual(outro.ler('B'), -1.0)
+            self.assertEqual(outro.ler('Z'), 0.0)
+        finally:
+            outro.fechar()
+
+    def teste_escritas_locais_ate_publicar(self):
+        """teste read-your-writes no instantâneo e visibilidade só após publicar"""
+        self.compartilhada.publicar({'A': 1.0})
+        memoria = self.compartilhada.carregar()
+        executar_arvores(gerar_arvores([parse_expressao("(7 A)")]), memoria=memoria)
+
+        self.assertEqual(memoria['A'], 7.0)
+        self.assertEqual(self.compartilhada.ler('A'), 1.0)
+
+        geracao = self.compartilhada.geracao
+        self.assertEqual(self.compartilhada.publicar(memoria, ['A']), geracao + 2)
+        self.assertEqual(self.compartilhada.ler('A'), 7.0)
+
+    def teste_slots_estaveis(self):
+        """teste nomes acrescentados sem mudar slots existentes"""
+        self.compartilhada.publicar({'A': 1.0})
+        primeiro = self.compartilhada.carregar()
+        self.compartilhada.publicar({'B': 2.0, 'A': 3.0})
+        segundo = self.compartilhada.carregar()
+
+        self.assertEqual(primeiro.tabela, {'A': 0})
+        self.assertEqual(segundo.tabela, {'A': 0, 'B': 1})
+        self.assertEqual(segundo.para_dict(), {'A': 3.0, 'B': 2.0})
+
+    def teste_capacidade_esgotada(self):
+        """teste erro ao registrar mais nomes que a capacidade"""
+        with self.assertRaises(MemoriaCompartilhadaError):
+            self.compartilhada.publicar({nome: 1.0 for nome in "ABCDEFGHI"})
+        # nada publicado
+        self.assertEqual(self.compartilhada.geracao, 0)
+        self.assertEqual(self.compartilhada.n_nomes(), 0)
+
+    def teste_segmento_inexistente(self):
+        """teste anexar nome que não existe"""
+        with self.assertRaises(MemoriaCompartilhadaError):
+            MemoriaCompartilhada.anexar('rpn_segmento_inexistente')
+
+    def teste_trabalhador_em_outro_processo(self):
+        """teste processo trabalhador lendo a memória publicada sem pickle dos valores"""
+        self.compartilhada.publicar({'A': 2.0, 'B': 3.0})
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            resultados = pool.submit(executar_em_trabalhador, self.compartilhada.nome,
+                                     ["(A B *)", "(10 A)", "(A B +)"]).result()
+
+        self.assertEqual(resultados, [6.0, 10.0, 13.0])
+        # a escrita do trabalhador não foi publicada
+        self.assertEqual(self.compartilhada.ler('A'), 2.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+testes para o registro de operadores
+"""
+
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.operadores import OPERADORES, obter_operador
+from src.executor import executar_operacao, ExecutorError
+from src.token_types import OPERADORES_VALIDOS
+from src.grammar import construir_gramatica
+from src.lexer import parse_expressao
+from src.assembly_generator import gerar_expressao_hardcoded
+
+class TestOperadores(unittest.TestCase):
+    """testes para a tabela de operadores e seus consumidores"""
+
+    def teste_definicoes_completas(self):
+        """teste todo operador tem avaliação, aridade e gancho de assembly"""
+        for simbolo, definicao in OPERADORES.items():
+            self.assertEqual(definicao['simbolo'], simbolo)
+            self.assertEqual(definicao['aridade'], 2)
+            self.assertTrue(callable(definicao['avaliar']))
+            self.assertTrue(definicao['assembly'].endswith("\n"))
+
+    def teste_lexico_e_gramatica_usam_registro(self):
+        """teste conjunto de operadores válidos e produções OPERADOR_ARIT"""
+        self.assertEqual(OPERADORES_VALIDOS, set(OPERADORES))
+        producoes = construir_gramatica()['producoes']['OPERADOR_ARIT']
+        self.assertEqual(sorted(producao[0] for producao in producoes), sorted(OPERADORES))
+
+    def teste_avaliacao(self):
+        """teste resultados e mensagens de erro preservados"""
+        self.assertEqual(executar_operacao('-', 2.0, 5.0), 3.0)
+        self.assertEqual(executar_operacao('^', 3.0, 2.0), 8.0)
+        self.assertEqual(executar_operacao('%', 4.0, 10.0), 2.0)
+
+        casos = [('/', 0.0, 1.0, "Divisão por zero"),
+                 ('%', 0.0, 1.0, "Divisão por zero no resto"),
+                 ('^', 0.5, -8.0, "Resultado complexo na potenciação"),
+                 ('?', 1.0, 1.0, "Operador inválido: ?")]
+        for operador, operando2, operando1, mensagem in casos:
+            with self.subTest(operador=operador):
+                with self.assertRaises(ExecutorError) as contexto:
+                    executar_operacao(operador, operando2, operando1)
+                self.assertEqual(contexto.exception.mensagem, mensagem)
+
+        with self.assertRaises(ExecutorError) as contexto:
+            executar_operacao('^', 400.0, 10.0)
+        self.assertTrue(contexto.exception.mensagem.startswith("Erro numérico na operação ^"))
+
+    def teste_modelo_python_equivale_a_avaliacao(self):
+        """teste expressão inline gera o mesmo valor da função de avaliação"""
+        for simbolo, definicao in OPERADORES.items():
+            if definicao['python'] is None:
+                continue
+            with self.subTest(operador=simbolo):
+                valor = eval(definicao['python'].format('7.5', '2.0'))
+                self.assertEqual(valor, definicao['avaliar'](7.5, 2.0))
+
+    def teste_assembly_da_tabela(self):
+        """teste gerador de assembly insere as instruções do registro"""
+        codigo = gerar_expressao_hardcoded(parse_expressao("(7 2 %)"), 1)
+        self.assertIn(obter_operador('%')['assembly'], codigo)
+
+if __name__ == '__main__':
+    unittest.main()
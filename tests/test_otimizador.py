@@ -0,0 +1,112 @@
+"""
+testes para o passo de otimização da árvore sintática
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.otimizador import otimizar_arvore, otimizar_programa, otimizar_tokens, arvore_para_tokens
+from src.interpretador import gerar_arvores, executar_arvores, compilar_arvore, OP_TEMPORARIO
+from src.executor import executar_programa, ExecutorError
+from src.memoria import MemoriaSlots
+from src.lexer import parse_expressao
+
+def arvore_de(linha):
+    """gera árvore sintática de uma linha"""
+    return gerar_arvores([parse_expressao(linha)])[0]
+
+class TestOtimizador(unittest.TestCase):
+    """testes para dobramento de constantes e subexpressões comuns"""
+    
+    def teste_dobra_constantes(self):
+        """teste subárvore só com literais vira constante"""
+        arvore, estatisticas = otimizar_arvore(arvore_de("((2 3 +) (4 5 *) -)"))
+        
+        self.assertEqual(arvore['filhos'][0]['tipo'], 'NUMERO')
+        self.assertEqual(float(arvore['filhos'][0]['valor']), -15.0)
+        self.assertEqual(estatisticas['constantes_dobradas'], 3)
+        self.assertEqual(estatisticas['nos_eliminados'], 8)
+    
+    def teste_nao_dobra_divisao_por_zero(self):
+        """teste erro de execução é preservado"""
+        arvore, estatisticas = otimizar_arvore(arvore_de("((1 1 +) 0 /)"))
+        
+        self.assertEqual(estatisticas['constantes_dobradas'], 1)
+        with self.assertRaises(ExecutorError):
+            executar_arvores([arvore])
+    
+    def teste_nao_dobra_erros_numericos(self):
+        """teste potência de zero com expoente negativo continua falhando na execução"""
+        arvore, estatisticas = otimizar_arvore(arvore_de("(0 (0 1 -) ^)"))
+
+        self.assertEqual(arvore['filhos'][0]['tipo'], 'OPERACAO')
+        self.assertEqual(estatisticas['constantes_dobradas'], 1)
+        with self.assertRaises(ExecutorError):
+            executar_arvores([arvore])
+
+    def teste_operando_antes_de_identificador(self):
+        """teste constante dobrada antes de identificador não vira armazenamento"""
+        linha = "((2.5 1 -) A +)"
+        tokens = otimizar_tokens(parse_expressao(linha))
+        esperado, _, _ = executar_programa([parse_expressao(linha)], memoria={'A': 2.0})
+        resultados, _, memoria = executar_programa([tokens], memoria={'A': 2.0})
+
+        self.assertEqual(resultados, esperado)
+        self.assertEqual(memoria['A'], 2.0)
+        self.assertEqual(gerar_arvores([tokens])[0], arvore_de(linha))
+
+    def teste_subexpressao_comum_calculada_uma_vez(self):
+        """teste subárvores iguais compartilham um temporário"""
+        arvore, estatisticas = otimizar_arvore(arvore_de("((A B *) ((A B *) 2 +) /)"))
+        codigo = compilar_arvore(arvore, MemoriaSlots())
+        
+        self.assertEqual(estatisticas['subexpressoes_reutilizadas'], 1)
+        self.assertEqual(sum(1 for instrucao in codigo if instrucao[0] == OP_TEMPORARIO), 1)
+    
+    def teste_nao_reutiliza_identificador_escrito(self):
+        """teste subexpressão que lê identificador escrito na linha não é reutilizada"""
+        _, estatisticas = otimizar_arvore(arvore_de("(((A 1 +) A) (A 1 +) +)"))
+        
+        self.assertEqual(estatisticas['subexpressoes_reutilizadas'], 0)
+    
+    def teste_programa_otimizado_equivalente(self):
+        """teste resultados iguais com e sem otimização"""
+        linhas = [
+            "(3 A)", "((A 2 *) (A 2 *) +)", "((2 3 +) (4 5 *) -)",
+            "(((A 1 +) A) (A 1 +) +)", "(A 4 > ((A A *) (A A *) -) (1 RES) IF)",
+            "(I 5 < ((I (1 1 +) +) I) WHILE)", "(1 2 < (7 B) (8 B) IF)"
+        ]
+        arvores = gerar_arvores([parse_expressao(linha) for linha in linhas])
+        otimizadas, estatisticas = otimizar_programa(arvores)
+        
+        esperado, _, memoria_esperada = executar_arvores(arvores)
+        resultados, _, memoria = executar_arvores(otimizadas)
+        
+        self.assertEqual(resultados, esperado)
+        self.assertEqual(memoria, memoria_esperada)
+        self.assertGreater(estatisticas['nos_eliminados'], 0)
+    
+    def teste_backend_de_tokens(self):
+        """teste executor de tokens consome a árvore dobrada"""
+        tokens = otimizar_tokens(parse_expressao("(((2 3 +) X) (X (1 1 +) *) +)"))
+        
+        self.assertEqual([t['valor'] for t in tokens],
+                         ['(', '(', '5.0', 'X', ')', '(', 'X', '2.0', '*', ')', '+', ')'])
+        
+        linhas = ["((2 3 +) (4 5 *) -)", "((10 5 /) (3 2 ^) *)", "(5 X)", "(X (1 1 +) *)"]
+        esperado, _, _ = executar_programa([parse_expressao(linha) for linha in linhas])
+        resultados, _, _ = executar_programa([parse_expressao(linha) for linha in linhas], otimizar=True)
+        self.assertEqual(resultados, esperado)
+    
+    def teste_tokens_ida_e_volta(self):
+        """teste árvore convertida em tokens gera a mesma árvore"""
+        linha = "(X 0 > (X) ((1 RES) 2 ^) IF)"
+        arvore = arvore_de(linha)
+        
+        self.assertEqual(gerar_arvores([arvore_para_tokens(arvore)])[0], arvore)
+
+if __name__ == '__main__':
+    unittest.main()
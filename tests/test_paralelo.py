@@ -0,0 +1,84 @@
+"""
+testes para a execução paralela de linhas independentes
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.paralelo import analisar_dependencias, calcular_niveis, executar_paralelo
+from src.interpretador import gerar_arvores, executar_arvores
+from src.executor import ExecutorError
+from src.memoria import MemoriaSlots
+from src.lexer import parse_expressao
+
+def arvores_de(linhas):
+    """gera árvores sintáticas das linhas"""
+    return gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+class TestParalelo(unittest.TestCase):
+    """testes para o escalonador paralelo"""
+    
+    def teste_dependencias(self):
+        """teste arestas de RES, leitura após escrita e escrita após leitura"""
+        analise = analisar_dependencias(arvores_de([
+            "(1 A)", "(2 3 +)", "(A 2 *)", "(2 RES)", "(5 A)", "(A)"
+        ]))
+        
+        self.assertEqual([sorted(a['depende']) for a in analise],
+                         [[], [], [0], [1], [0, 2], [4]])
+    
+    def teste_niveis(self):
+        """teste linhas independentes no mesmo nível"""
+        niveis = calcular_niveis(analisar_dependencias(arvores_de([
+            "(1 2 +)", "(3 4 +)", "(5 6 +)", "((1 RES) 2 *)"
+        ])))
+        
+        self.assertEqual(niveis, [[0, 1, 2], [3]])
+    
+    def teste_equivalente_ao_sequencial(self):
+        """teste resultados, histórico e memória iguais à execução sequencial"""
+        linhas = [
+            "(10 A)", "(20 B)", "(A 2 *)", "(B 3 *)", "((2 RES) (2 RES) +)",
+            "((A 1 +) A)", "(A B +)", "(0 I)", "(I 5 < ((I 1 +) I) WHILE)",
+            "(I 3 > (I) (A) IF)", "(4 RES)"
+        ]
+        esperado = executar_arvores(arvores_de(linhas), [1.5])
+        obtido = executar_paralelo(arvores_de(linhas), [1.5], max_processos=2, tamanho_lote=2)
+        
+        self.assertEqual(obtido[0], esperado[0])
+        self.assertEqual(obtido[1], esperado[1])
+        self.assertEqual(obtido[2], esperado[2])
+    
+    def teste_res_do_historico_inicial(self):
+        """teste RES que alcança o histórico anterior ao programa"""
+        resultados, _, _ = executar_paralelo(arvores_de(["(2 RES)"]), [7.0, 8.0], max_processos=1)
+        
+        self.assertEqual(resultados, [7.0])
+    
+    def teste_erro_da_primeira_linha_que_falha(self):
+        """teste erro reportado é o da primeira linha em ordem de programa"""
+        linhas = ["(1 A)", "(A 0 /)", "(5 0 %)", "(1 RES)"]
+        with self.assertRaises(ExecutorError) as erro:
+            executar_paralelo(arvores_de(linhas), max_processos=2)
+        
+        self.assertEqual(erro.exception.contexto, "linha 2")
+    
+    def teste_linhas_apos_erro_nao_alteram_memoria(self):
+        """teste memória igual à da execução sequencial interrompida pelo erro"""
+        linhas = ["(1 A)", "(A 0 /)", "(7 B)", "(8 C)", "(B 2 *)", "((B C +) D)"]
+        esperada = MemoriaSlots()
+        with self.assertRaises(ExecutorError):
+            executar_arvores(arvores_de(linhas), memoria=esperada)
+        
+        memoria = MemoriaSlots()
+        with self.assertRaises(ExecutorError):
+            executar_paralelo(arvores_de(linhas), memoria=memoria, max_processos=2)
+        
+        self.assertEqual(memoria.para_dict(), esperada.para_dict())
+        self.assertEqual(memoria.para_dict(), {'A': 1.0})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -121,6 +121,28 @@ class TestParser(unittest.TestCase):
         self.assertEqual(resultado['derivacao']['conteudo']['operando1']['valor'], '3.14')
         self.assertEqual(resultado['derivacao']['conteudo']['operando2']['valor'], '2.71')
 
+    def teste_decisao_if(self):
+        """teste estrutura IF com os dois blocos antes da palavra reservada"""
+        tokens = parse_expressao("(X 0 > (X) (1 2 +) IF)")
+        resultado = parsear(tokens, self.tabela)
+        
+        conteudo = resultado['derivacao']['conteudo']
+        self.assertEqual(conteudo['tipo'], 'DECISAO')
+        self.assertEqual(conteudo['condicao']['operador'], '>')
+        self.assertEqual(conteudo['bloco_falso']['conteudo']['tipo'], 'OPERACAO')
+    
+    def teste_laco_com_armazenamento_de_expressao(self):
+        """teste WHILE cujo bloco armazena resultado de expressão"""
+        tokens = parse_expressao("(I 10 < ((I 1 +) I) WHILE)")
+        resultado = parsear(tokens, self.tabela)
+        
+        conteudo = resultado['derivacao']['conteudo']
+        self.assertEqual(conteudo['tipo'], 'LACO')
+        bloco = conteudo['bloco']['conteudo']
+        self.assertEqual(bloco['tipo'], 'COMANDO_ARMAZENAR')
+        self.assertEqual(bloco['identificador'], 'I')
+        self.assertEqual(bloco['valor']['tipo'], 'EXPRESSAO')
+
 def teste_expressao_simples():
     """função de teste standalone"""
     gramatica_info = construir_gramatica()
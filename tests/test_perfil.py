@@ -0,0 +1,92 @@
+"""
+testes para o perfil de execução
+"""
+
+import unittest
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.perfil import criar_perfil, linhas_mais_lentas, exportar_perfil_json, texto_tokens
+from src.executor import executar_programa, ExecutorError
+from src.interpretador import gerar_arvores, executar_arvores
+from src.lexer import parse_expressao
+
+PROGRAMA = ["(10 A)", "((A 2 ^) (A 3 ^) +)", "((1 RES) 7 %)", "(A 4 /)"]
+
+class TestPerfil(unittest.TestCase):
+    """testes para coleta e exportação do perfil"""
+
+    def teste_contagens_executor(self):
+        """teste contagem por operador, memória, RES e aninhadas"""
+        perfil = criar_perfil()
+        executar_programa([parse_expressao(linha) for linha in PROGRAMA], perfil=perfil)
+
+        self.assertEqual(perfil['operadores'], {'+': 1, '-': 0, '*': 0, '/': 1, '%': 1, '^': 2})
+        self.assertEqual(perfil['mem_leituras'], 3)
+        self.assertEqual(perfil['mem_escritas'], 1)
+        self.assertEqual(perfil['res'], 1)
+        self.assertEqual(perfil['aninhadas'], 3)
+        self.assertEqual(len(perfil['linhas']), 4)
+
+    def teste_contagens_interpretador(self):
+        """teste interpretador conta o mesmo que o executador de tokens"""
+        perfil_tokens = criar_perfil()
+        perfil_arvores = criar_perfil()
+        executar_programa([parse_expressao(linha) for linha in PROGRAMA], perfil=perfil_tokens)
+        executar_arvores(gerar_arvores([parse_expressao(linha) for linha in PROGRAMA]), perfil=perfil_arvores)
+
+        for chave in ('operadores', 'mem_leituras', 'mem_escritas', 'res'):
+            self.assertEqual(perfil_arvores[chave], perfil_tokens[chave])
+        self.assertEqual(set(perfil_arvores['linhas']), set(perfil_tokens['linhas']))
+
+    def teste_laco_conta_cada_iteracao(self):
+        """teste operações dentro do WHILE contadas por iteração"""
+        perfil = criar_perfil()
+        executar_arvores(gerar_arvores([parse_expressao(linha) for linha in
+                                        ["(0 I)", "(I 10 < ((I 1 +) I) WHILE)"]]), perfil=perfil)
+
+        self.assertEqual(perfil['operadores']['+'], 10)
+        self.assertEqual(perfil['mem_escritas'], 11)
+
+    def teste_excecao_registrada(self):
+        """teste erro é contado e a exceção continua sendo levantada"""
+        perfil = criar_perfil()
+        with self.assertRaises(ExecutorError):
+            executar_programa([parse_expressao(linha) for linha in ["(1 2 +)", "(1 0 /)"]], perfil=perfil)
+
+        self.assertEqual(perfil['excecoes'], 1)
+        self.assertEqual(perfil['excecoes_por_mensagem'], {'Divisão por zero': 1})
+        self.assertEqual(perfil['linhas']['(1 0 /)']['erros'], 1)
+
+    def teste_linhas_iguais_acumulam(self):
+        """teste linhas mais lentas agregadas por texto"""
+        perfil = criar_perfil()
+        executar_programa([parse_expressao(linha) for linha in ["(2 3 +)", "(1 1 +)", "(2 3 +)"]], perfil=perfil)
+
+        self.assertEqual(perfil['linhas']['(2 3 +)']['execucoes'], 2)
+        self.assertEqual(len(linhas_mais_lentas(perfil, 1)), 1)
+
+    def teste_texto_tokens(self):
+        """teste reconstrução do texto da linha"""
+        self.assertEqual(texto_tokens(parse_expressao("((1 RES)   2 *)")), "((1 RES) 2 *)")
+
+    def teste_exportar_json(self):
+        """teste relatório gravado em JSON"""
+        perfil = criar_perfil()
+        executar_programa([parse_expressao(linha) for linha in PROGRAMA], perfil=perfil)
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            caminho = os.path.join(diretorio, 'perfil.json')
+            exportar_perfil_json(perfil, caminho, top_n=2)
+            with open(caminho, encoding='utf-8') as arquivo:
+                relatorio = json.load(arquivo)
+
+        self.assertEqual(relatorio['operadores']['^'], 2)
+        self.assertEqual(len(relatorio['linhas_mais_lentas']), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+testes para o servidor de avaliação em socket Unix
+"""
+
+import unittest
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.servidor import (criar_sessao, avaliar_linha, avaliar_linha_cooperativa, iniciar_servidor,
+                          executar_cooperativo)
+from src.interpretador import gerar_arvores
+from src.lexer import parse_expressao
+
+async def enviar_linhas(caminho, linhas):
+    """envia todas as linhas de uma vez e lê uma resposta por linha"""
+    leitor, escritor = await asyncio.open_unix_connection(caminho)
+    escritor.write(''.join(linha + '\n' for linha in linhas).encode('utf-8'))
+    await escritor.drain()
+
+    respostas = [json.loads(await leitor.readline()) for linha in linhas if linha.strip()]
+    escritor.close()
+    await escritor.wait_closed()
+    return respostas
+
+class TestServidor(unittest.TestCase):
+    """testes para sessões e protocolo do servidor"""
+
+    def teste_sessao_guarda_memoria_e_historico(self):
+        """teste linhas da sessão compartilham MEM e RES"""
+        sessao = criar_sessao()
+        respostas = [avaliar_linha(sessao, linha) for linha in ["(10 A)", "(A 2 *)", "((1 RES) 1 +)"]]
+
+        self.assertEqual([resposta['resultado'] for resposta in respostas], [10.0, 20.0, 21.0])
+        self.assertEqual([resposta['linha'] for resposta in respostas], [1, 2, 3])
+
+    def teste_erro_estruturado_e_atomico(self):
+        """teste erro léxico/execução não altera a sessão"""
+        sessao = criar_sessao()
+        avaliar_linha(sessao, "(1 A)")
+        lexico = avaliar_linha(sessao, "(3.14.5 2 +)")
+        execucao = avaliar_linha(sessao, "((5 A) 0 /)")
+
+        self.assertEqual(lexico['erro']['tipo'], 'lexico')
+        self.assertEqual(execucao['erro'], {'tipo': 'execucao', 'mensagem': 'Divisão por zero'})
+        self.assertEqual(sessao['memoria']['A'], 1.0)
+        self.assertEqual(list(sessao['historico']), [1.0])
+
+    def teste_falha_desfaz_so_as_celulas_da_linha(self):
+        """teste linha com erro não copia a memória e desfaz as próprias escritas"""
+        sessao = criar_sessao()
+        for indice in range(100):
+            avaliar_linha(sessao, f"({indice} V{chr(65 + indice // 26)}{chr(65 + indice % 26)})")
+        memoria = sessao['memoria']
+
+        resposta = avaliar_linha(sessao, "(((1 VAD) (2 NOVA) +) 0 /)")
+
+        self.assertIn('erro', resposta)
+        self.assertIs(sessao['memoria'], memoria)
+        self.assertEqual(memoria['VAD'], 3.0)
+        self.assertNotIn('NOVA', memoria)
+        self.assertEqual(len(memoria), 100)
+
+    def teste_limite_historico(self):
+        """teste histórico limitado descarta resultados antigos"""
+        sessao = criar_sessao(limite_historico=2)
+        for linha in ["(1 1 +)", "(2 2 +)", "(3 3 +)"]:
+            avaliar_linha(sessao, linha)
+
+        self.assertEqual(avaliar_linha(sessao, "(2 RES)")['resultado'], 4.0)
+        self.assertIn('erro', avaliar_linha(sessao, "(3 RES)"))
+
+    def teste_clientes_com_sessoes_separadas(self):
+        """teste linhas em sequência e sessões independentes por conexão"""
+        async def cenario(caminho):
+            servidor = await iniciar_servidor(caminho)
+            async with servidor:
+                return await asyncio.gather(
+                    enviar_linhas(caminho, ["(5 X)", "", "(X 2 *)", "(1 RES)"]),
+                    enviar_linhas(caminho, ["(X)", "(1 0 /)", "(7 8 +)"])
+                )
+
+        with tempfile.TemporaryDirectory() as diretorio:
+            primeiro, segundo = asyncio.run(cenario(os.path.join(diretorio, 'rpn.sock')))
+
+        self.assertEqual([resposta['resultado'] for resposta in primeiro], [5.0, 10.0, 10.0])
+        self.assertEqual(segundo[0]['resultado'], 0.0)
+        self.assertEqual(segundo[1]['erro']['mensagem'], 'Divisão por zero')
+        self.assertEqual(segundo[2], {'linha': 3, 'resultado': 15.0})
+
+    def teste_laco_longo_nao_bloqueia(self):
+        """teste linha curta responde enquanto outro programa roda um laço longo"""
+        longo = gerar_arvores([parse_expressao("(0 I)"), parse_expressao("(I 200000 < ((I 1 +) I) WHILE)")])
+        curto = gerar_arvores([parse_expressao("(2 3 +)")])
+
+        async def cenario():
+            tarefa_longa = asyncio.create_task(executar_cooperativo(longo, passos_por_fatia=1000))
+            await asyncio.sleep(0)
+            inicio = time.perf_counter()
+            resultados, _, _ = await executar_cooperativo(curto)
+            latencia = time.perf_counter() - inicio
+            terminou_antes = tarefa_longa.done()
+            _, _, memoria = await tarefa_longa
+            return resultados, latencia, terminou_antes, memoria
+
+        resultados, latencia, terminou_antes, memoria = asyncio.run(cenario())
+        self.assertEqual(resultados, [5.0])
+        self.assertFalse(terminou_antes)
+        self.assertLess(latencia, 0.05)
+        self.assertEqual(memoria['I'], 200000.0)
+
+    def teste_sessao_com_laco(self):
+        """teste linha com WHILE na sessão e falha atômica no interpretador"""
+        async def cenario():
+            sessao = criar_sessao()
+            respostas = []
+            for linha in ["(0 I)", "(I 3000 < ((I 1 +) I) WHILE)", "(I 1 +)",
+                          "(((7 I) 0 /) J)", "(1 2 3)"]:
+                respostas.append(await avaliar_linha_cooperativa(sessao, linha, passos_por_fatia=100))
+            return sessao, respostas
+
+        sessao, respostas = asyncio.run(cenario())
+        self.assertEqual(respostas[2], {'linha': 3, 'resultado': 3001.0})
+        self.assertEqual(respostas[3]['erro']['mensagem'], 'Divisão por zero')
+        self.assertEqual(respostas[4]['erro']['tipo'], 'sintatico')
+        self.assertEqual(sessao['memoria']['I'], 3000.0)
+        self.assertNotIn('J', sessao['memoria'])
+        self.assertEqual(list(sessao['historico']), [0.0, 3000.0, 3001.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+testes para snapshot binário de sessão
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sessao import (salvar_sessao, carregar_sessao, carregar_estado_sessao, SessaoError,
+                        CABECALHO, CABECALHOS)
+from src.executor import executar_programa
+from src.memoria import MemoriaSlots
+from src.lexer import parse_expressao
+
+class TestSessao(unittest.TestCase):
+    """testes para salvar_sessao e carregar_sessao"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.diretorio.name, 'sessao.bin')
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def teste_ida_e_volta(self):
+        """teste histórico, memória e slots preservados"""
+        memoria = MemoriaSlots()
+        memoria.obter_slot('NAO_USADA')
+        memoria['X'] = 2.5
+        memoria['ÁREA'] = -1.0
+        salvar_sessao(self.caminho, [1.0, 2.0, 3.5], memoria)
+
+        historico, restaurada = carregar_sessao(self.caminho)
+
+        self.assertEqual(list(historico), [1.0, 2.0, 3.5])
+        self.assertEqual(restaurada, {'X': 2.5, 'ÁREA': -1.0})
+        self.assertEqual(restaurada.tabela, memoria.tabela)
+        self.assertNotIn('NAO_USADA', restaurada)
+
+    def teste_mmap(self):
+        """teste histórico mapeado sem cópia"""
+        salvar_sessao(self.caminho, [float(i) for i in range(100)], {'A': 1.0})
+        historico, memoria = carregar_sessao(self.caminho, usar_mmap=True)
+
+        self.assertEqual(len(historico), 100)
+        self.assertEqual(historico[-1], 99.0)
+        self.assertEqual(memoria['A'], 1.0)
+        historico.release()
+
+    def teste_retomar_execucao(self):
+        """teste sessão restaurada continua com RES e MEM"""
+        linhas = [parse_expressao(linha) for linha in ["(10 A)", "(A 3 *)"]]
+        _, historico, memoria = executar_programa(linhas)
+        salvar_sessao(self.caminho, historico, memoria)
+
+        historico, memoria = carregar_sessao(self.caminho)
+        resultados, _, _ = executar_programa([parse_expressao("((1 RES) A +)")], historico, memoria)
+
+        self.assertEqual(resultados, [40.0])
+
+    def teste_sessao_vazia(self):
+        """teste sessão sem histórico nem memória"""
+        salvar_sessao(self.caminho, [], {})
+        historico, memoria = carregar_sessao(self.caminho, usar_mmap=True)
+
+        self.assertEqual(len(historico), 0)
+        self.assertEqual(len(memoria), 0)
+
+    def teste_linhas_e_versao_anterior(self):
+        """teste contador de linhas gravado e arquivo da versão 1 ainda lido"""
+        salvar_sessao(self.caminho, [1.0, 2.0], {'A': 1.0}, linhas=5)
+        self.assertEqual(carregar_estado_sessao(self.caminho)[2], 5)
+
+        with open(self.caminho, 'rb') as arquivo:
+            dados = bytearray(arquivo.read())
+        campos = CABECALHO.unpack_from(dados)
+        antigo = CABECALHOS[1].pack(campos[0], 1, *campos[2:6]) + dados[CABECALHO.size:]
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(antigo)
+
+        historico, memoria, linhas = carregar_estado_sessao(self.caminho)
+        self.assertEqual(list(historico), [1.0, 2.0])
+        self.assertEqual(memoria['A'], 1.0)
+        self.assertEqual(linhas, 2)
+
+    def teste_arquivo_invalido(self):
+        """teste arquivo truncado ou com assinatura errada"""
+        salvar_sessao(self.caminho, [1.0, 2.0], {'A': 1.0})
+        with open(self.caminho, 'rb') as arquivo:
+            dados = arquivo.read()
+
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(dados[:-3])
+        with self.assertRaises(SessaoError):
+            carregar_sessao(self.caminho)
+
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(b'XXXX' + dados[4:])
+        with self.assertRaises(SessaoError):
+            carregar_sessao(self.caminho)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+testes para a varredura de parâmetros por CSV
+"""
+
+import unittest
+import csv
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.varredura import executar_varredura
+from src.compilador import CompiladorError
+
+PROGRAMA = "(A B *)\n((1 RES) C +)\n(A B /)\n"
+
+class TestVarredura(unittest.TestCase):
+    """testes para executar_varredura"""
+
+    def setUp(self):
+        self.diretorio = tempfile.TemporaryDirectory()
+        self.programa = self.caminho('programa.txt')
+        self.parametros = self.caminho('parametros.csv')
+        self.saida = self.caminho('saida.csv')
+        with open(self.programa, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(PROGRAMA)
+
+    def tearDown(self):
+        self.diretorio.cleanup()
+
+    def caminho(self, nome):
+        return os.path.join(self.diretorio.name, nome)
+
+    def gravar_parametros(self, linhas):
+        with open(self.parametros, 'w', newline='', encoding='utf-8') as arquivo:
+            csv.writer(arquivo).writerows(linhas)
+
+    def ler_saida(self):
+        with open(self.saida, newline='', encoding='utf-8') as arquivo:
+            return list(csv.reader(arquivo))
+
+    def teste_uma_execucao_por_linha(self):
+        """teste colunas de entrada seguidas dos resultados"""
+        self.gravar_parametros([['A', 'B', 'C'], ['2', '3', '1'], ['4', '5', '0.5']])
+        estatisticas = executar_varredura(self.programa, self.parametros, self.saida, max_processos=1)
+
+        self.assertEqual(self.ler_saida(), [
+            ['A', 'B', 'C', 'resultado_1', 'resultado_2', 'resultado_3', 'erro'],
+            ['2', '3', '1', '6.0', '7.0', '0.67', ''],
+            ['4', '5', '0.5', '20.0', '20.5', '0.8', '']
+        ])
+        self.assertEqual(estatisticas, {'linhas': 2, 'erros': 0})
+
+    def teste_erros_por_linha(self):
+        """teste linha com erro não interrompe as demais"""
+        self.gravar_parametros([['A', 'B', 'C'], ['1', '0', '0'], ['1', 'x', '0'], ['1', '1', '1']])
+        estatisticas = executar_varredura(self.programa, self.parametros, self.saida, max_processos=1)
+
+        linhas = self.ler_saida()
+        self.assertEqual(linhas[1][3:6], ['', '', ''])
+        self.assertIn("linha 3", linhas[1][6])
+        self.assertIn("Divisão por zero", linhas[1][6])
+        self.assertIn("não numérico", linhas[2][6])
+        self.assertEqual(linhas[3][3:], ['1.0', '2.0', '1.0', ''])
+        self.assertEqual(estatisticas['erros'], 2)
+
+    def teste_processos_preservam_ordem(self):
+        """teste saída com vários processos igual à execução sequencial"""
+        self.gravar_parametros([['A', 'B', 'C']] + [[str(i), str(i + 1), str(-i)] for i in range(1, 200)])
+        executar_varredura(self.programa, self.parametros, self.saida, max_processos=1)
+        sequencial = self.ler_saida()
+
+        estatisticas = executar_varredura(self.programa, self.parametros, self.saida,
+                                          max_processos=2, tamanho_lote=16)
+        self.assertEqual(self.ler_saida(), sequencial)
+        self.assertEqual(estatisticas['linhas'], 199)
+
+    def teste_programa_invalido(self):
+        """teste erro de compilação antes de ler o CSV"""
+        with open(self.programa, 'w', encoding='utf-8') as arquivo:
+            arquivo.write("(1 2 +\n")
+        self.gravar_parametros([['A'], ['1']])
+
+        with self.assertRaises(CompiladorError):
+            executar_varredura(self.programa, self.parametros, self.saida, max_processos=1)
+
+if __name__ == '__main__':
+    unittest.main()
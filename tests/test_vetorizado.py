@@ -0,0 +1,97 @@
+"""
+testes para a avaliação vetorizada com NumPy
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.vetorizado import executar_vetorizado, np
+from src.interpretador import gerar_arvores, executar_arvores
+from src.otimizador import otimizar_programa
+from src.lexer import parse_expressao
+
+def arvores_de(linhas):
+    """gera árvores sintáticas das linhas"""
+    return gerar_arvores([parse_expressao(linha) for linha in linhas])
+
+@unittest.skipIf(np is None, "NumPy não instalado")
+class TestVetorizado(unittest.TestCase):
+    """testes para o modo vetorizado"""
+    
+    def teste_equivalente_ao_escalar(self):
+        """teste cada linha de dados igual à execução escalar"""
+        programa = ["(A B +)", "(A B ^)", "((A 3 %) (B 2 *) -)", "(1 RES)", "(A B >= (A) (B 1 +) IF)"]
+        linhas_a = [1.0, 2.5, -4.0, 7.0]
+        linhas_b = [3.0, 2.0, 2.0, 1.0]
+        
+        resultados, erros, _ = executar_vetorizado(
+            arvores_de(programa), {'A': np.array(linhas_a), 'B': np.array(linhas_b)})
+        
+        for i, (a, b) in enumerate(zip(linhas_a, linhas_b)):
+            esperado, _, _ = executar_arvores(arvores_de(programa), memoria={'A': a, 'B': b})
+            with self.subTest(linha=i):
+                self.assertEqual([float(r[i]) for r in resultados], esperado)
+                self.assertFalse(any(e[i] for e in erros))
+    
+    def teste_divisao_por_zero_gera_mascara(self):
+        """teste divisão por zero marca apenas as linhas afetadas"""
+        resultados, erros, _ = executar_vetorizado(
+            arvores_de(["(A B /)", "(A B %)"]), {'A': np.array([4.0, 5.0]), 'B': np.array([2.0, 0.0])})
+        
+        self.assertEqual(erros[0].tolist(), [False, True])
+        self.assertEqual(erros[1].tolist(), [False, True])
+        self.assertEqual(resultados[0][0], 2.0)
+        self.assertTrue(np.isnan(resultados[0][1]))
+    
+    def teste_linha_com_erro_desativada_nas_seguintes(self):
+        """teste linha de dados que falhou não escreve nem produz resultado depois"""
+        programa = ["(A B /)", "(7 X)", "((1 RES) 1 +)"]
+        resultados, erros, memoria = executar_vetorizado(
+            arvores_de(programa), {'A': np.array([4.0, 5.0]), 'B': np.array([2.0, 0.0])})
+        
+        self.assertEqual([e.tolist() for e in erros], [[False, True]] * 3)
+        self.assertEqual(memoria['X'].tolist(), [7.0, 0.0])
+        self.assertEqual(resultados[2][0], 8.0)
+        self.assertTrue(np.isnan(resultados[1][1]))
+    
+    def teste_arredondamento_igual_ao_escalar(self):
+        """teste empates decimais e valores enormes arredondados como round()"""
+        valores = [2.675, -2.675, 1.005, 0.125, 0.285, 1e300, 123456789.125, 3.14159]
+        resultados, _, _ = executar_vetorizado(arvores_de(["(A)"]), {'A': np.array(valores)})
+        
+        self.assertEqual(resultados[0].tolist(), [round(valor, 2) for valor in valores])
+    
+    def teste_potencia_invalida_gera_mascara(self):
+        """teste base negativa com expoente fracionário marca erro"""
+        _, erros, _ = executar_vetorizado(
+            arvores_de(["(A 0.5 ^)"]), {'A': np.array([4.0, -4.0])})
+        
+        self.assertEqual(erros[0].tolist(), [False, True])
+    
+    def teste_if_nao_acusa_erro_do_ramo_nao_escolhido(self):
+        """teste IF como np.where sem erros do ramo descartado"""
+        resultados, erros, _ = executar_vetorizado(
+            arvores_de(["(B 0 == (0 0 +) (A B /) IF)"]), {'A': np.array([4.0, 5.0]), 'B': np.array([2.0, 0.0])})
+        
+        self.assertEqual(resultados[0].tolist(), [2.0, 0.0])
+        self.assertFalse(erros[0].any())
+    
+    def teste_laco_por_linha(self):
+        """teste WHILE com número de iterações diferente por linha"""
+        _, _, memoria = executar_vetorizado(
+            arvores_de(["(I N < ((I 1 +) I) WHILE)"]), {'N': np.array([0.0, 3.0, 10.0])})
+        
+        self.assertEqual(memoria['I'].tolist(), [0.0, 3.0, 10.0])
+
+    def teste_arvore_otimizada(self):
+        """teste árvore com subexpressões comuns"""
+        arvores, _ = otimizar_programa(arvores_de(["((A 2 *) ((A 2 *) 1 +) *)"]))
+        resultados, _, _ = executar_vetorizado(arvores, {'A': np.array([1.0, 2.0])})
+        
+        self.assertEqual(resultados[0].tolist(), [6.0, 20.0])
+
+if __name__ == '__main__':
+    unittest.main()